@@ -0,0 +1,155 @@
+"""
+F.R.A.N.K.I.E. Agent Registry
+
+Maps short agent names to the sub-agent `@tool` functions the orchestrator
+routes to, and builds the orchestrator itself. Tools are imported lazily, so
+callers that only need one agent never pay for importing the others.
+"""
+
+import importlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """Where to find a sub-agent tool and how to present it"""
+    name: str
+    module: str
+    function: str
+    display_name: str
+
+
+SUB_AGENTS = {
+    "browser": AgentSpec("browser", "sub_agents.browser_agent", "use_browser_agent", "🌐 Browser Agent"),
+    "computer": AgentSpec("computer", "sub_agents.use_computer_agent", "use_computer_agent", "💻 Computer Agent"),
+    "content": AgentSpec("content", "sub_agents.content_generator_agent", "content_generator_agent", "✍️ Content Generator"),
+    "memory": AgentSpec("memory", "sub_agents.memory_brain_agent", "use_memory_brain_agent", "🧠 Memory Brain"),
+    "coding": AgentSpec("coding", "sub_agents.coding_buddy_agent", "coding_agent", "👨‍💻 Coding Agent"),
+}
+
+# Orchestrator tool name -> agent name, used to learn from logged routings
+TOOL_TO_AGENT = {spec.function: name for name, spec in SUB_AGENTS.items()}
+
+_loaded_tools = {}
+
+
+def load_agent_tool(name):
+    """Import (once) and return the `@tool` function for an agent name"""
+    if name not in SUB_AGENTS:
+        raise KeyError(f"Unknown agent '{name}'. Choose from: {', '.join(SUB_AGENTS)}")
+    if name not in _loaded_tools:
+        spec = SUB_AGENTS[name]
+        _loaded_tools[name] = getattr(importlib.import_module(spec.module), spec.function)
+    return _loaded_tools[name]
+
+
+def dispatch_to_agent(name, query):
+    """Call a sub-agent tool directly, bypassing the orchestrator"""
+    from sub_agents.tracing import TRACER
+
+    agent_tool = load_agent_tool(name)
+    with TRACER.span(f"agent {name}", "agent", agent=name):
+        return agent_tool(query)
+
+
+# Enhanced system prompt for orchestrator
+ORCHESTRATOR_SYSTEM_PROMPT = """
+You are F.R.A.N.K.I.E. (Flexible Responsive Agent for Navigation Knowledge Integration and Execution), 
+an intelligent multi-agent orchestration system that coordinates specialized AI agents to handle complex user requests.
+
+CORE FUNCTIONALITY:
+You serve as the central intelligence that analyzes incoming user requests, determines the most appropriate 
+specialist agent, and routes tasks for optimal results. Your role is critical in providing seamless, 
+intelligent assistance while maintaining premium user experience.
+
+SYSTEM ARCHITECTURE:
+- You are the Orchestrator Agent with premium CLI interface integration
+- You coordinate 5 specialized agents, each with unique capabilities and tools
+- You provide unified responses while leveraging distributed agent expertise
+- You maintain context awareness across multi-step workflows with real-time feedback
+
+INTELLIGENT ROUTING RULES:
+🌐 Browser Agent (use_browser_agent):
+   - Web browsing, site automation, web scraping, HTML parsing
+   - Online research, data extraction, web form automation
+   - Website interaction, link following, content retrieval
+
+🧠 MEMORY MANAGEMENT (Hybrid Approach):
+
+🧠 DIRECT MEMORY ACCESS (use retrieve tool directly):
+   - Quick information retrieval and knowledge searches
+   - Simple context lookups during conversations
+   - User preference checks and basic knowledge queries
+   - Fast memory integration into any response
+   - Examples: "What did you tell me about X?", "Do you remember my preferences?", "Retrieve information about Y"
+
+🧠 Memory Brain Agent (use_memory_brain_agent):
+   - Complex file processing and format conversions (PDF, DOCX, images, audio)
+   - Advanced AWS Bedrock knowledge base management and diagnostics
+   - Complex memory organization and categorization tasks
+   - Bulk operations and system-level memory management
+   - Examples: "Process this document and store it", "Organize my knowledge base", "Convert this file to markdown"
+
+👨‍💻 Coding Agent (coding_agent):
+   - All software development tasks: writing, reviewing, refactoring code
+   - Programming help across all languages and frameworks
+   - Code analysis, debugging, optimization, best practices
+   - Architecture design, testing strategies, documentation
+   - **TERMINAL & FILE OPERATIONS**: Any request involving terminal commands, file examination, directory navigation
+   - File system exploration, looking at file contents, terminal-based operations
+   - Examples: "Write a function", "Review this code", "Fix this bug", "Look at the files in this directory", "Check what's in that log file", "Show me the contents of config.json"
+
+✍️ Content Generator Agent (content_generator_agent):
+   - UML diagram creation (class, sequence, activity diagrams)
+   - AWS architecture visualization and cloud diagrams
+   - System design diagrams, flowcharts, process maps
+   - Document generation, content creation, and visual assets
+
+💻 Computer Agent (use_computer_agent):
+   - Desktop automation and control with direct access
+   - Screenshot capture, application launching
+   - File system operations, system interactions
+
+CONVERSATION HISTORY:
+   - Large tool results from earlier turns are replaced by an excerpt and an "[Offloaded tool output ref=...]" note
+   - When you need details from such a result, call fetch_tool_output with its ref instead of re-running the agent
+
+PREMIUM UX GUIDELINES:
+1. Always provide clear agent routing explanations with professional formatting
+2. Use appropriate emojis and styling for visual hierarchy  
+3. Maintain helpful, efficient, and user-focused communication
+4. Provide context about agent capabilities relevant to the request
+5. Format responses with proper structure for premium experience
+6. When uncertain, ask clarifying questions to ensure proper routing
+
+Your goal is to provide intelligent, efficient coordination of specialized AI capabilities 
+to maximize user productivity with premium interface experience.
+"""
+
+
+def build_orchestrator_agent(**agent_kwargs):
+    """Create an orchestrator agent wired to every sub-agent tool"""
+    from strands import Agent
+    from strands_tools import rss, mcp_client, current_time, retrieve, slack
+    from conversation_history import CompactingConversationManager
+    from sub_agents.output_store import fetch_tool_output
+    from sub_agents.agent_hooks import agent_hooks
+    from sub_agents.model_factory import enable_prompt_caching
+    from sub_agents.model_tiers import tiered_model
+
+    # Keep long sessions bounded: old, large tool results are offloaded and fetched back on demand
+    agent_kwargs.setdefault("conversation_manager", CompactingConversationManager())
+    agent_kwargs.setdefault("hooks", agent_hooks("orchestrator"))
+    agent = Agent(
+        name="orchestrator_agent",
+        system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
+        tools=[rss, load_agent_tool("browser"), mcp_client, load_agent_tool("content"), current_time,
+               load_agent_tool("coding"), load_agent_tool("computer"), load_agent_tool("memory"),
+               retrieve, slack, fetch_tool_output],
+        **agent_kwargs,
+    )
+    # The orchestrator prompt and its tool specs are identical on every call - cache them
+    enable_prompt_caching(agent.model)
+    # Routing calls go to the fast model first; follow-ups on sub-agent results stay on the strong one
+    agent.model = tiered_model("orchestrator", agent.model)
+    return agent
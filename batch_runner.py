@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+📦 Batch Runner - Concurrent Query Processing for F.R.A.N.K.I.E.
+================================================================
+
+Pushes a file (or stdin) of JSONL queries through a pool of orchestrator
+instances in a single process, instead of paying interpreter startup and
+agent construction once per query.
+
+INPUT (one per line):
+    {"id": "q1", "query": "Summarize today's AWS news"}
+    {"id": "q2", "query": "Review utils.py", "agent": "coding"}
+    Plain text lines are accepted too (the line number becomes the id).
+
+OUTPUT (one JSON object per query, in completion order):
+    {"id": "q1", "status": "ok", "response": "...", "latency_s": 12.3,
+     "usage": {"input_tokens": ..., "output_tokens": ...}, ...}
+
+A query that starts background images (generate_image_async) waits for them,
+up to --image-timeout seconds, and lists them in its result:
+    "images": [{"job_id": "1a2b3c4d", "status": "done", "path": "output/...", "error": null}]
+
+The output file doubles as the checkpoint: with --resume, ids that already
+have an "ok" result are skipped.
+
+USAGE:
+    python frankie.py --batch queries.jsonl --output results.jsonl --concurrency 4 --rate-limit 0.5
+    cat queries.jsonl | python frankie.py --batch - > results.jsonl
+"""
+
+import contextlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+from agent_registry import SUB_AGENTS, build_orchestrator_agent, dispatch_to_agent
+from sub_agents.agent_result import full_text
+from sub_agents.image_jobs import get_image_queue, track_jobs
+from sub_agents.tracing import TRACER
+from sub_agents.usage_metrics import usage_from_result
+
+
+@dataclass
+class BatchItem:
+    """One query read from the batch input"""
+    id: str
+    query: str
+    agent: Optional[str] = None
+
+
+class RateLimiter:
+    """Token bucket limiting how fast queries are started across all workers"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def read_batch(lines: Iterable[str], default_agent: Optional[str] = None) -> List[BatchItem]:
+    """Parse JSONL (or plain text) batch input"""
+    items = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = line
+        if isinstance(record, str):
+            items.append(BatchItem(str(line_number), record, default_agent))
+            continue
+        if not isinstance(record, dict) or not record.get("query"):
+            raise ValueError(f"Line {line_number}: expected a JSON object with a 'query' field")
+        agent = record.get("agent", default_agent)
+        if agent and agent not in SUB_AGENTS:
+            raise ValueError(f"Line {line_number}: unknown agent '{agent}'")
+        items.append(BatchItem(str(record.get("id", line_number)), record["query"], agent))
+    return items
+
+
+def completed_ids(output_path: str) -> Set[str]:
+    """Ids with a successful result in an existing output file (the checkpoint)"""
+    done = set()
+    try:
+        with open(output_path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A partially written last line from an interrupted run
+                if record.get("status") == "ok":
+                    done.add(str(record.get("id")))
+    except FileNotFoundError:
+        pass
+    return done
+
+
+class BatchRunner:
+    """Runs batch items on a bounded pool of worker-local orchestrators"""
+
+    def __init__(self, concurrency: int = 4, rate_limit: float = 0.0, progress=sys.stderr,
+                 image_timeout: float = 300):
+        self.concurrency = max(1, concurrency)
+        self.limiter = RateLimiter(rate_limit, burst=self.concurrency)
+        self.image_timeout = image_timeout
+        self.progress = progress
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _orchestrator(self):
+        # Agents are not safe to share between threads, so each worker owns one
+        if getattr(self._local, "agent", None) is None:
+            self._local.agent = build_orchestrator_agent(callback_handler=None)
+        return self._local.agent
+
+    def run_item(self, item: BatchItem) -> dict:
+        self.limiter.acquire()
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        record = {"id": item.id, "query": item.query, "agent": item.agent or "orchestrator",
+                  "started_at": started_at}
+        with track_jobs() as images:
+            try:
+                with TRACER.span("batch item", "request", item_id=item.id, agent=item.agent or "orchestrator"):
+                    if item.agent:
+                        result = dispatch_to_agent(item.agent, item.query)
+                    else:
+                        agent = self._orchestrator()
+                        # Every batch query is independent - start from an empty conversation
+                        agent.messages.clear()
+                        result = agent(item.query)
+                record.update(status="ok", response=full_text(result), usage=usage_from_result(result))
+            except Exception as e:
+                record.update(status="error", error=f"{type(e).__name__}: {e}", usage={})
+        record["latency_s"] = round(time.perf_counter() - start, 3)
+        if images:
+            record["images"] = self._wait_for_images(images)
+        return record
+
+    def _wait_for_images(self, jobs) -> List[dict]:
+        """Wait (up to image_timeout in total) for the item's image jobs and report each one"""
+        queue = get_image_queue()
+        deadline = time.time() + self.image_timeout
+        for job in jobs:
+            queue.wait(job.job_id, max(0.0, deadline - time.time()))
+        return [job.to_dict() for job in jobs]
+
+    def run(self, items: List[BatchItem], output, skip: Optional[Set[str]] = None) -> dict:
+        """Process items concurrently, writing each result as soon as it completes"""
+        skip = skip or set()
+        pending = [item for item in items if item.id not in skip]
+        summary = {"total": len(items), "skipped": len(items) - len(pending), "ok": 0, "error": 0,
+                   "input_tokens": 0, "output_tokens": 0, "latencies": []}
+        self._log(f"📦 Batch: {len(pending)} queued, {summary['skipped']} already done, "
+                  f"concurrency {self.concurrency}")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch") as executor:
+            futures = [executor.submit(self.run_item, item) for item in pending]
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                record = future.result()
+                with self._write_lock:
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    output.flush()
+                summary[record["status"]] += 1
+                summary["input_tokens"] += record["usage"].get("input_tokens", 0)
+                summary["output_tokens"] += record["usage"].get("output_tokens", 0)
+                summary["latencies"].append(record["latency_s"])
+                self._log(f"  [{done_count}/{len(pending)}] {record['id']}: {record['status']} "
+                          f"({record['latency_s']:.1f}s)")
+
+        summary["wall_time_s"] = round(time.perf_counter() - start, 3)
+        latencies = sorted(summary.pop("latencies"))
+        summary["p50_latency_s"] = latencies[len(latencies) // 2] if latencies else 0.0
+        summary["p95_latency_s"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+        self._log(f"✅ Batch complete: {summary['ok']} ok, {summary['error']} failed, "
+                  f"{summary['wall_time_s']:.1f}s wall time")
+        return summary
+
+    def _log(self, message: str) -> None:
+        if self.progress:
+            print(message, file=self.progress, flush=True)
+
+
+def run_batch(source: str, output_path: str = "-", concurrency: int = 4, rate_limit: float = 0.0,
+              resume: bool = False, default_agent: Optional[str] = None, image_timeout: float = 300) -> dict:
+    """Entry point used by `frankie.py --batch`"""
+    if resume and output_path == "-":
+        raise ValueError("--resume needs --output FILE to read the checkpoint from")
+
+    if source == "-":
+        items = read_batch(sys.stdin, default_agent)
+    else:
+        with open(source, "r") as f:
+            items = read_batch(f, default_agent)
+
+    skip = completed_ids(output_path) if resume else set()
+    runner = BatchRunner(concurrency=concurrency, rate_limit=rate_limit, image_timeout=image_timeout)
+    results = sys.stdout
+    # Sub-agents stream model text and progress to stdout; keep it off the results
+    with contextlib.redirect_stdout(sys.stderr):
+        if output_path == "-":
+            return runner.run(items, results, skip)
+        with open(output_path, "a" if resume else "w") as output:
+            return runner.run(items, output, skip)
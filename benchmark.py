@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark - Offline Performance Suite for F.R.A.N.K.I.E.
+===========================================================
+
+Drives FRANKIE end to end against recorded model responses (see
+sub_agents/model_replay.py), so its own overhead can be measured without
+Bedrock and compared between commits.
+
+SCENARIOS:
+- main          `frankie.main()` with a one-shot query through the orchestrator
+- headless      the same query through `frankie.py --json` (headless.py)
+- research      the research mode workflow (browser, then computer agent)
+- agent:<name>  each sub-agent tool called directly
+
+Each run reports wall time, simulated model and tool time, and the
+remainder: the overhead attributable to FRANKIE itself (imports, agent
+construction, hooks, tracing, history management, result handling). The
+import cost of the interactive and the headless entry points is measured
+separately, each in fresh interpreters, since a module is only imported once
+per process. Each import includes the sub-agent tools a default orchestrator
+query loads, and the report says whether Rich ended up loaded: headless mode
+leaves out FRANKIE's own UI, but some third-party tools import Rich themselves.
+Concurrent model calls can make the simulated time exceed the wall time;
+overhead is clamped at zero in that case.
+
+USAGE:
+    python benchmark.py --record                  # capture fixtures from live Bedrock (once)
+    python benchmark.py --runs 5                  # replay with recorded latency
+    python benchmark.py --latency zero            # pure FRANKIE overhead
+    python benchmark.py --latency lognormal:2.5:0.4 --seed 7
+    python benchmark.py --baseline ~/.frankie/benchmarks/bench-20250101-120000.json --max-regression 0.2
+
+Results are written to ~/.frankie/benchmarks/bench-<timestamp>.json. With
+--baseline, the exit status is 1 when any scenario's p50 overhead regressed
+by more than --max-regression.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+SCENARIO_QUERIES = {
+    "main": "What are the latest AWS announcements in my news feeds?",
+    "browser": "Go to example.com and tell me the page title",
+    "computer": "take a screenshot",
+    "content": "Create a sequence diagram for a user logging in to a web application",
+    "memory": "Remember that I prefer concise answers with code examples",
+    "coding": "Write a Python function that checks whether a string is a palindrome",
+}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    from sub_agents.usage_metrics import percentile
+    return percentile(values, pct)
+
+
+def measure_imports(runs: int = 3) -> Dict[str, Dict]:
+    """Per entry point (interactive UI vs headless): p50 seconds for a fresh interpreter to import it
+    and the orchestrator's sub-agent tools, and whether that loaded Rich"""
+    import subprocess
+
+    results = {}
+    for name, module in (("interactive", "frankie_cli"), ("headless", "headless")):
+        code = (f"import sys, {module}\n"
+                "from agent_registry import SUB_AGENTS, load_agent_tool\n"
+                "for agent in SUB_AGENTS: load_agent_tool(agent)\n"
+                "print('rich' in sys.modules)")
+        samples, rich = [], False
+        for _ in range(runs):
+            start = time.perf_counter()
+            done = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                  text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            samples.append(time.perf_counter() - start)
+            rich = done.stdout.strip().endswith("True")
+        results[name] = {"seconds": _percentile(samples, 50), "rich": rich}
+    return results
+
+
+def build_scenarios(names: Optional[List[str]] = None) -> Dict[str, Callable[[], object]]:
+    """Scenario name -> callable running it once"""
+    import frankie_cli as frankie
+    from agent_registry import SUB_AGENTS, dispatch_to_agent
+
+    def run_main():
+        argv = sys.argv
+        sys.argv = ["frankie.py", "--no-feed-refresh", "--no-local-router", SCENARIO_QUERIES["main"]]
+        try:
+            frankie.main()
+        except SystemExit:
+            pass
+        finally:
+            sys.argv = argv
+
+    def run_headless():
+        import headless
+        headless.main(["--json", "--no-local-router", SCENARIO_QUERIES["main"]])
+
+    scenarios = {"main": run_main, "headless": run_headless, "research": frankie.handle_research_mode_workflow}
+    for name in SUB_AGENTS:
+        scenarios[f"agent:{name}"] = lambda name=name: dispatch_to_agent(name, SCENARIO_QUERIES[name])
+    if names:
+        unknown = [name for name in names if name not in scenarios]
+        if unknown:
+            raise ValueError(f"Unknown scenario(s) {', '.join(unknown)}. Choose from: {', '.join(scenarios)}")
+        scenarios = {name: scenarios[name] for name in names}
+    return scenarios
+
+
+def reset_state() -> None:
+    """Start every run from a fresh local session and the first recording of each call"""
+    import frankie_cli as frankie
+    from sub_agents.model_replay import FIXTURES
+    from sub_agents.session_context import DEFAULT_SESSION_ID
+
+    frankie.session_manager.close(DEFAULT_SESSION_ID)
+    FIXTURES.rewind()
+
+
+def run_scenario(name: str, scenario: Callable[[], object], runs: int, quiet: bool = True) -> Dict:
+    from sub_agents.model_replay import REPLAY_CLOCK
+
+    samples = []
+    for _ in range(runs):
+        reset_state()
+        REPLAY_CLOCK.reset()
+        error = None
+        output = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+                scenario()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        wall = time.perf_counter() - start
+        clock = REPLAY_CLOCK.snapshot()
+        samples.append({
+            "wall_s": wall,
+            "model_s": clock["model_s"],
+            "tool_s": clock["tool_s"],
+            "overhead_s": max(0.0, wall - clock["model_s"] - clock["tool_s"]),
+            "model_calls": clock["model_calls"],
+            "misses": clock["misses"],
+            "error": error,
+        })
+
+    walls = [s["wall_s"] for s in samples]
+    overheads = [s["overhead_s"] for s in samples]
+    return {
+        "scenario": name,
+        "runs": runs,
+        "p50_wall_s": _percentile(walls, 50),
+        "p95_wall_s": _percentile(walls, 95),
+        "p50_model_s": _percentile([s["model_s"] for s in samples], 50),
+        "p50_tool_s": _percentile([s["tool_s"] for s in samples], 50),
+        "p50_overhead_s": _percentile(overheads, 50),
+        "p95_overhead_s": _percentile(overheads, 95),
+        "model_calls": samples[-1]["model_calls"],
+        "misses": sum(s["misses"] for s in samples),
+        "errors": sorted({s["error"] for s in samples if s["error"]}),
+    }
+
+
+def print_report(results: List[Dict], startup_s: float, baseline: Optional[Dict] = None,
+                 import_s: Optional[Dict[str, Dict]] = None) -> None:
+    print(f"\n⏱️  F.R.A.N.K.I.E. benchmark - import/startup {startup_s:.2f}s")
+    if import_s:
+        print("   fresh-process import: " + ", ".join(
+            f"{name} {entry['seconds']:.2f}s ({'loads' if entry['rich'] else 'no'} Rich)"
+            for name, entry in import_s.items()))
+    print()
+    header = f"{'Scenario':<18}{'Runs':>5}{'Wall p50':>10}{'p95':>8}{'Model':>8}{'Tools':>8}{'Overhead':>10}{'p95':>8}{'Calls':>7}"
+    if baseline:
+        header += f"{'vs base':>9}"
+    print(header)
+    print("─" * len(header))
+    base = {row["scenario"]: row for row in (baseline or {}).get("results", [])}
+    for row in results:
+        line = (f"{row['scenario']:<18}{row['runs']:>5}{row['p50_wall_s']:>9.2f}s{row['p95_wall_s']:>7.2f}s"
+                f"{row['p50_model_s']:>7.2f}s{row['p50_tool_s']:>7.2f}s{row['p50_overhead_s']:>9.2f}s"
+                f"{row['p95_overhead_s']:>7.2f}s{row['model_calls']:>7}")
+        if baseline:
+            previous = base.get(row["scenario"])
+            line += f"{_change(previous, row):>9}" if previous else f"{'new':>9}"
+        print(line)
+        if row["misses"]:
+            print(f"  ⚠️  {row['misses']} call(s) had no recording - re-record with --record")
+        for error in row["errors"]:
+            print(f"  ❌ {error}")
+    print()
+
+
+def _change(previous: Dict, current: Dict) -> str:
+    if not previous["p50_overhead_s"]:
+        return "-"
+    return f"{current['p50_overhead_s'] / previous['p50_overhead_s'] - 1:+.0%}"
+
+
+def regressions(results: List[Dict], baseline: Dict, max_regression: float) -> List[str]:
+    base = {row["scenario"]: row for row in baseline.get("results", [])}
+    regressed = []
+    for row in results:
+        previous = base.get(row["scenario"])
+        if previous and previous["p50_overhead_s"] and \
+                row["p50_overhead_s"] > previous["p50_overhead_s"] * (1 + max_regression):
+            regressed.append(f"{row['scenario']}: {previous['p50_overhead_s']:.2f}s → {row['p50_overhead_s']:.2f}s")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline F.R.A.N.K.I.E. benchmark suite")
+    parser.add_argument("scenarios", nargs="*", help="Scenarios to run (default: all)")
+    parser.add_argument("--record", action="store_true", help="Run once against live Bedrock and record fixtures")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--latency", default=None,
+                        help="Replayed model latency: recorded, zero, fixed:<s> or lognormal:<median>:<sigma>")
+    parser.add_argument("--seed", help="Seed for sampled latencies")
+    parser.add_argument("--fixtures", help="Fixture directory (default ~/.frankie/replay)")
+    parser.add_argument("--baseline", help="Earlier benchmark JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed p50 overhead increase over the baseline (fraction)")
+    parser.add_argument("--verbose", action="store_true", help="Show FRANKIE's own output while running")
+    args = parser.parse_args()
+
+    # The model mode is read when FRANKIE's modules are imported, so set it first
+    os.environ["FRANKIE_MODEL_MODE"] = "record" if args.record else "replay"
+    if args.latency:
+        os.environ["FRANKIE_REPLAY_LATENCY"] = args.latency
+    if args.seed:
+        os.environ["FRANKIE_REPLAY_SEED"] = args.seed
+    if args.fixtures:
+        os.environ["FRANKIE_REPLAY_DIR"] = args.fixtures
+
+    import_s = measure_imports() if not args.record else None
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scenarios = build_scenarios(args.scenarios)
+    startup_s = time.perf_counter() - start
+
+    runs = 1 if args.record else args.runs
+    results = []
+    for name, scenario in scenarios.items():
+        print(f"▶ {name} ({'recording' if args.record else f'{runs} run(s)'})", file=sys.stderr, flush=True)
+        results.append(run_scenario(name, scenario, runs, quiet=not args.verbose))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, startup_s, baseline, import_s)
+
+    if args.record:
+        print(f"📼 Fixtures recorded to {os.environ.get('FRANKIE_REPLAY_DIR') or '~/.frankie/replay'}")
+        return
+
+    from sub_agents.frankie_home import frankie_path
+    report_path = frankie_path("benchmarks", f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"created": datetime.now().isoformat(), "latency": os.environ.get("FRANKIE_REPLAY_LATENCY", "recorded"),
+                   "startup_s": startup_s, "import_s": import_s, "results": results}, f, indent=2)
+    print(f"💾 Results saved to {report_path}")
+
+    if baseline:
+        regressed = regressions(results, baseline, args.max_regression)
+        if regressed:
+            print("❌ Overhead regressions:\n  " + "\n  ".join(regressed))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
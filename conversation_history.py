@@ -0,0 +1,158 @@
+"""
+F.R.A.N.K.I.E. Conversation History Compaction
+
+Long interactive sessions used to resend every turn to the model, including
+full browser research dumps and computer-agent transcripts, so input tokens
+and latency grew without bound. `CompactingConversationManager` keeps a
+sliding window of recent messages and, once a turn is no longer recent,
+replaces large tool results with a head/tail excerpt plus a reference into
+the tool output store. The orchestrator can pull the full text back with the
+`fetch_tool_output` tool.
+
+It also records token usage per turn so growth is visible over time
+(the `history` command in the CLI).
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands.hooks import AfterInvocationEvent
+
+from sub_agents.output_store import OUTPUT_STORE, OutputStore
+from sub_agents.session_context import current_session_id
+from sub_agents.usage_metrics import usage_from_result
+
+HISTORY_WINDOW = int(os.getenv("FRANKIE_HISTORY_WINDOW", "40"))
+OFFLOAD_THRESHOLD = int(os.getenv("FRANKIE_HISTORY_OFFLOAD_CHARS", "4000"))
+KEEP_RECENT_TURNS = int(os.getenv("FRANKIE_HISTORY_KEEP_TURNS", "1"))
+EXCERPT_CHARS = 600
+
+OFFLOAD_MARKER = "[Offloaded tool output"
+
+
+@dataclass
+class TurnMetrics:
+    """Token usage and history size after one orchestrator turn"""
+    turn: int
+    session_id: str
+    timestamp: float
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_write_tokens: int
+    history_messages: int
+    history_tokens_estimate: int
+    offloaded_chars: int
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough token estimate for a message list (about four characters per token)"""
+    return len(json.dumps(messages, ensure_ascii=False, default=str)) // 4
+
+
+def _tool_result_text(tool_result: Dict[str, Any]) -> str:
+    parts = []
+    for block in tool_result.get("content", []):
+        if "text" in block:
+            parts.append(block["text"])
+        elif "json" in block:
+            parts.append(json.dumps(block["json"], ensure_ascii=False, default=str))
+    return "\n".join(parts)
+
+
+def _is_turn_start(message: Dict[str, Any]) -> bool:
+    """A user message carrying text (not just tool results) starts a new turn"""
+    return message.get("role") == "user" and any("text" in block for block in message.get("content", []))
+
+
+class CompactingConversationManager(SlidingWindowConversationManager):
+    """Sliding window that also offloads large tool results from older turns"""
+
+    def __init__(self, window_size: int = HISTORY_WINDOW, offload_threshold: int = OFFLOAD_THRESHOLD,
+                 keep_recent_turns: int = KEEP_RECENT_TURNS, store: Optional[OutputStore] = None, **kwargs):
+        super().__init__(window_size=window_size, **kwargs)
+        self.offload_threshold = offload_threshold
+        self.keep_recent_turns = keep_recent_turns
+        self.store = store or OUTPUT_STORE
+        self.offloaded_chars = 0
+        self.turn_metrics: List[TurnMetrics] = []
+
+    def register_hooks(self, registry, **kwargs) -> None:
+        super().register_hooks(registry, **kwargs)
+        registry.add_callback(AfterInvocationEvent, self._record_turn)
+
+    def reset(self) -> None:
+        """Forget the previous conversation's counters (the agent is being reused for a new session)"""
+        self.offloaded_chars = 0
+        self.turn_metrics = []
+        self.removed_message_count = 0
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self, messages: List[Dict[str, Any]], keep_recent_turns: Optional[int] = None) -> int:
+        """Offload large tool results outside the most recent turns; returns characters removed"""
+        keep = self.keep_recent_turns if keep_recent_turns is None else keep_recent_turns
+        turn_starts = [index for index, message in enumerate(messages) if _is_turn_start(message)]
+        if keep == 0:
+            boundary = len(messages)
+        elif len(turn_starts) >= keep:
+            boundary = turn_starts[-keep]
+        else:
+            boundary = 0
+
+        removed = 0
+        for message in messages[:boundary]:
+            for block in message.get("content", []):
+                tool_result = block.get("toolResult")
+                if not tool_result:
+                    continue
+                text = _tool_result_text(tool_result)
+                if len(text) <= self.offload_threshold or text.startswith(OFFLOAD_MARKER):
+                    continue
+                ref = self.store.put(text)
+                excerpt = text[:EXCERPT_CHARS].rstrip()
+                tail = text[-EXCERPT_CHARS // 2:].lstrip()
+                tool_result["content"] = [{"text": (
+                    f"{OFFLOAD_MARKER} ref={ref}, {len(text)} chars - call fetch_tool_output(ref='{ref}') "
+                    f"for the full text]\n{excerpt}\n...\n{tail}"
+                )}]
+                removed += len(text) - len(tool_result["content"][0]["text"])
+
+        self.offloaded_chars += removed
+        return removed
+
+    def apply_management(self, agent, **kwargs) -> None:
+        self.compact(agent.messages)
+        super().apply_management(agent, **kwargs)
+
+    def reduce_context(self, agent, e: Optional[Exception] = None, **kwargs) -> None:
+        # Context overflow: offload everything large, even in the current turn, before dropping messages
+        if e is not None and self.compact(agent.messages, keep_recent_turns=0) > 0:
+            return
+        super().reduce_context(agent, e=e, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _record_turn(self, event: AfterInvocationEvent) -> None:
+        usage = usage_from_result(event.result) if event.result is not None else {}
+        messages = event.agent.messages
+        self.turn_metrics.append(TurnMetrics(
+            turn=len(self.turn_metrics) + 1,
+            session_id=current_session_id(),
+            timestamp=time.time(),
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cache_read_tokens=usage.get("cache_read_tokens", 0),
+            cache_write_tokens=usage.get("cache_write_tokens", 0),
+            history_messages=len(messages),
+            history_tokens_estimate=estimate_tokens(messages),
+            offloaded_chars=self.offloaded_chars,
+        ))
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+📰 Feed Refresher - Background RSS Warm-Up Daemon
+=================================================
+
+Keeps the feeds subscribed through the `rss` tool fresh, so interactive news
+queries read warm data from STRANDS_RSS_STORAGE_PATH instead of paying the
+whole fetch latency on the first question of the day.
+
+SCHEDULING:
+- Every feed gets its own adaptive interval: feeds that keep publishing are
+  polled more often, quiet feeds drift toward the maximum interval
+- Failed fetches are retried with jittered exponential backoff
+- Network fetches run on a bounded worker pool; writes to the feed store are
+  serialized so concurrent refreshes never clobber subscriptions.json
+
+USAGE:
+- Started automatically from `frankie.py` in interactive mode
+- Or run standalone as a separate process:
+      python feed_refresher.py [--storage PATH] [--workers N] [--once]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Interval bounds in seconds
+MIN_INTERVAL = int(os.getenv("FRANKIE_FEED_MIN_INTERVAL", "300"))
+MAX_INTERVAL = int(os.getenv("FRANKIE_FEED_MAX_INTERVAL", "21600"))
+MAX_BACKOFF = int(os.getenv("FRANKIE_FEED_MAX_BACKOFF", "3600"))
+DEFAULT_WORKERS = int(os.getenv("FRANKIE_FEED_WORKERS", "4"))
+
+# Scheduler bookkeeping lives next to the feeds it describes
+STATE_FILE_NAME = "refresh_state.json"
+
+
+class FeedRefresher:
+    """Adaptive background refresher for subscribed RSS feeds"""
+
+    def __init__(self, storage_path, max_workers=DEFAULT_WORKERS,
+                 min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.storage_path = storage_path
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self._store_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._in_flight = set()  # feed ids being fetched, guarded by _state_lock
+        self._thread = None
+        self._executor = None
+        self._manager = None
+        self._state = self._load_state()
+
+    # ------------------------------------------------------------------
+    # Storage helpers
+    # ------------------------------------------------------------------
+
+    def _get_manager(self):
+        """Create the rss tool's manager lazily, pinned to our storage path"""
+        if self._manager is None:
+            from strands_tools.rss import RSSManager
+
+            self._manager = RSSManager()
+            self._manager.storage_path = self.storage_path
+            os.makedirs(self.storage_path, exist_ok=True)
+        return self._manager
+
+    def _state_file(self):
+        return os.path.join(self.storage_path, STATE_FILE_NAME)
+
+    def _load_state(self):
+        try:
+            with open(self._state_file(), "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self):
+        with self._state_lock:
+            snapshot = json.dumps(self._state, indent=2)
+        os.makedirs(self.storage_path, exist_ok=True)
+        tmp_path = self._state_file() + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self._state_file())
+
+    def _feed_state(self, feed_id, feed_info):
+        """Return (creating if needed) the schedule entry for a feed"""
+        with self._state_lock:
+            entry = self._state.get(feed_id)
+            if entry is None:
+                # Seed from the interval the user picked when subscribing (minutes)
+                requested = int(feed_info.get("update_interval", 60)) * 60
+                entry = {
+                    "interval": max(self.min_interval, min(self.max_interval, requested)),
+                    "next_due": 0.0,
+                    "failures": 0,
+                    "last_success": None,
+                    "last_error": None,
+                }
+                self._state[feed_id] = entry
+            return entry
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _backoff_delay(self, failures):
+        """Full-jitter exponential backoff, capped at MAX_BACKOFF"""
+        ceiling = min(MAX_BACKOFF, self.min_interval * (2 ** (failures - 1)))
+        return random.uniform(self.min_interval / 2, max(self.min_interval / 2, ceiling))
+
+    def _record_success(self, feed_id, new_entries):
+        with self._state_lock:
+            entry = self._state.get(feed_id)
+            if entry is None:
+                return  # Unsubscribed and pruned from the schedule
+            if new_entries > 0:
+                # Publishing actively - tighten the interval
+                entry["interval"] = max(self.min_interval, entry["interval"] / 2)
+            else:
+                # Nothing new - relax toward the ceiling
+                entry["interval"] = min(self.max_interval, entry["interval"] * 1.5)
+            entry["failures"] = 0
+            entry["last_error"] = None
+            entry["last_success"] = datetime.now().isoformat()
+            # Small jitter keeps feeds that share an interval from firing together
+            entry["next_due"] = time.time() + entry["interval"] * random.uniform(0.9, 1.1)
+
+    def _record_failure(self, feed_id, error):
+        with self._state_lock:
+            entry = self._state.get(feed_id)
+            if entry is None:
+                return
+            entry["failures"] += 1
+            entry["last_error"] = str(error)
+            entry["next_due"] = time.time() + self._backoff_delay(entry["failures"])
+
+    def due_feeds(self, now=None):
+        """Return the subscribed feeds whose refresh is due, oldest first"""
+        now = now or time.time()
+        with self._store_lock:
+            subscriptions = self._get_manager().load_subscriptions()
+        with self._state_lock:
+            in_flight = set(self._in_flight)
+            # Unsubscribed feeds would otherwise stay in the schedule (and the state file) forever;
+            # one being fetched keeps its entry until the fetch has finished
+            for feed_id in set(self._state) - set(subscriptions) - in_flight:
+                del self._state[feed_id]
+
+        due = []
+        for feed_id, feed_info in subscriptions.items():
+            if feed_id in in_flight:
+                continue
+            entry = self._feed_state(feed_id, feed_info)
+            if entry["next_due"] <= now:
+                due.append((entry["next_due"], feed_id, feed_info))
+        return [(feed_id, feed_info) for _, feed_id, feed_info in sorted(due, key=lambda item: item[0])]
+
+    def seconds_until_next_due(self):
+        """Time until the next scheduled feed; feeds being fetched get their next slot when they finish"""
+        with self._state_lock:
+            pending = [entry["next_due"] for feed_id, entry in self._state.items() if feed_id not in self._in_flight]
+        if not pending:
+            return self.min_interval
+        return max(1.0, min(pending) - time.time())
+
+    # ------------------------------------------------------------------
+    # Refreshing
+    # ------------------------------------------------------------------
+
+    def refresh_feed(self, feed_id, feed_info):
+        """Fetch one feed and merge new entries into the store"""
+        manager = self._get_manager()
+        try:
+            # The network fetch is the slow part and runs outside the store lock
+            feed = manager.fetch_feed(feed_info["url"], feed_info.get("auth"), feed_info.get("headers"))
+            if not hasattr(feed, "entries"):
+                raise ValueError(f"Could not parse feed from {feed_info['url']}")
+            if getattr(feed, "bozo", False) and not feed.entries:
+                raise ValueError(f"Malformed feed: {getattr(feed, 'bozo_exception', 'unknown error')}")
+
+            with self._store_lock:
+                if feed_id not in manager.load_subscriptions():
+                    # Unsubscribed while we were fetching - don't bring its data file back
+                    logger.info("feed=<%s> | unsubscribed during refresh, dropping result", feed_id)
+                    return None
+                new_entries = self._merge_entries(manager, feed_id, feed_info, feed)
+
+            self._record_success(feed_id, new_entries)
+            logger.info("feed=<%s>, new_entries=<%d> | refreshed", feed_id, new_entries)
+            return new_entries
+        except Exception as e:
+            self._record_failure(feed_id, e)
+            logger.warning("feed=<%s> | refresh failed: %s", feed_id, e)
+            return None
+        finally:
+            with self._state_lock:
+                self._in_flight.discard(feed_id)
+            self._save_state()
+
+    def _merge_entries(self, manager, feed_id, feed_info, feed):
+        """Merge fetched entries the same way the rss tool's update action does"""
+        from strands_tools.rss import DEFAULT_MAX_ENTRIES
+
+        feed_data = manager.load_feed_data(feed_id)
+        existing_ids = {entry.get("id", entry.get("link")) for entry in feed_data.get("entries", [])}
+
+        feed_data.update({
+            "title": getattr(feed.feed, "title", feed_info["url"]),
+            "description": getattr(feed.feed, "description", ""),
+            "link": getattr(feed.feed, "link", feed_info["url"]),
+            "last_updated": datetime.now().isoformat(),
+        })
+
+        new_entries = []
+        for entry in feed.entries:
+            entry_id = entry.get("id", entry.get("link"))
+            if entry_id and entry_id not in existing_ids:
+                entry_data = manager.format_entry(entry, include_content=True)
+                entry_data["id"] = entry_id
+                new_entries.append(entry_data)
+
+        feed_data["entries"] = (new_entries + feed_data.get("entries", []))[:DEFAULT_MAX_ENTRIES]
+        manager.save_feed_data(feed_id, feed_data)
+
+        # Reload so subscriptions added while we were fetching are preserved
+        subscriptions = manager.load_subscriptions()
+        if feed_id in subscriptions:
+            subscriptions[feed_id]["title"] = feed_data["title"]
+            subscriptions[feed_id]["last_updated"] = feed_data["last_updated"]
+            manager.save_subscriptions(subscriptions)
+
+        return len(new_entries)
+
+    def tick(self):
+        """Dispatch every due feed to the worker pool; returns how many were queued"""
+        queued = 0
+        for feed_id, feed_info in self.due_feeds():
+            with self._state_lock:
+                self._in_flight.add(feed_id)
+            self._executor.submit(self.refresh_feed, feed_id, feed_info)
+            queued += 1
+        return queued
+
+    def refresh_all(self):
+        """Refresh every subscribed feed once, blocking until done"""
+        with self._store_lock:
+            subscriptions = self._get_manager().load_subscriptions()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="feed-refresh") as executor:
+            for feed_id, feed_info in subscriptions.items():
+                self._feed_state(feed_id, feed_info)
+                executor.submit(self.refresh_feed, feed_id, feed_info)
+        return len(subscriptions)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def run_forever(self):
+        """Scheduler loop - wakes up when the next feed is due"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="feed-refresh")
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.tick()
+                except Exception as e:
+                    logger.warning("Feed scheduler tick failed: %s", e)
+                # Re-check at least once a minute so new subscriptions are picked up
+                self._wake_event.wait(min(60.0, self.seconds_until_next_due()))
+                self._wake_event.clear()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        """Start the scheduler on a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="feed-refresher", daemon=True)
+        self._thread.start()
+        return self
+
+    def wake(self):
+        """Ask the scheduler to re-scan subscriptions now"""
+        self._wake_event.set()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def start_background_refresher(storage_path, max_workers=DEFAULT_WORKERS):
+    """Start a daemon-thread refresher for FRANKIE's interactive mode"""
+    return FeedRefresher(storage_path, max_workers=max_workers).start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="F.R.A.N.K.I.E. background RSS feed refresher")
+    parser.add_argument("--storage", default=os.getenv("STRANDS_RSS_STORAGE_PATH",
+                                                      os.path.join(os.getcwd(), "rss_feeds", "news")),
+                        help="Feed storage directory (defaults to STRANDS_RSS_STORAGE_PATH)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Maximum concurrent fetches")
+    parser.add_argument("--once", action="store_true", help="Refresh every feed once and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='\033[90m%(asctime)s - %(name)s - %(levelname)s - %(message)s\033[0m',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    refresher = FeedRefresher(args.storage, max_workers=args.workers)
+    if args.once:
+        count = refresher.refresh_all()
+        print(f"📰 Refreshed {count} feed(s) in {args.storage}")
+    else:
+        print(f"📰 Feed refresher running on {args.storage} (Ctrl+C to stop)")
+        try:
+            refresher.run_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Feed refresher stopped")
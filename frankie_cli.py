@@ -0,0 +1,1240 @@
+#!/usr/bin/env python3
+"""
+🤖 F.R.A.N.K.I.E. - Premium Multi-Agent Productivity System
+===========================================================
+Flexible Responsive Agent for Navigation Knowledge Integration and Execution
+
+SYSTEM OVERVIEW:
+F.R.A.N.K.I.E. is an intelligent orchestration system that coordinates multiple
+specialized AI agents to handle complex user requests. Features a premium CLI
+interface with rich visual components, real-time feedback, and professional UX.
+
+PREMIUM FEATURES:
+- Rich typography with panels, tables, and markdown rendering
+- Single live status area with per-tool progress rows
+- Professional welcome system with dynamic status updates
+- Streaming shell commands with ! prefix, background jobs with !&
+- --headless/--json output for scripts, without the UI (see headless.py)
+- Enhanced error reporting with suggestions
+- Real-time agent coordination feedback
+
+Started through frankie.py, which keeps this module (and the UI stack it
+imports) out of every process that merely re-imports the entry script.
+"""
+
+import argparse
+import time
+import sys
+import os
+from datetime import datetime
+from pathlib import Path
+
+# Rich components for premium UI
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.markdown import Markdown
+from rich.align import Align
+from rich.box import ROUNDED
+from rich.theme import Theme
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.text import Text
+from rich.live import Live
+from rich.markup import escape
+from rich.tree import Tree
+
+from colorama import Fore, Style, init
+
+# Strands imports
+from strands_tools import rss
+# Agent imports - sub-agent modules are loaded lazily through the registry
+# from additional_tools_agent import additional_tools_agent
+from agent_registry import SUB_AGENTS, dispatch_to_agent
+from sub_agents.agent_result import full_text
+from sub_agents.tracing import TRACER, export_chrome_trace
+from sub_agents.usage_metrics import UsageStore, get_usage_store
+from sub_agents.model_tiers import tier_summary
+from sub_agents.image_jobs import get_image_queue
+from session_manager import SessionManager
+from shell_runner import get_shell_runner
+from live_renderer import LiveRenderer
+from sub_agents.session_context import DEFAULT_SESSION_ID
+from sub_agents.shortcut_matcher import INTENT_MATCHER
+from feed_refresher import start_background_refresher
+from intent_router import IntentRouter, tool_call_snapshot, tool_call_delta
+
+# Initialize colorama
+init(autoreset=True)
+
+# Premium theme for consistent styling
+FRANKIE_THEME = Theme({
+    "info": "dim cyan",
+    "warning": "yellow",
+    "danger": "bold red",
+    "success": "green",
+    "heading": "bold blue",
+    "subheading": "cyan",
+    "highlight": "magenta",
+    "prompt": "bold green",
+    "agent": "bold yellow",
+    "system": "dim blue",
+})
+
+# Create premium console
+console = Console(theme=FRANKIE_THEME)
+
+# The one thing drawing spinners and per-tool progress rows while a request runs
+renderer = LiveRenderer(console)
+
+# `!` commands stream into a Live panel redrawn at most this often
+SHELL_REFRESH_PER_SECOND = 10
+shell_runner = get_shell_runner()
+
+# Conversation and research mode state live in the local session; the orchestrator is built on
+# first use so direct --agent runs never import the other sub-agents
+session_manager = SessionManager()
+
+def local_session():
+    """The interactive CLI's own session, pinned so it is never evicted"""
+    return session_manager.get(DEFAULT_SESSION_ID, pinned=True)
+
+# Local intent router (created in main unless disabled)
+intent_router = None
+
+def get_system_status():
+    """Generate rich system status for premium banner"""
+    current_time_str = datetime.now().strftime("%H:%M:%S")
+    
+    # Create status table
+    status_table = Table.grid(padding=1)
+    status_table.add_column(justify="center")
+    status_table.add_column(justify="center")
+    status_table.add_column(justify="center")
+    
+    status_table.add_row(
+        "[green]✅ RSS Feeds Ready[/green]",
+        "[blue]🔧 All Tools Available[/blue]", 
+        f"[yellow]⏰ Ready at {current_time_str}[/yellow]"
+    )
+    
+    return status_table
+
+def render_premium_welcome():
+    """Render premium welcome message using Rich components"""
+    
+    # System status
+    status = get_system_status()
+    
+    # Agent capabilities table
+    agents_table = Table(title="🤖 Specialized Agent Capabilities", box=ROUNDED, show_header=True)
+    agents_table.add_column("Agent", style="bold yellow", width=20)
+    agents_table.add_column("Capabilities", style="cyan")
+    
+    agents_table.add_row("🌐 Browser Agent", "Web automation, scraping & interaction")
+    agents_table.add_row("💻 Computer Agent", "Desktop control & automation") 
+    agents_table.add_row("🧠 Memory Brain", "Knowledge storage & retrieval system")
+    agents_table.add_row("👨‍💻 Coding Agent", "Software development, code analysis & terminal/file operations")
+    agents_table.add_row("✍️ Content Generator", "Diagrams, documents & visual content creation")
+    
+    # Features panel
+    features_md = """
+### 🎯 **Smart Features**
+- **Intelligent Routing**: Automatically selects the best agent for your request
+- **Direct Access**: Streamlined desktop automation without barriers  
+- **Persistent Memory**: Remembers your preferences and context across sessions
+- **Real-time Feedback**: Professional progress indicators and status updates
+- **Computer Shortcuts**: Quick access to common automation tasks
+
+### 💡 **Quick Start**
+- Use natural language for any request - F.R.A.N.K.I.E. will route it optimally
+- Type `help` for complete command reference and examples
+- Type `shortcuts` to view computer automation quick actions
+- Use `!` prefix for direct shell commands (e.g., `!ls -la`)
+- Type `exit` to safely shutdown the system
+    """
+    
+    # Create main welcome panel
+    welcome_content = Align.center(
+        Panel(
+            Align.center(agents_table),
+            title="[heading]🤖 F.R.A.N.K.I.E. Multi-Agent System[/heading]",
+            subtitle="[info]Intelligent Agent Orchestration Platform[/info]",
+            border_style="blue",
+            box=ROUNDED,
+            padding=(1, 2)
+        )
+    )
+    
+    # System status panel
+    status_panel = Panel(
+        Align.center(status),
+        title="[success]🚀 System Status[/success]",
+        border_style="green",
+        box=ROUNDED
+    )
+    
+    # Features panel
+    features_panel = Panel(
+        Markdown(features_md),
+        title="[highlight]✨ Features & Quick Start[/highlight]",
+        border_style="magenta", 
+        box=ROUNDED
+    )
+    
+    # Print all components
+    console.print()
+    console.print(welcome_content)
+    console.print()
+    console.print(status_panel)
+    console.print()
+    console.print(features_panel)
+    console.print()
+
+def show_shortcuts_menu():
+    """Display computer agent shortcuts in a premium menu format"""
+    
+    # Computer shortcuts table
+    shortcuts_table = Table(title="💻 Computer Agent Quick Actions", box=ROUNDED, show_header=True)
+    shortcuts_table.add_column("Shortcut Command", style="bold yellow", width=25)
+    shortcuts_table.add_column("Description", style="cyan", width=40)
+    shortcuts_table.add_column("What It Does", style="green")
+    
+    shortcuts_table.add_row(
+        "start my day", 
+        "🌅 Morning productivity setup",
+        "Opens Chrome, Slack, Outlook, VS Code"
+    )
+    shortcuts_table.add_row(
+        "start demo record", 
+        "🎬 Begin screen recording",
+        "Launches Screen Studio and starts recording"
+    )
+    shortcuts_table.add_row(
+        "stop demo record", 
+        "⏹️ End screen recording", 
+        "Stops Screen Studio recording session"
+    )
+    shortcuts_table.add_row(
+        "start focus mode", 
+        "🎯 Enter focus session",
+        "Enables Do Not Disturb + 25min timer"
+    )
+    shortcuts_table.add_row(
+        "play my music", 
+        "🎵 Launch music player",
+        "Opens Music app and starts playing"
+    )
+    shortcuts_table.add_row(
+        "start presentation",
+        "📽️ Launch presentation mode",
+        "Opens PowerPoint and starts presentation"
+    )
+    shortcuts_table.add_row(
+        "research mode",
+        "🔬 Multi-step research with Quip option",
+        "Opens browser, researches topic, optional Quip documentation"
+    )
+    
+    # User-defined shortcuts from the shortcuts config file
+    for shortcut in INTENT_MATCHER.user_shortcuts:
+        shortcuts_table.add_row(
+            shortcut,
+            "⭐ Custom shortcut",
+            INTENT_MATCHER.descriptions.get(shortcut, INTENT_MATCHER.query_for(shortcut))
+        )
+    
+    # Usage instructions
+    usage_md = """
+### 🎯 **How to Use Computer Shortcuts**
+
+**🚀 Automatic Routing:**
+Simply type any of the shortcut commands above, and F.R.A.N.K.I.E. will **automatically detect and route** them to the Computer Agent for instant execution.
+
+**Examples:**
+- `start my day` - Perfect for morning routine
+- `start demo record` - Quick demo recording setup  
+- `start focus mode` - Pomodoro-style focus session
+- `play my music` - Launch music app instantly
+
+### ⚡ **Natural Language Support**
+These commands work with natural language variations too:
+- "Can you start my day setup?" ✅ Auto-routed
+- "Please begin demo recording" ✅ Auto-routed  
+- "I want to enter focus mode" ✅ Auto-routed
+- "Open music please" ✅ Auto-routed
+
+### 🎮 **Explicit Agent Routing**
+Want to combine with other agents? Use explicit routing:
+- `send computer start demo record, then use browser to go to wordle`
+- `use computer agent to start focus mode, then route to coding agent`
+
+**Key:** Shortcuts are auto-routed UNLESS you use explicit routing words like:
+- "send computer..."
+- "use computer agent..."
+- "route to computer..."
+    """
+    
+    # Print shortcuts components
+    console.print()
+    console.print(Panel(
+        Align.center("[bold magenta]🚀 F.R.A.N.K.I.E. Computer Shortcuts Menu[/bold magenta]"),
+        border_style="magenta",
+        box=ROUNDED,
+        padding=(1, 2)
+    ))
+    console.print()
+    console.print(shortcuts_table)
+    console.print()
+    console.print(Panel(
+        Markdown(usage_md),
+        title="[highlight]📖 Usage Guide[/highlight]",
+        border_style="blue",
+        box=ROUNDED
+    ))
+    console.print()
+
+def show_premium_help():
+    """Display premium help with Rich formatting"""
+    
+    # Available agents
+    agents_table = Table(title="🤖 Available Agents", box=ROUNDED)
+    agents_table.add_column("Agent", style="bold yellow")
+    agents_table.add_column("Specialization", style="cyan")
+    agents_table.add_column("Example Commands", style="green")
+    
+    agents_table.add_row(
+        "🌐 Browser", 
+        "Web automation", 
+        '"Browse to example.com and extract links"'
+    )
+    agents_table.add_row(
+        "💻 Computer", 
+        "Desktop control", 
+        '"Take a screenshot", "Open calculator"'
+    )
+    agents_table.add_row(
+        "👨‍💻 Coding", 
+        "Development & Files", 
+        '"Review code", "Look at files", "Check log contents"'
+    )
+    agents_table.add_row(
+        "🧠 Memory", 
+        "Knowledge storage", 
+        '"Remember my Python preferences"'
+    )
+    agents_table.add_row(
+        "✍️ Content", 
+        "Diagrams & documents", 
+        '"Create AWS architecture diagram", "Generate documentation"'
+    )
+    
+    # System commands
+    commands_table = Table(title="⌨️ System Commands", box=ROUNDED)
+    commands_table.add_column("Command", style="bold yellow")
+    commands_table.add_column("Description", style="cyan")
+    
+    commands_table.add_row("help", "Show this comprehensive guide")
+    commands_table.add_row("shortcuts", "Show computer shortcuts menu")
+    commands_table.add_row("clear", "Clear screen and show banner")  
+    commands_table.add_row("router", "Show local routing accuracy and latency saved")
+    commands_table.add_row("history", "Show conversation size and tokens per turn")
+    commands_table.add_row("trace", "Show where the time went in the last request")
+    commands_table.add_row("stats [agent|session|day]", "Show latency, tokens and cost per agent, session or day")
+    commands_table.add_row("tiers", "Show fast-model share, escalations and latency per agent")
+    commands_table.add_row("images", "Show background image jobs and the image store")
+    commands_table.add_row("exit", "Safely quit F.R.A.N.K.I.E.")
+    commands_table.add_row("!<command>", "Execute shell command with live output (Ctrl+C stops it)")
+    commands_table.add_row("!&<command>", "Run shell command as a background job")
+    commands_table.add_row("jobs [<id>|kill <id>]", "List background shell jobs, show one's output or stop it")
+    commands_table.add_row("@<agent> <request>", "Send straight to browser, computer, content, memory or coding")
+    commands_table.add_row("Ctrl+C", "Emergency exit with confirmation")
+    
+    # Print help components
+    console.print()
+    console.print(Panel(
+        Align.center("[bold blue]F.R.A.N.K.I.E. Help & Command Reference[/bold blue]"),
+        border_style="blue",
+        box=ROUNDED
+    ))
+    console.print()
+    console.print(agents_table)
+    console.print()
+    console.print(commands_table)
+    console.print()
+    
+    # Tips panel
+    tips_md = """
+### 🚀 **Pro Tips**
+- **Natural Language**: Just describe what you want - F.R.A.N.K.I.E. handles the routing
+- **Shell Integration**: Use `!` prefix for direct shell access (e.g., `!git status`)  
+- **Context Aware**: Memory agent remembers your preferences across sessions
+- **Multi-step Tasks**: Describe complex workflows - agents coordinate automatically
+- **Real-time Feedback**: Watch spinners for progress updates during execution
+- **Computer Shortcuts**: Type shortcuts directly for instant auto-routing to Computer Agent
+- **Explicit Routing**: Use "send computer..." for multi-agent workflows
+
+### 🎯 **Best Practices**  
+- Be specific about desired outcomes for better agent selection
+- Use the memory agent to store important preferences and context
+- Combine agents for complex tasks (e.g., "Research topic X and create a diagram")
+- Use computer shortcuts for common productivity workflows
+- Use explicit routing when combining shortcuts with other agent tasks
+
+### ⚡ **Shortcut Examples**
+- Direct: `start demo record` → Auto-routes to Computer Agent
+- Explicit: `send computer start demo record, then use browser to go to wordle`
+    """
+    
+    console.print(Panel(
+        Markdown(tips_md),
+        title="[highlight]💡 Tips & Best Practices[/highlight]",
+        border_style="magenta",
+        box=ROUNDED
+    ))
+
+def format_premium_response(response, agent_name="F.R.A.N.K.I.E."):
+    """Format agent responses with premium styling"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    
+    # Sub-agent results render their full body; the orchestrator only ever saw the summary
+    response_text = full_text(response)
+    
+    # Create response panel
+    response_panel = Panel(
+        response_text,
+        title=f"[success]🤖 {agent_name} Response[/success] [system]│ {timestamp}[/system]",
+        border_style="green",
+        box=ROUNDED,
+        padding=(1, 2)
+    )
+    
+    console.print()
+    console.print(response_panel)
+    console.print()
+
+def render_shell_job(job, lines=None, footer=None):
+    """Panel with a shell command's output (the latest `lines` lines while it runs)"""
+    output = Text()
+    for stream, line in shell_runner.snapshot(job, lines):
+        output.append(line + "\n", style="red" if stream == "stderr" else None)
+    if job.hidden_lines and not lines:
+        output.append(f"… {job.hidden_lines} earlier lines in {job.log_path}\n", style="dim")
+    output.rstrip()
+    if footer is None:
+        footer = f"running {job.duration_s:.1f}s · {job.line_count} lines · Ctrl+C to cancel"
+        if job.cancel_level:
+            footer = f"cancelling ({job.duration_s:.1f}s) · Ctrl+C again to force"
+    border = "dim blue" if job.status in ("running", "done") else "red"
+    return Panel(output, title=f"[system]$ {escape(job.command)}[/system]", subtitle=f"[system]{footer}[/system]",
+                 border_style=border, box=ROUNDED)
+
+def shell_job_footer(job):
+    """Status line for a finished shell command"""
+    return f"{job.status} · exit {job.returncode} · {job.duration_s:.2f}s · {job.line_count} lines"
+
+def handle_shell_command(command, background=False):
+    """Run a shell command, streaming its output live (or as a background job)"""
+    renderer.stop()
+    job = shell_runner.start(command, background=background)
+    if background:
+        console.print(f"[success]🐚 [{job.job_id}][/success] {escape(command)} [system](pid {job.pid}, 'jobs' to check on it)[/system]")
+        return job
+    
+    visible_lines = max(5, console.height - 8)
+    try:
+        with Live(render_shell_job(job, visible_lines), console=console, refresh_per_second=SHELL_REFRESH_PER_SECOND,
+                  transient=True) as live:
+            while True:
+                try:
+                    if shell_runner.wait(job, 1 / SHELL_REFRESH_PER_SECOND):
+                        break
+                    live.update(render_shell_job(job, visible_lines))
+                except KeyboardInterrupt:
+                    # Only the command is interrupted; it runs in its own process group
+                    shell_runner.cancel(job)
+                    live.update(render_shell_job(job, visible_lines))
+    except Exception:
+        # Don't leave the command running unseen when its panel can't be drawn
+        shell_runner.cancel(job)
+        raise
+    
+    console.print()
+    console.print(render_shell_job(job, footer=shell_job_footer(job)))
+    return job
+
+def show_shell_jobs(args=""):
+    """List background shell jobs, show one job's output, or stop one"""
+    parts = args.split()
+    if parts and parts[0] == "kill" and len(parts) == 2 and parts[1].isdigit():
+        job = shell_runner.get(int(parts[1]))
+        if job is None or job.done:
+            console.print(f"[warning]⚠️ No running shell job {parts[1]}[/warning]")
+        else:
+            shell_runner.cancel(job)
+            console.print(f"[info]🐚 Stopping job [{job.job_id}]: {escape(job.command)}[/info]")
+        return
+    if parts and parts[0].isdigit():
+        job = shell_runner.get(int(parts[0]))
+        if job is None:
+            console.print(f"[warning]⚠️ No shell job {parts[0]}[/warning]")
+            return
+        console.print()
+        console.print(render_shell_job(job, footer=shell_job_footer(job) if job.done else None))
+        return
+    
+    jobs = shell_runner.jobs()
+    if not jobs:
+        console.print("[info]🐚 No background shell jobs (start one with !&<command>)[/info]")
+        return
+    
+    jobs_table = Table(title="🐚 Shell Jobs", box=ROUNDED, show_header=True)
+    jobs_table.add_column("Job", style="bold yellow", justify="right")
+    jobs_table.add_column("Status", style="white")
+    jobs_table.add_column("Exit", style="white", justify="right")
+    jobs_table.add_column("Time", style="cyan", justify="right")
+    jobs_table.add_column("Lines", style="cyan", justify="right")
+    jobs_table.add_column("Command", style="green")
+    
+    for job in jobs:
+        jobs_table.add_row(str(job.job_id), job.status, "-" if job.returncode is None else str(job.returncode),
+                           f"{job.duration_s:.1f}s", str(job.line_count),
+                           escape(job.command if len(job.command) <= 60 else job.command[:57] + "..."))
+    
+    console.print()
+    console.print(jobs_table)
+    console.print("[system]'jobs <id>' shows a job's output, 'jobs kill <id>' stops it[/system]")
+    console.print()
+
+def announce_shell_jobs():
+    """Print a notification for every background shell job that finished since the last prompt"""
+    for job in shell_runner.drain_notifications():
+        style = "success" if job.status == "done" else "danger"
+        console.print(f"[{style}]🐚 {escape(job.message())}[/{style}]")
+
+def detect_shortcut(user_input):
+    """
+    Detect if user input contains a computer shortcut.
+    Returns the shortcut command if found, None otherwise.
+    
+    Does NOT intercept explicit agent routing commands. Matching runs against the
+    shared intent matcher compiled once at startup (see sub_agents/shortcut_matcher.py).
+    """
+    return INTENT_MATCHER.detect_shortcut(user_input)
+
+def handle_research_mode_workflow():
+    """Handle the multi-step research mode workflow - clean agent output"""
+    
+    try:
+        # Step 1: Browser Agent opens Chromium and DuckDuckGo
+        # Let browser agent handle its own output naturally without F.R.A.N.K.I.E. interference
+        browser_response = dispatch_to_agent("browser", "Open Chromium browser and navigate to duckduckgo.com. Wait for the page to load and be ready for research.")
+        
+        # Step 2: Computer Agent sets up research environment  
+        # Let computer agent handle its own output naturally without F.R.A.N.K.I.E. interference
+        computer_response = dispatch_to_agent("computer", "research mode")
+        
+        # Only F.R.A.N.K.I.E. message: Simple completion notice
+        console.print()
+        console.print(Panel(
+            "[bold green]🎯 Research Mode Complete![/bold green]\n\n"
+            "[bold yellow]Please tell me what topic you'd like to research![/bold yellow]\n\n"
+            "[dim]Note: After research, you'll have the option to document findings in Quip.[/dim]",
+            title="[highlight]📋 Ready for Research Topic[/highlight]",
+            border_style="green",
+            box=ROUNDED,
+            padding=(1, 2)
+        ))
+        
+        # Mark research mode setup as complete for this session
+        local_session().research.setup_complete = True
+        
+        return True
+        
+    except Exception as e:
+        # Only show F.R.A.N.K.I.E. error handling if something fails
+        console.print()
+        console.print(Panel(
+            f"[danger]Error setting up research mode:[/danger]\n[danger]Error:[/danger] {str(e)}\n\n"
+            "[warning]💡 Falling back to computer agent research mode setup...[/warning]",
+            title="[danger]❌ Research Mode Error[/danger]",
+            border_style="red",
+            box=ROUNDED,
+            padding=(1, 2)
+        ))
+        
+        # Fallback to just computer agent setup
+        return fallback_to_computer_research_mode()
+
+def fallback_to_computer_research_mode():
+    """Fallback to just computer agent research mode if browser setup fails"""
+    
+    try:
+        # Let computer agent handle its own output naturally without F.R.A.N.K.I.E. interference
+        response = dispatch_to_agent("computer", "research mode")
+        
+        # Mark research mode setup as complete for this session (fallback)
+        local_session().research.setup_complete = True
+        
+        return True
+        
+    except Exception as e:
+        # Only show F.R.A.N.K.I.E. error if computer agent also fails
+        console.print()
+        console.print(Panel(
+            f"[danger]Research mode setup failed:[/danger] {str(e)}",
+            title="[danger]❌ Setup Failed[/danger]",
+            border_style="red",
+            box=ROUNDED,
+            padding=(1, 2)
+        ))
+        return False
+
+def route_shortcut_to_computer(shortcut_command):
+    """Route a detected shortcut directly to the computer agent"""
+    
+    if shortcut_command == "research mode":
+        # Special multi-step research mode workflow - no F.R.A.N.K.I.E. routing messages
+        # Let agents handle their own output naturally
+        return handle_research_mode_workflow()
+    
+    # For non-research shortcuts, show F.R.A.N.K.I.E. routing message
+    console.print(f"[highlight]⚡ Auto-routing shortcut:[/highlight] `{shortcut_command}`")
+    
+    renderer.start(f"🛠️  Computer Agent: Executing shortcut: {shortcut_command}")
+    
+    try:
+        start_time = time.time()
+        
+        # Route directly to computer agent with the shortcut
+        response = dispatch_to_agent("computer", INTENT_MATCHER.query_for(shortcut_command))
+        
+        duration = time.time() - start_time
+        renderer.succeed("Computer Agent", "Shortcut executed", duration)
+        
+        # Format the response with shortcut context
+        console.print()
+        console.print(Panel(
+            f"[success]⚡ Shortcut Executed:[/success] `{shortcut_command}`\n\n{full_text(response)}",
+            title="[highlight]🚀 Computer Agent Shortcut[/highlight]",
+            border_style="magenta",
+            box=ROUNDED,
+            padding=(1, 2)
+        ))
+        return True
+        
+    except Exception as e:
+        duration = time.time() - start_time if 'start_time' in locals() else 0
+        renderer.fail("Computer Agent", f"Shortcut error: {str(e)}", duration)
+        
+        console.print()
+        console.print(Panel(
+            f"[danger]Error executing shortcut:[/danger] `{shortcut_command}`\n[danger]Error:[/danger] {str(e)}\n\n[warning]💡 Try using explicit routing:[/warning]\n• `send computer {shortcut_command}`",
+            title="[danger]❌ Shortcut Error[/danger]",
+            border_style="red",
+            box=ROUNDED
+        ))
+        return False
+
+def clear_research_mode_state():
+    """Clear the research mode state flags"""
+    local_session().research.clear()
+
+def handle_post_research_mode_input(user_input):
+    """Handle user input after research mode setup is complete - with Quip integration option"""
+    
+    # Clear the flag
+    local_session().research.setup_complete = False
+    
+    # Route directly to browser agent and capture the research output
+    try:
+        # Format research query for browser agent
+        research_query = f"Research this topic using DuckDuckGo: {user_input}. Provide comprehensive information and key findings. Please avoid creating multiple tabs"
+        
+        # Route to browser agent for research - let it handle its own output naturally
+        research_output = dispatch_to_agent("browser", research_query)
+        
+        # After research completes, ask user about Quip documentation
+        console.print()
+        quip_response = console.input("[highlight]📝 Would you like to document this research in a Quip document? (y/n): [/highlight]").strip().lower()
+        
+        if quip_response in ['y', 'yes']:
+            # User wants Quip documentation - set up Quip and type the research
+            console.print()
+            console.print("[highlight]📝 Setting up Quip document for research documentation...[/highlight]")
+            
+            # Step 1: Set up Quip for research
+            setup_response = dispatch_to_agent("computer", "setup_quip_for_research")
+            
+            # Step 2: Send research output to computer agent to type up in Quip
+            typing_instructions = f"""You should use the content that the browser agent found to type a paper about the topic in the open new Quip document
+            
+Format it professionally with proper headings, bullet points, and structure. The current view is the left half of the screen is quip, and the right half is the terminal where you are running, click on the left side to type into the quip. Click repeatedly on Untitled then type your title, then type the document. Here is a summary of the research content to use in your paper (fetch the full findings with fetch_tool_output if you need more detail):
+
+{research_output}
+
+Please type this research content into the Quip document that should now be open."""
+            
+            computer_typing_response = dispatch_to_agent("computer", typing_instructions)
+            
+            console.print()
+            console.print(Panel(
+                "[bold green]✅ Research Documentation Complete![/bold green]\n\n"
+                "✅ Research completed successfully\n"
+                "✅ Quip document set up and opened\n"
+                "✅ Research findings typed into Quip document\n\n"
+                "[bold cyan]Your research is now documented and ready for sharing![/bold cyan]",
+                title="[highlight]📋 Research & Documentation Complete[/highlight]",
+                border_style="green",
+                box=ROUNDED,
+                padding=(1, 2)
+            ))
+            
+        elif quip_response in ['n', 'no']:
+            # User doesn't want Quip documentation - research flow stops here
+            console.print()
+            console.print(Panel(
+                "[bold green]✅ Research Complete![/bold green]\n\n"
+                "[bold cyan]Research findings have been provided above.[/bold cyan]\n"
+                "[bold yellow]Research mode ended as requested - no documentation created.[/bold yellow]",
+                title="[highlight]🔬 Research Complete[/highlight]",
+                border_style="blue",
+                box=ROUNDED,
+                padding=(1, 2)
+            ))
+        else:
+            # Invalid response - default to no documentation
+            console.print()
+            console.print(Panel(
+                "[bold yellow]⚠️ Invalid response - defaulting to no documentation[/bold yellow]\n\n"
+                "[bold green]✅ Research Complete![/bold green]\n"
+                "[bold cyan]Research findings have been provided above.[/bold cyan]",
+                title="[highlight]🔬 Research Complete[/highlight]",
+                border_style="yellow",
+                box=ROUNDED,
+                padding=(1, 2)
+            ))
+        
+        return True
+        
+    except Exception as e:
+        # Only show F.R.A.N.K.I.E. error handling if the browser agent fails
+        console.print()
+        console.print(Panel(
+            f"[danger]Error researching topic:[/danger] `{user_input}`\n[danger]Error:[/danger] {str(e)}\n\n"
+            "[warning]💡 Falling back to normal orchestrator routing...[/warning]",
+            title="[danger]❌ Research Error[/danger]",
+            border_style="red",
+            box=ROUNDED,
+            padding=(1, 2)
+        ))
+        return False
+
+def run_direct_agent(agent_name, user_input):
+    """Send a request straight to one sub-agent tool, bypassing the orchestrator"""
+    spec = SUB_AGENTS[agent_name]
+    with renderer.activity(f"Processing request with {spec.display_name}..."):
+        response = dispatch_to_agent(agent_name, user_input)
+    format_premium_response(response, spec.display_name)
+    return response
+
+def parse_agent_prefix(user_input):
+    """Split an '@agent request' input into (agent_name, request); agent_name is None without a prefix"""
+    if not user_input.startswith("@"):
+        return None, user_input
+    prefix, _, request = user_input[1:].partition(" ")
+    return prefix.lower(), request.strip()
+
+def run_request(user_input):
+    """Dispatch locally when the intent router is confident, otherwise via the orchestrator"""
+    with TRACER.span("request", "request", query=user_input[:80]):
+        if intent_router:
+            decision = intent_router.route(user_input)
+            if decision:
+                console.print(f"[highlight]🧭 Local routing:[/highlight] {SUB_AGENTS[decision.agent].display_name} "
+                              f"[system](confidence {decision.confidence:.2f})[/system]")
+                start_time = time.time()
+                response = run_direct_agent(decision.agent, user_input)
+                intent_router.record(user_input, decision.agent, "router", time.time() - start_time)
+                local_session().record_direct_turn(decision.agent, user_input, str(response), start_time)
+                return response
+    
+        renderer.start("Processing request with specialized agent...")
+        session = local_session()
+        tools_before = tool_call_snapshot(session.orchestrator)
+        start_time = time.time()
+        response = session.run(user_input)
+        duration = time.time() - start_time
+        renderer.stop()
+    
+        # Learn from the orchestrator's routing decision
+        if intent_router:
+            tool_calls = tool_call_delta(tools_before, tool_call_snapshot(session.orchestrator))
+            intent_router.record_orchestrator_turn(user_input, tool_calls, duration)
+    
+        format_premium_response(response)
+        return response
+
+def show_router_stats():
+    """Display local intent router accuracy and latency savings"""
+    if not intent_router:
+        console.print("[warning]🧭 Local routing is disabled (--no-local-router)[/warning]")
+        return
+    
+    evaluation = intent_router.evaluate()
+    stats = intent_router.stats()
+    
+    router_table = Table(title="🧭 Local Intent Router", box=ROUNDED, show_header=True)
+    router_table.add_column("Metric", style="bold yellow")
+    router_table.add_column("Value", style="cyan", justify="right")
+    
+    router_table.add_row("Training examples", str(stats["examples"]))
+    router_table.add_row("Logged orchestrator routings", str(evaluation["samples"]))
+    router_table.add_row("Leave-one-out accuracy", f"{evaluation['accuracy']:.1%}")
+    router_table.add_row("Direct-dispatch precision", f"{evaluation['direct_precision']:.1%}")
+    router_table.add_row("Direct-dispatch coverage", f"{evaluation['coverage']:.1%}")
+    router_table.add_row("Direct dispatches (session / total)",
+                         f"{stats['session_direct']} / {stats['total_direct']}")
+    router_table.add_row("Avg orchestrator routing overhead", f"{stats['avg_orchestrator_overhead']:.2f}s")
+    router_table.add_row("Estimated latency saved", f"{stats['estimated_seconds_saved']:.1f}s")
+    
+    console.print()
+    console.print(router_table)
+    console.print()
+
+def show_history_stats():
+    """Display per-turn token usage and how much history has been offloaded"""
+    session = local_session()
+    manager = session.orchestrator.conversation_manager
+    turn_metrics = getattr(manager, "turn_metrics", [])
+    if not turn_metrics:
+        console.print("[info]📜 No orchestrator turns in this session yet[/info]")
+        return
+    
+    history_table = Table(title="📜 Conversation History", box=ROUNDED, show_header=True)
+    history_table.add_column("Turn", style="bold yellow", justify="right")
+    history_table.add_column("Input tokens", style="cyan", justify="right")
+    history_table.add_column("Output tokens", style="cyan", justify="right")
+    history_table.add_column("Cache read / write", style="magenta", justify="right")
+    history_table.add_column("Messages", style="green", justify="right")
+    history_table.add_column("History (est. tokens)", style="green", justify="right")
+    history_table.add_column("Offloaded chars", style="magenta", justify="right")
+    
+    for metrics in turn_metrics[-15:]:
+        history_table.add_row(str(metrics.turn), f"{metrics.input_tokens:,}", f"{metrics.output_tokens:,}",
+                              f"{metrics.cache_read_tokens:,} / {metrics.cache_write_tokens:,}",
+                              str(metrics.history_messages), f"{metrics.history_tokens_estimate:,}",
+                              f"{metrics.offloaded_chars:,}")
+    
+    console.print()
+    console.print(history_table)
+    console.print()
+
+def show_usage_stats(group_by="agent"):
+    """Display p50/p95 latency, token usage and estimated cost from the usage store"""
+    if group_by not in UsageStore.GROUPINGS:
+        console.print(f"[warning]📊 Unknown grouping '{group_by}' - use one of: {', '.join(UsageStore.GROUPINGS)}[/warning]")
+        return
+    summary = get_usage_store().summary(by=group_by)
+    if not summary:
+        console.print("[info]📊 No agent usage recorded yet[/info]")
+        return
+    
+    stats_table = Table(title=f"📊 Usage by {group_by}", box=ROUNDED, show_header=True)
+    stats_table.add_column(group_by.capitalize(), style="bold yellow")
+    stats_table.add_column("Calls", style="white", justify="right")
+    stats_table.add_column("p50", style="cyan", justify="right")
+    stats_table.add_column("p95", style="cyan", justify="right")
+    stats_table.add_column("Input", style="green", justify="right")
+    stats_table.add_column("Output", style="green", justify="right")
+    stats_table.add_column("Thinking (est.)", style="green", justify="right")
+    stats_table.add_column("Cache read / write", style="magenta", justify="right")
+    stats_table.add_column("Cache hit", style="magenta", justify="right")
+    stats_table.add_column("Cost (est.)", style="bold red", justify="right")
+    
+    for row in summary[:20]:
+        stats_table.add_row(
+            str(row[group_by]), str(row["calls"]),
+            f"{row['p50_latency_s']:.1f}s", f"{row['p95_latency_s']:.1f}s",
+            f"{row['input_tokens']:,}", f"{row['output_tokens']:,}", f"{row['thinking_tokens']:,}",
+            f"{row['cache_read_tokens']:,} / {row['cache_write_tokens']:,}",
+            f"{row['cache_hit_rate']:.0%}",
+            f"${row['cost_usd']:.2f}",
+        )
+    
+    console.print()
+    console.print(stats_table)
+    console.print()
+
+def show_tier_stats():
+    """Display how many calls the fast model served and how often it escalated"""
+    summary = tier_summary()
+    if not summary:
+        console.print("[info]⚡ No tiered model calls recorded yet[/info]")
+        return
+    
+    tier_table = Table(title="⚡ Model Tiering", box=ROUNDED, show_header=True)
+    tier_table.add_column("Agent", style="bold yellow")
+    tier_table.add_column("Calls", style="white", justify="right")
+    tier_table.add_column("Fast served", style="green", justify="right")
+    tier_table.add_column("Escalated", style="red", justify="right")
+    tier_table.add_column("p50 fast / strong", style="cyan", justify="right")
+    tier_table.add_column("Time lost to escalation", style="cyan", justify="right")
+    tier_table.add_column("Top escalation reason", style="white")
+    
+    for row in summary:
+        tier_table.add_row(
+            row["agent"], str(row["calls"]),
+            f"{row['fast_calls']} ({row['fast_calls'] / row['calls']:.0%})",
+            f"{row['escalations']} ({row['escalation_rate']:.0%})",
+            f"{row['fast_p50_s']:.1f}s / {row['strong_p50_s']:.1f}s",
+            f"{row['wasted_s']:.1f}s",
+            row["top_escalation"] or "-",
+        )
+    
+    console.print()
+    console.print(tier_table)
+    console.print()
+
+def show_image_jobs():
+    """Display background image generation jobs"""
+    queue = get_image_queue()
+    jobs = queue.jobs()
+    if not jobs:
+        console.print("[info]🖼️ No image jobs in this session[/info]")
+        return
+    
+    jobs_table = Table(title="🖼️ Image Jobs", box=ROUNDED, show_header=True)
+    jobs_table.add_column("Job", style="bold yellow")
+    jobs_table.add_column("Status", style="white")
+    jobs_table.add_column("Time", style="cyan", justify="right")
+    jobs_table.add_column("Prompt", style="white")
+    jobs_table.add_column("File / error", style="green")
+    
+    for job in jobs:
+        status = "reused" if job.cached else job.status
+        jobs_table.add_row(job.job_id, status, f"{job.duration_s:.1f}s",
+                           job.prompt if len(job.prompt) <= 50 else job.prompt[:47] + "...",
+                           job.path or job.error or "-")
+    
+    stats = queue.stats()
+    console.print()
+    console.print(jobs_table)
+    console.print(f"[system]Image store: {stats['store_mb']:.1f} MB[/system]")
+    console.print()
+
+def announce_image_jobs():
+    """Print a notification for every image job that finished since the last prompt"""
+    for job in get_image_queue().drain_notifications():
+        if job.status == "done":
+            console.print(f"[success]🖼️ Image ready:[/success] {job.path} [system]({job.duration_s:.1f}s)[/system]")
+        else:
+            console.print(f"[danger]🖼️ Image job {job.job_id} failed:[/danger] {job.error}")
+
+def wait_for_image_jobs(timeout=300):
+    """Let a one-shot query's background images finish before the process exits"""
+    queue = get_image_queue()
+    pending = [job for job in queue.jobs() if not job.done]
+    if pending:
+        console.print(f"[info]🖼️ Waiting for {len(pending)} image job(s)...[/info]")
+        for job in pending:
+            queue.wait(job.job_id, timeout)
+    announce_image_jobs()
+
+def show_last_trace():
+    """Display a flame-style breakdown of the last traced request"""
+    trace = TRACER.last_trace()
+    if trace is None:
+        console.print("[info]⏱️  No traced requests yet[/info]")
+        return
+    
+    total = trace.duration or 1e-9
+    
+    def span_label(span):
+        share = span.duration / total
+        bar = "█" * max(1, round(share * 30))
+        return (f"[bold]{span.name}[/bold] [cyan]{span.duration:.2f}s[/cyan] "
+                f"[system]{share:.0%}[/system] [green]{bar}[/green]")
+    
+    def add_children(node, span):
+        for child in trace.children(span):
+            add_children(node.add(span_label(child)), child)
+    
+    tree = Tree(span_label(trace.root))
+    add_children(tree, trace.root)
+    
+    breakdown_table = Table(title="Exclusive time by category", box=ROUNDED, show_header=True)
+    breakdown_table.add_column("Category", style="bold yellow")
+    breakdown_table.add_column("Time", style="cyan", justify="right")
+    breakdown_table.add_column("Share", style="green", justify="right")
+    for category, seconds in trace.breakdown().items():
+        breakdown_table.add_row(category, f"{seconds:.2f}s", f"{seconds / total:.0%}")
+    
+    console.print()
+    console.print(Panel(tree, title="[highlight]⏱️ Last Request Trace[/highlight]", border_style="cyan", box=ROUNDED))
+    console.print(breakdown_table)
+    console.print(f"[system]Chrome trace: {export_chrome_trace(trace)}[/system]")
+    console.print()
+
+def render_goodbye_message():
+    """Premium goodbye message"""
+    goodbye_panel = Panel(
+        Align.center("[highlight]Thank you for using F.R.A.N.K.I.E.![/highlight]\n[system]Intelligent Multi-Agent Productivity System[/system]"),
+        title="[success]👋 Goodbye[/success]",
+        border_style="blue",
+        box=ROUNDED,
+        padding=(1, 2)
+    )
+    console.print()
+    console.print(goodbye_panel)
+    console.print()
+
+def main():
+    """Premium main execution with enhanced CLI"""
+    
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description="F.R.A.N.K.I.E. - Premium Multi-Agent Productivity System"
+    )
+    parser.add_argument("query", nargs="*", help="Query to process directly")
+    parser.add_argument("--agent", choices=list(SUB_AGENTS),
+                        help="Route directly to a specific agent, bypassing the orchestrator")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--no-feed-refresh", action="store_true",
+                        help="Disable the background RSS feed refresher")
+    parser.add_argument("--no-local-router", action="store_true",
+                        help="Always route through the orchestrator agent")
+    parser.add_argument("--batch", metavar="FILE", help="Process JSONL queries from FILE (or - for stdin)")
+    parser.add_argument("--output", default="-", help="Batch results file (JSONL, default stdout)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent batch workers")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="Maximum batch queries started per second (0 = unlimited)")
+    parser.add_argument("--resume", action="store_true", help="Skip batch ids already completed in --output")
+    parser.add_argument("--image-timeout", type=float, default=300,
+                        help="Seconds a batch query waits for the images it started")
+    parser.add_argument("--serve", action="store_true", help="Run as a daemon serving queries on a local socket")
+    parser.add_argument("--socket", help="Daemon socket path (default ~/.frankie/frankie.sock)")
+    parser.add_argument("--pool-size", type=int, default=2, help="Warm orchestrator agents kept by the daemon")
+    # Handled by frankie.py before this module is imported; listed here for --help
+    parser.add_argument("--headless", action="store_true", help="Plain output for scripts: response on stdout, no UI")
+    parser.add_argument("--json", action="store_true",
+                        help="JSON-lines output with response, timing and token usage (see headless.py)")
+    
+    args = parser.parse_args()
+    
+    # Setup environment
+    os.environ["STRANDS_RSS_STORAGE_PATH"] = os.path.join(os.getcwd(), "rss_feeds", "news")
+    os.makedirs(os.environ["STRANDS_RSS_STORAGE_PATH"], exist_ok=True)
+    # The rss tool's manager is created at import time, before the path above is set
+    rss.rss_manager.storage_path = os.environ["STRANDS_RSS_STORAGE_PATH"]
+    
+    # Batch mode - no interactive UI, results go to --output
+    if args.batch:
+        from batch_runner import run_batch
+        try:
+            run_batch(args.batch, args.output, args.concurrency, args.rate_limit, args.resume, args.agent,
+                      args.image_timeout)
+        except (OSError, ValueError) as e:
+            print(f"❌ Batch error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    # Daemon mode - keep agents warm and serve frankie_client.py requests
+    if args.serve:
+        from frankie_server import DEFAULT_SOCKET_PATH, serve
+        socket_path = args.socket or DEFAULT_SOCKET_PATH
+        if not args.no_feed_refresh:
+            start_background_refresher(os.environ["STRANDS_RSS_STORAGE_PATH"])
+        console.print(f"[highlight]🛰️ Warming up F.R.A.N.K.I.E. daemon...[/highlight]")
+        try:
+            serve(socket_path, args.pool_size, on_ready=lambda server: console.print(
+                f"[success]✅ Serving on {socket_path}[/success] [system](Ctrl+C to stop)[/system]"))
+        except RuntimeError as e:
+            console.print(f"[danger]{str(e)}[/danger]")
+            sys.exit(1)
+        return
+    
+    global intent_router
+    if not args.no_local_router:
+        intent_router = IntentRouter()
+    
+    try:
+        # Clear screen for premium experience
+        console.clear()
+        
+        # Process direct query or enter interactive mode
+        if args.query:
+            query = " ".join(args.query)
+            try:
+                if args.agent:
+                    run_direct_agent(args.agent, query)
+                else:
+                    run_request(query)
+            except Exception as e:
+                renderer.stop()
+                console.print(f"[danger]Error: {str(e)}[/danger]")
+            wait_for_image_jobs()
+            return
+        
+        # Interactive mode - keep subscribed feeds warm in the background
+        if not args.no_feed_refresh:
+            start_background_refresher(os.environ["STRANDS_RSS_STORAGE_PATH"])
+        
+        render_premium_welcome()
+        console.print("[prompt]🎯 F.R.A.N.K.I.E. is ready for your requests![/prompt]")
+        if args.agent:
+            console.print(f"[highlight]🎯 Direct mode:[/highlight] requests go straight to "
+                          f"{SUB_AGENTS[args.agent].display_name} [system](use @agent to target another)[/system]")
+        
+        while True:
+            try:
+                # Enhanced prompt
+                announce_image_jobs()
+                announce_shell_jobs()
+                console.print()
+                user_input = console.input("[prompt]🎯 F.R.A.N.K.I.E. > [/prompt]").strip()
+                
+                # Handle special commands
+                if user_input.lower() in ["exit", "quit", "bye"]:
+                    clear_research_mode_state()
+                    render_goodbye_message()
+                    break
+                    
+                elif user_input.lower() in ["help", "?"]:
+                    clear_research_mode_state()
+                    show_premium_help()
+                    continue
+                    
+                elif user_input.lower() in ["shortcuts", "show_shortcuts", "computer_shortcuts", "quick_actions"]:
+                    clear_research_mode_state()
+                    show_shortcuts_menu()
+                    continue
+                    
+                elif user_input.lower() == "router":
+                    show_router_stats()
+                    continue
+                    
+                elif user_input.lower() == "history":
+                    show_history_stats()
+                    continue
+                    
+                elif user_input.lower() == "trace":
+                    show_last_trace()
+                    continue
+                    
+                elif user_input.lower() == "tiers":
+                    show_tier_stats()
+                    continue
+                    
+                elif user_input.lower() == "images":
+                    show_image_jobs()
+                    continue
+                    
+                elif user_input.lower().split(" ")[0] == "jobs":
+                    show_shell_jobs(user_input[len("jobs"):].strip())
+                    continue
+                    
+                elif user_input.lower().split(" ")[0] == "stats":
+                    show_usage_stats(user_input.lower().split(" ", 1)[1].strip() if " " in user_input else "agent")
+                    continue
+                    
+                elif user_input.lower() == "clear":
+                    clear_research_mode_state()
+                    console.clear()
+                    render_premium_welcome()
+                    continue
+                    
+                elif user_input.startswith("!"):
+                    clear_research_mode_state()
+                    # Shell command; !& runs it in the background
+                    background = user_input.startswith("!&")
+                    shell_cmd = user_input[2 if background else 1:].strip()
+                    if shell_cmd:
+                        handle_shell_command(shell_cmd, background=background)
+                    continue
+                    
+                elif not user_input:
+                    console.print("[warning]💭 Please enter a command or request. Type 'help' for guidance.[/warning]")
+                    continue
+                
+                # Direct agent routing: '@coding review main.py' or a sticky --agent
+                agent_name, agent_request = parse_agent_prefix(user_input)
+                if agent_name or args.agent:
+                    agent_name = agent_name or args.agent
+                    if agent_name not in SUB_AGENTS:
+                        console.print(f"[warning]⚠️ Unknown agent '@{agent_name}'. "
+                                      f"Choose from: {', '.join('@' + name for name in SUB_AGENTS)}[/warning]")
+                        continue
+                    if not agent_request:
+                        console.print(f"[warning]💭 Add a request after @{agent_name}[/warning]")
+                        continue
+                    clear_research_mode_state()
+                    try:
+                        start_time = time.time()
+                        response = run_direct_agent(agent_name, agent_request)
+                        # Keep the exchange in the conversation so "now add tests" has context
+                        local_session().record_direct_turn(agent_name, agent_request, str(response), start_time)
+                    except Exception as e:
+                        console.print(f"[danger]Error: {str(e)}[/danger]")
+                    continue
+                
+                # Check if we're in post-research-mode state
+                if local_session().research.setup_complete:
+                    if handle_post_research_mode_input(user_input):
+                        continue
+                    # If research handling failed, fall through to normal processing
+                
+                # Check for computer shortcuts first (before orchestrator)
+                detected_shortcut = detect_shortcut(user_input)
+                if detected_shortcut:
+                    # Route to computer agent (routing message logic handled in route_shortcut_to_computer)
+                    if route_shortcut_to_computer(detected_shortcut):
+                        continue
+                    # If shortcut routing failed, fall through to orchestrator
+                
+                # Process regular requests
+                try:
+                    run_request(user_input)
+                    
+                except Exception as e:
+                    renderer.stop()
+                    console.print()
+                    console.print(Panel(
+                        f"[danger]Error Type:[/danger] {type(e).__name__}\n[danger]Message:[/danger] {str(e)}\n\n[warning]💡 Troubleshooting:[/warning]\n• Try rephrasing your request\n• Use 'help' for available commands\n• Check system status",
+                        title="[danger]❌ System Error[/danger]",
+                        border_style="red",
+                        box=ROUNDED
+                    ))
+                    
+            except KeyboardInterrupt:
+                renderer.stop()
+                console.print(f"\n[warning]⚠️ Interrupt detected[/warning]")
+                
+                try:
+                    confirm = console.input("[warning]Exit F.R.A.N.K.I.E.? (y/N): [/warning]").lower()
+                    if confirm in ['y', 'yes']:
+                        render_goodbye_message()
+                        break
+                    else:
+                        console.print("[success]✅ Resuming session...[/success]")
+                        continue
+                except (KeyboardInterrupt, EOFError):
+                    render_goodbye_message()
+                    break
+                    
+            except EOFError:
+                render_goodbye_message()
+                break
+                
+    except Exception as e:
+        renderer.stop()
+        console.print()
+        console.print(Panel(
+            f"[danger]Critical Error:[/danger] {str(e)}\n[system]System will exit safely...[/system]",
+            title="[danger]💥 Critical System Error[/danger]",
+            border_style="red",
+            box=ROUNDED
+        ))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
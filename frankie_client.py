@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+F.R.A.N.K.I.E. thin client
+
+Forwards a query to a running `frankie.py --serve` daemon and streams the
+response back. Standard library only, so it starts in milliseconds. Images
+the query starts in the background are reported as they finish.
+
+USAGE:
+    python frankie_client.py "What's new in AWS today?"
+    python frankie_client.py --agent coding "Review utils.py"
+    python frankie_client.py --session alice "And what about yesterday?"
+    python frankie_client.py --ping
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET_PATH = os.getenv(
+    "FRANKIE_SOCKET",
+    os.path.join(os.path.expanduser(os.getenv("FRANKIE_HOME", "~/.frankie")), "frankie.sock"),
+)
+
+
+def request(payload, socket_path=DEFAULT_SOCKET_PATH, on_chunk=None, on_final=None, on_image=None):
+    """Send one request and return the final message, streaming chunks to on_chunk
+
+    With on_image, also wait for the background images the query started and
+    pass each one to on_image as the daemon reports it finished; on_final sees
+    the final message as soon as it arrives, before that wait.
+    """
+    final, pending = None, set()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                message = json.loads(line)
+                if message.get("event") == "chunk":
+                    if on_chunk:
+                        on_chunk(message["data"])
+                    continue
+                if message.get("event") == "image":
+                    pending.discard(message["job_id"])
+                    on_image(message)
+                else:
+                    final = message
+                    if on_final:
+                        on_final(message)
+                    if on_image:
+                        pending = {image["job_id"] for image in message.get("images", [])
+                                   if image["status"] not in ("done", "error")}
+                if not pending:
+                    return final
+    if final is not None:
+        return final  # The daemon went away before the images were ready
+    raise ConnectionError("Daemon closed the connection without a response")
+
+
+def describe_image(image):
+    if image["status"] == "done":
+        return f"🖼️  Image {image['job_id']} ready: {image['path']}"
+    return f"❌ Image {image['job_id']} failed: {image['error']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="F.R.A.N.K.I.E. thin client")
+    parser.add_argument("query", nargs="*", help="Query to send to the daemon")
+    parser.add_argument("--agent", help="Route directly to a specific agent")
+    parser.add_argument("--session", help="Continue a named conversation across invocations")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Daemon socket path")
+    parser.add_argument("--ping", action="store_true", help="Check that the daemon is running")
+    args = parser.parse_args()
+
+    if args.ping:
+        payload = {"op": "ping"}
+    elif args.query:
+        payload = {"query": " ".join(args.query)}
+        if args.agent:
+            payload["agent"] = args.agent
+        if args.session:
+            payload["session"] = args.session
+    else:
+        parser.error("a query or --ping is required")
+
+    streamed = []
+
+    def print_chunk(data):
+        streamed.append(data)
+        sys.stdout.write(data)
+        sys.stdout.flush()
+
+    def print_result(message):
+        if message.get("event") == "error":
+            print(f"\n❌ {message.get('error')}", file=sys.stderr)
+        elif message.get("event") == "pong":
+            print(f"✅ Daemon running (pid {message.get('pid')}, up {message.get('uptime_s')}s)")
+        else:
+            # Direct agent calls do not stream, so print the final response
+            print(message.get("response", "") if not streamed else "")
+            print(f"⏱️  {message.get('latency_s', 0):.2f}s", file=sys.stderr)
+            # Images still running arrive later and are printed as they finish
+            for image in message.get("images", []):
+                if image["status"] in ("done", "error"):
+                    print_image(image)
+
+    def print_image(image):
+        print(describe_image(image), file=sys.stderr, flush=True)
+
+    try:
+        message = request(payload, args.socket, on_chunk=print_chunk, on_final=print_result, on_image=print_image)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ No F.R.A.N.K.I.E. daemon at {args.socket} - start one with: python frankie.py --serve",
+              file=sys.stderr)
+        return 2
+    return 1 if message.get("event") == "error" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+🛰️ F.R.A.N.K.I.E. Daemon - Warm Agents Behind a Local Socket
+=============================================================
+
+`frankie.py --serve` keeps the orchestrator agents, the sub-agent modules and
+their model clients warm in one long-running process, and serves queries
+over a Unix domain socket. Per-query latency becomes model time only, and
+several terminals can share the same warm process through the thin client
+(`frankie_client.py`).
+
+Every connection gets its own session (conversation, research-mode state,
+history) unless the request names one, so concurrent users never see each
+other's context while turns in different sessions still run in parallel.
+
+PROTOCOL (JSON lines over the socket):
+    request:   {"query": "...", "agent": "coding"}      # agent is optional
+               {"query": "...", "session": "alice"}     # session is optional
+               {"op": "ping"}
+               {"op": "close_session", "session": "alice"}
+    responses: {"event": "chunk", "data": "..."}        # streamed model text
+               {"event": "done", "response": "...", "latency_s": 1.2, "usage": {...},
+                "images": [{"job_id": "1a2b3c4d", "status": "queued", ...}]}  # when images were started
+               {"event": "image", "job_id": "1a2b3c4d", "status": "done", "path": "...", "error": null}
+               {"event": "error", "error": "..."}
+               {"event": "closed", "session": "alice", "closed": false}  # unknown, or a turn is running
+
+Images a query starts in the background (generate_image_async) are listed in
+its "done" message; each one still queued or running is pushed to the same
+connection as an "image" event when it finishes.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from functools import partial
+
+from agent_registry import SUB_AGENTS, build_orchestrator_agent, dispatch_to_agent, load_agent_tool
+from session_manager import SessionManager
+from sub_agents.agent_result import full_text
+from sub_agents.frankie_home import frankie_path
+from sub_agents.image_jobs import get_image_queue, track_jobs
+from sub_agents.session_context import session_scope
+from sub_agents.tracing import TRACER
+from sub_agents.usage_metrics import usage_from_result
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.getenv("FRANKIE_SOCKET", frankie_path("frankie.sock"))
+DEFAULT_POOL_SIZE = int(os.getenv("FRANKIE_SERVER_POOL_SIZE", "2"))
+
+# Where the orchestrator's streamed text should go for the request being served.
+# Strands copies the caller's context into its event-loop thread, so this follows each request.
+_stream_sink = contextvars.ContextVar("frankie_stream_sink", default=None)
+
+
+def forward_stream(**kwargs):
+    """Strands callback handler that forwards streamed text to the current request"""
+    sink = _stream_sink.get()
+    if sink is not None and "data" in kwargs:
+        sink(kwargs["data"])
+
+
+class FrankieRequestHandler(socketserver.StreamRequestHandler):
+    """Serves JSON-line requests on one client connection"""
+
+    def setup(self):
+        super().setup()
+        self.connection_session = f"conn-{uuid.uuid4().hex[:12]}"
+        # Image completions are sent from the image queue's threads
+        self._send_lock = threading.Lock()
+
+    def finish(self):
+        super().finish()
+        # Connection-scoped sessions die with the connection; named sessions live until evicted
+        self.server.sessions.close(self.connection_session)
+
+    def send(self, **message):
+        with self._send_lock:
+            self.wfile.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+    def send_image(self, job):
+        try:
+            self.send(event="image", **job.to_dict())
+        except (OSError, ValueError):
+            pass  # The client went away before the image was ready
+
+    def handle(self):
+        for raw_line in self.rfile:
+            try:
+                request = json.loads(raw_line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                self.send(event="error", error="Invalid JSON request")
+                continue
+            try:
+                self.handle_request(request)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+    def handle_request(self, request):
+        if request.get("op") == "ping":
+            self.send(event="pong", pid=os.getpid(), uptime_s=round(time.time() - self.server.started_at, 1),
+                      **self.server.sessions.stats())
+            return
+        if request.get("op") == "close_session":
+            self.send(event="closed", session=request.get("session"),
+                      closed=self.server.sessions.close(str(request.get("session"))))
+            return
+
+        query = request.get("query", "").strip()
+        agent = request.get("agent")
+        if not query:
+            self.send(event="error", error="Missing 'query'")
+            return
+        if agent and agent not in SUB_AGENTS:
+            self.send(event="error", error=f"Unknown agent '{agent}'")
+            return
+
+        session_id = str(request.get("session") or self.connection_session)
+        start = time.perf_counter()
+        token = _stream_sink.set(lambda data: self.send(event="chunk", data=data))
+        try:
+            with track_jobs() as images:
+                with TRACER.span("request", "request", session=session_id, agent=agent or "orchestrator"):
+                    if agent:
+                        started_at = time.time()
+                        with session_scope(session_id):
+                            result = dispatch_to_agent(agent, query)
+                        # Follow-ups in the session go to its orchestrator, which should know this exchange
+                        self.server.sessions.get(session_id).record_direct_turn(agent, query, full_text(result),
+                                                                                started_at)
+                    else:
+                        result = self.server.sessions.run(session_id, query)
+            # One snapshot for both: every job sent as unfinished gets watched, or the client waits forever
+            snapshot = [(job, job.to_dict()) for job in images]
+            extra = {"images": [state for _, state in snapshot]} if images else {}
+            self.send(event="done", response=full_text(result), session=session_id,
+                      latency_s=round(time.perf_counter() - start, 3), usage=usage_from_result(result), **extra)
+            pending = [job for job, state in snapshot if state["status"] not in ("done", "error")]
+            self.server.watch_images(pending, self.send_image)
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception as e:
+            logger.exception("Request failed")
+            self.send(event="error", error=f"{type(e).__name__}: {e}")
+        finally:
+            _stream_sink.reset(token)
+
+
+class FrankieServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix-socket server holding the warm agents"""
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, pool_size=DEFAULT_POOL_SIZE):
+        self.socket_path = socket_path
+        self.started_at = time.time()
+        _remove_stale_socket(socket_path)
+
+        # Import every sub-agent now so their modules and model clients are warm, and keep
+        # `pool_size` spare orchestrators ready so new sessions skip agent construction
+        for name in SUB_AGENTS:
+            load_agent_tool(name)
+        self.sessions = SessionManager(partial(build_orchestrator_agent, callback_handler=forward_stream),
+                                       spare_agents=pool_size)
+        self.sessions.prewarm()
+
+        # Image job id -> callbacks of the connections waiting for it
+        self._image_watchers = {}
+        self._image_lock = threading.Lock()
+        get_image_queue().add_listener(self._image_finished)
+
+        super().__init__(socket_path, FrankieRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def watch_images(self, jobs, on_done):
+        """Call on_done(job) once for each job when it finishes"""
+        with self._image_lock:
+            for job in jobs:
+                self._image_watchers.setdefault(job.job_id, []).append(on_done)
+        # A job may have finished before it was registered; _image_finished runs each callback once
+        for job in jobs:
+            if job.done:
+                self._image_finished(job)
+
+    def _image_finished(self, job):
+        with self._image_lock:
+            callbacks = self._image_watchers.pop(job.job_id, [])
+        for callback in callbacks:
+            callback(job)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(socket_path):
+    """Remove a socket file left behind by a dead daemon; refuse to replace a live one"""
+    if not os.path.exists(socket_path):
+        os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A F.R.A.N.K.I.E. daemon is already listening on {socket_path}")
+
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, pool_size=DEFAULT_POOL_SIZE, on_ready=None):
+    """Run the daemon until interrupted"""
+    server = FrankieServer(socket_path, pool_size)
+    if on_ready:
+        on_ready(server)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve_in_background(socket_path=DEFAULT_SOCKET_PATH, pool_size=DEFAULT_POOL_SIZE):
+    """Start the daemon on a daemon thread, for embedding in another process"""
+    server = FrankieServer(socket_path, pool_size)
+    threading.Thread(target=server.serve_forever, name="frankie-server", daemon=True).start()
+    return server
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+🧾 Headless Mode - Plain and JSON-Lines Output for Scripts
+==========================================================
+
+The output path behind `frankie.py --headless` and `frankie.py --json`, for
+CI jobs, shell pipelines and programs embedding F.R.A.N.K.I.E. frankie.py
+hands over before FRANKIE's own UI layer (frankie_cli.py, the live renderer,
+colorama) is imported, and nothing here draws: no screen clearing, panels,
+spinners or ANSI colour. Third-party tools may still import Rich themselves -
+the coding agent's strands_tools shell, file_read and editor do, so a query
+through the orchestrator, which loads every sub-agent, ends up with it loaded.
+
+OUTPUT:
+- --headless  the response text on stdout; progress lines and a one-line
+              summary (timing and tokens) on stderr
+- --json      JSON lines on stdout: one per progress event ("status", "note",
+              "tool_start", "tool_end") while the query runs, then a final
+              "result" record:
+                  {"event": "result", "status": "ok", "response": "...",
+                   "agent": "orchestrator", "routed_by": "orchestrator",
+                   "startup_s": 0.41, "latency_s": 12.3, "total_s": 12.7,
+                   "usage": {"input_tokens": ..., "output_tokens": ...},
+                   "agents": {"orchestrator": {...}, "coding": {...}}}
+
+In both modes anything the agents print themselves goes to stderr, so stdout
+holds only the response (or only JSON). "usage" adds up every agent turn the
+query caused, sub-agents included; "startup_s" is the time from process start
+until the query was sent. The exit status is 1 when the query failed.
+
+USAGE:
+    python frankie.py --headless "What's new in AWS today?"
+    python frankie.py --json --agent coding "Review utils.py" | jq -r 'select(.event == "result").response'
+    echo "Summarize my feeds" | python frankie.py --json -
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional, TextIO
+
+from agent_registry import SUB_AGENTS
+
+# Bus events worth a progress line, and what they are called in JSON output
+PROGRESS_EVENTS = {"StatusChanged": "status", "Note": "note", "ToolStarted": "tool_start", "ToolEnded": "tool_end"}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="frankie.py --headless",
+                                     description="Run one F.R.A.N.K.I.E. query without the interactive UI")
+    parser.add_argument("query", nargs="*", help="Query to process (- or nothing reads it from stdin)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--headless", action="store_true", help="Plain text output (the default here)")
+    mode.add_argument("--json", action="store_true", help="JSON-lines output")
+    parser.add_argument("--agent", choices=list(SUB_AGENTS),
+                        help="Route directly to a specific agent, bypassing the orchestrator")
+    parser.add_argument("--no-local-router", action="store_true",
+                        help="Always route through the orchestrator agent")
+    parser.add_argument("--image-timeout", type=float, default=300,
+                        help="Seconds to wait for background image jobs before exiting")
+    # Interactive-only options are accepted, so switching an existing command line to --json just works
+    parser.add_argument("--debug", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--no-feed-refresh", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+class HeadlessOutput:
+    """Writes progress and the final result as plain text or JSON lines"""
+
+    def __init__(self, as_json: bool, stdout: Optional[TextIO] = None, stderr: Optional[TextIO] = None):
+        self.as_json = as_json
+        self.stdout = stdout or sys.stdout
+        self.stderr = stderr or sys.stderr
+        self._lock = threading.Lock()
+        self.usage: Dict[str, Dict[str, int]] = {}
+
+    def write(self, stream: TextIO, line: str) -> None:
+        with self._lock:
+            stream.write(line + "\n")
+            stream.flush()
+
+    def on_event(self, event) -> None:
+        """Bus listener: keep per-agent token counts and pass progress on"""
+        if event.kind == "TurnEnded":
+            with self._lock:
+                totals = self.usage.setdefault(event.agent, {})
+                for name, value in event.usage.items():
+                    totals[name] = totals.get(name, 0) + value
+            return
+        name = PROGRESS_EVENTS.get(event.kind)
+        if name is None:
+            return
+        if self.as_json:
+            record = event.to_dict()
+            record.pop("kind")
+            self.write(self.stdout, json.dumps({"event": name, **record}, ensure_ascii=False))
+        elif name in ("status", "note"):
+            self.write(self.stderr, event.message)
+
+    def total_usage(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for usage in self.usage.values():
+            for name, value in usage.items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def result(self, record: Dict) -> None:
+        if self.as_json:
+            self.write(self.stdout, json.dumps({"event": "result", **record}, ensure_ascii=False))
+            return
+        if record["status"] == "ok":
+            self.write(self.stdout, record["response"])
+        else:
+            self.write(self.stderr, f"Error: {record['error']}")
+        usage = record["usage"]
+        self.write(self.stderr, f"[{record['agent']} via {record['routed_by']}] {record['status']} - "
+                                f"startup {record['startup_s']:.2f}s, latency {record['latency_s']:.2f}s, "
+                                f"tokens {usage.get('input_tokens', 0)} in / {usage.get('output_tokens', 0)} out")
+
+
+def _run(query: str, agent: Optional[str], use_router: bool) -> Dict:
+    """Run one query the way the interactive one-shot path does, minus the UI"""
+    from agent_registry import build_orchestrator_agent, dispatch_to_agent
+    from sub_agents.agent_result import SubAgentResult, full_text
+    from sub_agents.tracing import TRACER
+    from sub_agents.usage_metrics import usage_from_result
+
+    routed_by = "agent" if agent else "orchestrator"
+    with TRACER.span("request", "request", query=query[:80]):
+        router = None
+        if agent is None and use_router:
+            from intent_router import IntentRouter
+            router = IntentRouter()
+            decision = router.route(query)
+            if decision:
+                agent, routed_by = decision.agent, "router"
+        start = time.perf_counter()
+        if agent:
+            result = dispatch_to_agent(agent, query)
+            if router:
+                router.record(query, agent, "router", time.perf_counter() - start)
+        else:
+            from intent_router import tool_call_snapshot, tool_call_delta
+            orchestrator = build_orchestrator_agent(callback_handler=None)
+            tools_before = tool_call_snapshot(orchestrator)
+            result = orchestrator(query)
+            if router:
+                tool_calls = tool_call_delta(tools_before, tool_call_snapshot(orchestrator))
+                router.record_orchestrator_turn(query, tool_calls, time.perf_counter() - start)
+    ok = not isinstance(result, SubAgentResult) or result.ok
+    record = {"status": "ok" if ok else "error", "agent": agent or "orchestrator", "routed_by": routed_by,
+              "response": full_text(result), "usage": usage_from_result(result)}
+    if not ok:
+        record["error"] = result.summary
+    return record
+
+
+def _wait_for_images(timeout: float, output: HeadlessOutput) -> None:
+    if "sub_agents.image_jobs" not in sys.modules:
+        return  # nothing could have queued an image
+    from sub_agents.image_jobs import get_image_queue
+    queue = get_image_queue()
+    for job in queue.jobs():
+        if not job.done:
+            queue.wait(job.job_id, timeout)
+    for job in queue.drain_notifications():
+        if output.as_json:
+            output.write(output.stdout, json.dumps({"event": "image", "job_id": job.job_id, "status": job.status,
+                                                    "path": job.path, "error": job.error}, ensure_ascii=False))
+        else:
+            output.write(output.stderr, job.message())
+
+
+def main(argv=None, process_start: Optional[float] = None) -> int:
+    """Entry point used by `frankie.py --headless/--json`; returns the exit status"""
+    process_start = time.perf_counter() if process_start is None else process_start
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    query = " ".join(args.query).strip()
+    if query in ("", "-"):
+        query = sys.stdin.read().strip()
+    output = HeadlessOutput(as_json=args.json)
+    if not query:
+        output.write(output.stderr, "Error: no query given (pass it as arguments or on stdin)")
+        return 2
+
+    # Set before strands_tools.rss is imported, so its manager picks the path up
+    os.environ["STRANDS_RSS_STORAGE_PATH"] = os.path.join(os.getcwd(), "rss_feeds", "news")
+    os.makedirs(os.environ["STRANDS_RSS_STORAGE_PATH"], exist_ok=True)
+
+    from sub_agents.event_bus import BUS, Note, StatusChanged, ToolEnded, ToolStarted, TurnEnded
+    detach = BUS.add_listener(output.on_event, StatusChanged, Note, ToolStarted, ToolEnded, TurnEnded)
+
+    startup_s = time.perf_counter() - process_start
+    start = time.perf_counter()
+    try:
+        # Whatever the agents print themselves must not end up among the response or the JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                record = _run(query, args.agent, not args.no_local_router)
+            except Exception as e:
+                record = {"status": "error", "agent": args.agent or "orchestrator",
+                          "routed_by": "agent" if args.agent else "orchestrator",
+                          "response": "", "error": f"{type(e).__name__}: {e}", "usage": {}}
+            latency_s = time.perf_counter() - start
+            _wait_for_images(args.image_timeout, output)
+    finally:
+        detach()
+
+    if output.usage:
+        record["usage"] = output.total_usage()
+    record.update(query=query, startup_s=round(startup_s, 3), latency_s=round(latency_s, 3),
+                  total_s=round(time.perf_counter() - process_start, 3), agents=output.usage)
+    output.result(record)
+    return 0 if record["status"] == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
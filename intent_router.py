@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+🧭 Intent Router - Local Request Classification for F.R.A.N.K.I.E.
+==================================================================
+
+Every request used to go through `orchestrator_agent`, which spends a whole
+model turn deciding which sub-agent tool to call before that sub-agent runs
+its own turn. This router classifies requests locally with a TF-IDF
+nearest-centroid model and, when it is confident, lets FRANKIE dispatch
+straight to the sub-agent. Anything ambiguous still goes to the orchestrator.
+
+TRAINING DATA:
+- A small set of built-in seed examples per agent
+- Every routing the orchestrator makes is appended to the routing log
+  (~/.frankie/routing_log.jsonl) and learned right away: it is added to its
+  agent's centroid, and the whole model (vocabulary and IDF) is refitted
+  every FRANKIE_ROUTER_REFIT_EVERY new examples
+
+REPORTING:
+- `evaluate()` gives leave-one-out accuracy over the orchestrator's most
+  recent FRANKIE_ROUTER_EVAL_SAMPLES routings, from a single fit
+- `stats()` reports direct dispatches and the orchestrator overhead they saved
+
+Pure standard library - no model call, no extra dependencies.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agent_registry import SUB_AGENTS, TOOL_TO_AGENT
+from sub_agents.frankie_home import frankie_path
+
+logger = logging.getLogger(__name__)
+
+ROUTING_LOG = os.getenv("FRANKIE_ROUTING_LOG", frankie_path("routing_log.jsonl", create_parent=False))
+CONFIDENCE_THRESHOLD = float(os.getenv("FRANKIE_ROUTER_THRESHOLD", "0.35"))
+MARGIN_THRESHOLD = float(os.getenv("FRANKIE_ROUTER_MARGIN", "0.12"))
+REFIT_EVERY = int(os.getenv("FRANKIE_ROUTER_REFIT_EVERY", "50"))
+EVAL_SAMPLES = int(os.getenv("FRANKIE_ROUTER_EVAL_SAMPLES", "500"))
+
+# Label for requests the orchestrator handles with its own tools (rss, retrieve, slack, ...)
+ORCHESTRATOR = "orchestrator"
+
+SEED_EXAMPLES = {
+    "browser": [
+        "browse to example.com and extract all the links",
+        "go to the website and fill in the signup form",
+        "search the web for the latest python release notes",
+        "open duckduckgo and research electric cars",
+        "scrape the product prices from this web page",
+        "navigate to github and find the trending repositories",
+        "take a screenshot of the homepage of amazon.com",
+        "look up reviews for this restaurant online",
+    ],
+    "computer": [
+        "take a screenshot of my desktop",
+        "open calculator",
+        "open the slack app on my mac",
+        "click the button in the top right of my screen",
+        "type my notes into the open text editor window",
+        "switch to the next desktop space",
+        "open system settings and turn on dark mode",
+        "launch finder and open my downloads folder",
+    ],
+    "content": [
+        "create an aws architecture diagram for a web application",
+        "draw a class diagram for a library management system",
+        "make a sequence diagram for the login flow",
+        "generate an image of a futuristic city skyline",
+        "create a flowchart of the deployment process",
+        "build a network topology diagram for our vpc",
+        "create an illustration of a data flow process",
+        "generate a uml activity diagram for checkout",
+    ],
+    "memory": [
+        "remember that i prefer python type hints",
+        "store this document in my knowledge base",
+        "convert this pdf to markdown and save it",
+        "organize my knowledge base by topic",
+        "check the status of the knowledge base ingestion job",
+        "save my meeting notes to memory",
+        "process this docx file and store it",
+        "remember my favourite editor is vim",
+    ],
+    "coding": [
+        "write a function that parses csv files",
+        "review this code for bugs",
+        "fix this bug in my python script",
+        "look at the files in this directory",
+        "show me the contents of config.json",
+        "check what is in that log file",
+        "refactor this class to use dependency injection",
+        "write unit tests for the payment module",
+    ],
+    ORCHESTRATOR: [
+        "what time is it",
+        "what is the latest news",
+        "give me today's tech headlines from my rss feeds",
+        "send a message to the team channel on slack",
+        "what did you tell me about kubernetes earlier",
+        "hello how are you",
+        "what can you do",
+        "subscribe to the aws news rss feed",
+    ],
+}
+
+# Requests that chain several steps usually need more than one agent
+_COMPOUND_PATTERN = re.compile(r"\b(then|after that|afterwards|and also|followed by)\b|,\s*and\b")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9_.+#-]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Unigrams plus adjacent-word bigrams"""
+    words = _TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def looks_compound(text: str) -> bool:
+    return bool(_COMPOUND_PATTERN.search(text.lower()))
+
+
+@dataclass
+class RoutingDecision:
+    """Outcome of classifying one request"""
+    agent: str
+    confidence: float
+    margin: float
+    direct: bool
+    elapsed_ms: float
+
+
+class IntentRouter:
+    """TF-IDF nearest-centroid classifier over sub-agent routings"""
+
+    def __init__(self, log_path: Optional[str] = ROUTING_LOG,
+                 threshold: float = CONFIDENCE_THRESHOLD, margin: float = MARGIN_THRESHOLD):
+        self.log_path = log_path
+        self.threshold = threshold
+        self.margin = margin
+        self._lock = threading.Lock()
+        self._idf: Dict[str, float] = {}
+        self._sums: Dict[str, Dict[str, float]] = {}
+        self._centroids: Dict[str, Dict[str, float]] = {}
+        self._examples: List[Tuple[str, str]] = []
+        self._unfitted = 0
+        self._logged: List[dict] = []
+        self.direct_dispatches = 0
+        self.fallbacks = 0
+        self.train(self._load_examples())
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def _load_examples(self) -> List[Tuple[str, str]]:
+        examples = [(text, label) for label, texts in SEED_EXAMPLES.items() for text in texts]
+        self._logged = self._read_log()
+        for entry in self._logged:
+            if entry.get("source") == "orchestrator" and entry.get("agent"):
+                examples.append((entry["query"], entry["agent"]))
+        return examples
+
+    def _read_log(self) -> List[dict]:
+        if not self.log_path or not os.path.exists(self.log_path):
+            return []
+        entries = []
+        with open(self.log_path, "r") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def _vectorize(self, text: str, idf: Dict[str, float]) -> Dict[str, float]:
+        counts = Counter(token for token in tokenize(text) if token in idf)
+        vector = {token: (1 + math.log(count)) * idf[token] for token, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {token: value / norm for token, value in vector.items()}
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {token: value / norm for token, value in vector.items()}
+
+    def _fit(self, examples: List[Tuple[str, str]]):
+        """IDF weights and the per-label sums of example vectors (centroids before normalizing)"""
+        document_frequency = Counter()
+        for text, _ in examples:
+            document_frequency.update(set(tokenize(text)))
+        total = len(examples)
+        idf = {token: math.log((1 + total) / (1 + df)) + 1 for token, df in document_frequency.items()}
+
+        sums = defaultdict(lambda: defaultdict(float))
+        for text, label in examples:
+            for token, value in self._vectorize(text, idf).items():
+                sums[label][token] += value
+        return idf, {label: dict(vector) for label, vector in sums.items()}
+
+    def train(self, examples: List[Tuple[str, str]]) -> None:
+        idf, sums = self._fit(examples)
+        centroids = {label: self._normalize(vector) for label, vector in sums.items()}
+        with self._lock:
+            self._examples = list(examples)
+            self._idf, self._sums, self._centroids = idf, sums, centroids
+            self._unfitted = 0
+
+    def learn(self, text: str, label: str) -> None:
+        """Add one example: only its label's centroid moves, and the model is refitted now and then"""
+        with self._lock:
+            self._examples.append((text, label))
+            self._unfitted += 1
+            refit = self._unfitted >= REFIT_EVERY
+            if not refit:
+                # Words the current vocabulary lacks are picked up at the next refit
+                vector = self._vectorize(text, self._idf)
+                total = dict(self._sums.get(label, {}))
+                for token, value in vector.items():
+                    total[token] = total.get(token, 0.0) + value
+                self._sums[label] = total
+                # classify() reads the centroids without the lock, so replace rather than mutate them
+                self._centroids = {**self._centroids, label: self._normalize(total)}
+            examples = list(self._examples)
+        if refit:
+            self.train(examples)
+
+    # ------------------------------------------------------------------
+    # Classification
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _score(vector, centroids) -> List[Tuple[float, str]]:
+        scores = [
+            (sum(value * centroid.get(token, 0.0) for token, value in vector.items()), label)
+            for label, centroid in centroids.items()
+        ]
+        return sorted(scores, reverse=True)
+
+    def classify(self, text: str) -> RoutingDecision:
+        start = time.perf_counter()
+        with self._lock:
+            idf, centroids = self._idf, self._centroids
+        scores = self._score(self._vectorize(text, idf), centroids)
+        (best_score, best_label), runner_up = scores[0], scores[1][0] if len(scores) > 1 else 0.0
+        margin = best_score - runner_up
+        direct = (
+            best_label in SUB_AGENTS
+            and best_score >= self.threshold
+            and margin >= self.margin
+            and not looks_compound(text)
+        )
+        return RoutingDecision(best_label, best_score, margin, direct, (time.perf_counter() - start) * 1000)
+
+    def route(self, text: str) -> Optional[RoutingDecision]:
+        """Return a decision when the request can skip the orchestrator, else None"""
+        decision = self.classify(text)
+        if decision.direct:
+            self.direct_dispatches += 1
+            return decision
+        self.fallbacks += 1
+        return None
+
+    # ------------------------------------------------------------------
+    # Logging & reporting
+    # ------------------------------------------------------------------
+
+    def record(self, query: str, agent: Optional[str], source: str, duration: float,
+               tool_time: float = 0.0) -> None:
+        """Append a routing to the log; orchestrator routings become training data"""
+        entry = {
+            "ts": time.time(),
+            "query": query,
+            "agent": agent,
+            "source": source,
+            "duration": round(duration, 3),
+            "tool_time": round(tool_time, 3),
+        }
+        self._logged.append(entry)
+        if source == "orchestrator" and agent:
+            self.learn(query, agent)
+        if not self.log_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            logger.warning("Could not write routing log: %s", e)
+
+    def record_orchestrator_turn(self, query: str, tool_calls: Dict[str, Tuple[int, float]],
+                                 duration: float) -> None:
+        """Learn from an orchestrator turn given its per-tool (call_count, seconds) deltas"""
+        agents = {TOOL_TO_AGENT[name] for name in tool_calls if name in TOOL_TO_AGENT}
+        tool_time = sum(seconds for name, (_, seconds) in tool_calls.items() if name in TOOL_TO_AGENT)
+        if len(agents) == 1:
+            self.record(query, agents.pop(), "orchestrator", duration, tool_time)
+        elif not tool_calls:
+            self.record(query, ORCHESTRATOR, "orchestrator", duration, 0.0)
+        else:
+            # Multi-agent or orchestrator-tool turns are not single-label training data
+            self.record(query, None, "orchestrator", duration, tool_time)
+
+    def evaluate(self, max_samples: int = EVAL_SAMPLES) -> Dict[str, float]:
+        """Leave-one-out accuracy of the router against the orchestrator's latest routings"""
+        logged = [(e["query"], e["agent"]) for e in self._logged
+                  if e.get("source") == "orchestrator" and e.get("agent")]
+        if not logged:
+            return {"samples": 0, "accuracy": 0.0, "direct_precision": 0.0, "coverage": 0.0}
+
+        seeds = [(text, label) for label, texts in SEED_EXAMPLES.items() for text in texts]
+        # One fit over everything; each sample is then taken back out of its own label's sum instead
+        # of refitting without it. Words only the held-out sample uses would be missing from that
+        # refit's vocabulary, so they are left out of its query vector; other IDF shifts are negligible.
+        examples = seeds + logged
+        idf, sums = self._fit(examples)
+        document_frequency = Counter(token for text, _ in examples for token in set(tokenize(text)))
+        shared_idf = {token: weight for token, weight in idf.items() if document_frequency[token] > 1}
+        centroids = {label: self._normalize(vector) for label, vector in sums.items()}
+        squared_norms = {label: sum(value * value for value in vector.values()) for label, vector in sums.items()}
+        samples = logged[-max_samples:]
+        correct = direct = direct_correct = 0
+        for query, label in samples:
+            added = self._vectorize(query, idf)  # what the fit added to its label's sum
+            vector = self._vectorize(query, shared_idf)
+            own = sums[label]
+            # |sum - added|^2 = |sum|^2 - 2 sum.added + |added|^2
+            held_out_norm = math.sqrt(max(0.0, squared_norms[label]
+                                          - 2 * sum(value * own.get(token, 0.0) for token, value in added.items())
+                                          + sum(value * value for value in added.values())))
+            overlap = sum(value * (own.get(token, 0.0) - added.get(token, 0.0)) for token, value in vector.items())
+            held_out = overlap / held_out_norm if held_out_norm > 1e-9 else 0.0
+            scores = sorted([(held_out, label)] + [
+                (sum(value * centroid.get(token, 0.0) for token, value in vector.items()), other)
+                for other, centroid in centroids.items() if other != label
+            ], reverse=True)
+            predicted, score = scores[0][1], scores[0][0]
+            margin = score - (scores[1][0] if len(scores) > 1 else 0.0)
+            correct += predicted == label
+            if predicted in SUB_AGENTS and score >= self.threshold and margin >= self.margin \
+                    and not looks_compound(query):
+                direct += 1
+                direct_correct += predicted == label
+        return {
+            "samples": len(samples),
+            "accuracy": correct / len(samples),
+            "direct_precision": direct_correct / direct if direct else 0.0,
+            "coverage": direct / len(samples),
+        }
+
+    def stats(self) -> Dict[str, float]:
+        """Direct-dispatch counts and the orchestrator overhead they avoided"""
+        overheads = [
+            e["duration"] - e["tool_time"] for e in self._logged
+            if e.get("source") == "orchestrator" and e.get("agent") in SUB_AGENTS and e.get("tool_time")
+        ]
+        average_overhead = sum(overheads) / len(overheads) if overheads else 0.0
+        routed = sum(1 for e in self._logged if e.get("source") == "router")
+        return {
+            "examples": len(self._examples),
+            "session_direct": self.direct_dispatches,
+            "session_fallbacks": self.fallbacks,
+            "total_direct": routed,
+            "avg_orchestrator_overhead": average_overhead,
+            "estimated_seconds_saved": routed * average_overhead,
+        }
+
+
+def tool_call_snapshot(agent) -> Dict[str, Tuple[int, float]]:
+    """Snapshot (call_count, total_time) per tool from a Strands agent's metrics"""
+    tool_metrics = getattr(getattr(agent, "event_loop_metrics", None), "tool_metrics", {}) or {}
+    return {name: (m.call_count, m.total_time) for name, m in tool_metrics.items()}
+
+
+def tool_call_delta(before, after) -> Dict[str, Tuple[int, float]]:
+    """Tools called between two snapshots"""
+    delta = {}
+    for name, (count, seconds) in after.items():
+        previous_count, previous_seconds = before.get(name, (0, 0.0))
+        if count > previous_count:
+            delta[name] = (count - previous_count, seconds - previous_seconds)
+    return delta
+
+
+if __name__ == "__main__":
+    import sys
+
+    router = IntentRouter()
+    if len(sys.argv) > 1:
+        decision = router.classify(" ".join(sys.argv[1:]))
+        print(f"agent={decision.agent} confidence={decision.confidence:.3f} "
+              f"margin={decision.margin:.3f} direct={decision.direct} ({decision.elapsed_ms:.2f} ms)")
+    else:
+        print(json.dumps({"evaluation": router.evaluate(), "stats": router.stats()}, indent=2))
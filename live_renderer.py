@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+🖥️ Live Renderer - One Owner for the Terminal's Transient Output
+================================================================
+
+While a request runs, a single `rich.live.Live` owns the bottom of the screen:
+a spinner with the current status line and one row per running tool call.
+Agents and tools never draw themselves: the renderer subscribes to the event
+bus (see sub_agents/event_bus.py) while it is on screen, and one pump thread
+drains that subscription and redraws at a capped rate, so nothing else
+writes to the terminal behind Live's back.
+
+LAYOUT:
+- Status line: the request's current phase, updated by report_status()
+- Tool rows: running calls with a spinner, finished ones with ✔/✖ and their
+  duration for a moment afterwards (at most FRANKIE_LIVE_ROWS rows)
+- Notes and anything printed meanwhile (streamed model text) scroll above
+
+Configuration:
+    FRANKIE_LIVE_FPS    redraws per second (default 8)
+    FRANKIE_LIVE_ROWS   tool rows shown at once (default 8)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.spinner import Spinner
+from rich.table import Table
+from rich.text import Text
+
+from sub_agents.event_bus import BUS, Note, StatusChanged, ToolEnded, ToolStarted
+
+REFRESH_PER_SECOND = float(os.getenv("FRANKIE_LIVE_FPS", "8"))
+MAX_ROWS = int(os.getenv("FRANKIE_LIVE_ROWS", "8"))
+# Finished rows stay visible this long so quick calls don't just flash by
+FINISHED_ROW_SECONDS = 3.0
+
+
+@dataclass
+class ToolRow:
+    label: str
+    detail: str
+    started: float
+    ended: Optional[float] = None
+    ok: bool = True
+    result: str = ""
+    spinner: Spinner = field(default_factory=lambda: Spinner("dots", style="green"))
+
+
+class LiveRenderer:
+    """Draws the status line and tool rows of the running request"""
+
+    def __init__(self, console: Console, refresh_per_second: float = REFRESH_PER_SECOND, max_rows: int = MAX_ROWS):
+        self.console = console
+        self.refresh_per_second = refresh_per_second
+        self.max_rows = max_rows
+        self._live: Optional[Live] = None
+        self._pump_thread: Optional[threading.Thread] = None
+        self._events = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._status = ""
+        self._started = 0.0
+        self._rows: "OrderedDict[str, ToolRow]" = OrderedDict()
+        self._spinner = Spinner("dots", style="blue")
+
+    @property
+    def active(self) -> bool:
+        return self._live is not None
+
+    def start(self, message: str = "🧠 Analyzing request...") -> None:
+        """Take over the bottom of the screen (or just change the status if already running)"""
+        with self._lock:
+            self._status = message
+            if self._live is not None:
+                return
+            self._started = time.perf_counter()
+            self._rows.clear()
+            self._live = Live(self._render(), console=self.console, auto_refresh=False, transient=True,
+                              redirect_stdout=True, redirect_stderr=True)
+            self._live.start()
+            self._stopping.clear()
+            self._events = BUS.subscribe(StatusChanged, Note, ToolStarted, ToolEnded)
+            self._pump_thread = threading.Thread(target=self._pump, daemon=True, name="frankie-live-renderer")
+            self._pump_thread.start()
+
+    def status(self, message: str) -> None:
+        with self._lock:
+            self._status = message
+
+    def stop(self) -> None:
+        """Give the screen back; pending notes are still printed"""
+        with self._lock:
+            live = self._live
+            if live is None:
+                return
+            self._stopping.set()
+        self._pump_thread.join()
+        with self._lock:
+            self._events.close()
+            self._apply(self._events.drain())
+            self._events = None
+            live.stop()
+            self._live = None
+            self._pump_thread = None
+
+    def succeed(self, label: str, message: str, duration: Optional[float] = None) -> None:
+        """Stop and leave a success line behind"""
+        self.stop()
+        suffix = f" ({duration:.2f}s)" if duration else ""
+        self.console.print(f"[success]✔ {label}: {message}{suffix}[/success]")
+
+    def fail(self, label: str, error: str, duration: Optional[float] = None) -> None:
+        """Stop and leave a failure line behind"""
+        self.stop()
+        suffix = f" ({duration:.2f}s)" if duration else ""
+        self.console.print(f"[danger]✖ {label}: {error}{suffix}[/danger]")
+
+    @contextmanager
+    def activity(self, message: str):
+        self.start(message)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def _pump(self) -> None:
+        interval = 1.0 / max(self.refresh_per_second, 1.0)
+        while not self._stopping.wait(interval):
+            with self._lock:
+                self._apply(self._events.drain())
+                self._live.update(self._render(), refresh=True)
+
+    def _apply(self, events) -> None:
+        """Fold bus events into the display state (called with the lock held)"""
+        for event in events:
+            if isinstance(event, StatusChanged):
+                self._status = event.message
+            elif isinstance(event, Note):
+                self._live.console.print(Text(event.message, style="system"))
+            elif isinstance(event, ToolStarted):
+                self._rows[event.tool_use_id] = ToolRow(f"{event.agent} › {event.tool}", event.detail, event.timestamp)
+            elif isinstance(event, ToolEnded):
+                row = self._rows.get(event.tool_use_id)
+                if row is not None:
+                    row.ended, row.ok, row.result = event.timestamp, event.ok, f"{event.duration_s:.1f}s"
+        now = time.time()
+        for key in [key for key, row in self._rows.items() if row.ended and now - row.ended > FINISHED_ROW_SECONDS]:
+            del self._rows[key]
+
+    def _render(self):
+        header = Text(self._status, style="blue")
+        if self._started:
+            header.append(f" {time.perf_counter() - self._started:.0f}s", style="system")
+        self._spinner.update(text=header)
+        if not self._rows:
+            return self._spinner
+        rows = list(self._rows.values())
+        running = [row for row in rows if row.ended is None]
+        shown = (running + [row for row in rows if row.ended is not None][::-1])[:self.max_rows]
+        table = Table.grid(padding=(0, 1), expand=True)
+        table.add_column(width=2)
+        table.add_column(style="agent", no_wrap=True)
+        table.add_column(style="system", overflow="ellipsis", no_wrap=True, ratio=1)
+        table.add_column(justify="right", style="cyan", no_wrap=True, min_width=5)
+        now = time.time()
+        for row in shown:
+            if row.ended is None:
+                icon, elapsed = row.spinner, f"{now - row.started:.0f}s"
+            else:
+                icon, elapsed = Text("✔", style="green") if row.ok else Text("✖", style="red"), row.result
+            table.add_row(icon, row.label, row.detail, elapsed)
+        hidden = len(rows) - len(shown)
+        if hidden:
+            table.add_row("", Text(f"+{hidden} more", style="dim"), "", "")
+        return Group(self._spinner, table)
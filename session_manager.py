@@ -0,0 +1,242 @@
+"""
+F.R.A.N.K.I.E. Session Manager
+
+Holds per-session conversation state so one process can serve many users
+without cross-talk: each session owns its orchestrator agent, research-mode
+state and turn history. Idle sessions are evicted by LRU and TTL, and their
+agents are recycled (with a cleared conversation) for new sessions.
+
+Requests the local intent router sends straight to a sub-agent are recorded
+in the session too, so the orchestrator sees them when a follow-up reaches it.
+
+A session's persistent Python worker (see sub_agents/python_workers.py) is
+stopped, and its cached files (sub_agents/file_cache.py) dropped, when the
+session is evicted or closed.
+
+Thread-safe, and usable from asyncio through `run_async()`, which runs the
+blocking agent call in a worker thread while keeping the event loop free.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from agent_registry import build_orchestrator_agent
+from sub_agents.agent_result import budget_text
+from sub_agents.file_cache import release_session_files
+from sub_agents.python_workers import release_session_worker
+from sub_agents.session_context import DEFAULT_SESSION_ID, session_scope
+
+MAX_SESSIONS = int(os.getenv("FRANKIE_MAX_SESSIONS", "32"))
+SESSION_TTL = float(os.getenv("FRANKIE_SESSION_TTL", "1800"))
+
+
+@dataclass
+class ResearchModeState:
+    """Multi-step research workflow flags"""
+    active: bool = False
+    setup_complete: bool = False
+
+    def clear(self):
+        self.active = False
+        self.setup_complete = False
+
+
+@dataclass
+class Turn:
+    """One request/response exchange in a session"""
+    query: str
+    response: str
+    started_at: float
+    duration: float
+    agent: Optional[str] = None  # set when a sub-agent answered directly, without the orchestrator
+
+
+def _exchange_messages(turn: Turn) -> List[dict]:
+    return [
+        {"role": "user", "content": [{"text": turn.query}]},
+        {"role": "assistant", "content": [{"text": f"[Answered by the {turn.agent} agent]\n{budget_text(turn.response)}"}]},
+    ]
+
+
+@dataclass
+class Session:
+    """Conversation state owned by a single user"""
+    session_id: str
+    agent_factory: Callable
+    pinned: bool = False
+    research: ResearchModeState = field(default_factory=ResearchModeState)
+    history: List[Turn] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    _orchestrator: object = field(default=None, repr=False)
+
+    @property
+    def orchestrator(self):
+        """The session's orchestrator agent, built on first use"""
+        with self.lock:
+            if self._orchestrator is None:
+                self._orchestrator = self.agent_factory()
+                # Turns answered before it existed are still part of the conversation
+                for turn in self.history:
+                    if turn.agent:
+                        self._orchestrator.messages.extend(_exchange_messages(turn))
+            return self._orchestrator
+
+    def record_direct_turn(self, agent: str, query: str, response: str, started_at: float) -> None:
+        """Add a turn a sub-agent answered directly to the orchestrator's conversation, for follow-ups"""
+        with self.lock:
+            turn = Turn(query, response, started_at, time.time() - started_at, agent=agent)
+            self.history.append(turn)
+            self.last_used = time.time()
+            # Without an orchestrator yet, the turn is replayed from the history when it is built
+            if self._orchestrator is not None:
+                self._orchestrator.messages.extend(_exchange_messages(turn))
+
+    @property
+    def busy(self) -> bool:
+        if self.lock.acquire(blocking=False):
+            self.lock.release()
+            return False
+        return True
+
+    def run(self, query: str):
+        """Run one orchestrator turn; turns within a session are serialized"""
+        with self.lock, session_scope(self.session_id):
+            self.last_used = started_at = time.time()
+            result = self.orchestrator(query)
+            self.history.append(Turn(query, str(result), started_at, time.time() - started_at))
+            self.last_used = time.time()
+            return result
+
+
+class SessionManager:
+    """LRU/TTL-bounded registry of sessions"""
+
+    def __init__(self, agent_factory: Callable = build_orchestrator_agent, max_sessions: int = MAX_SESSIONS,
+                 ttl_seconds: float = SESSION_TTL, spare_agents: int = 0):
+        self.agent_factory = agent_factory
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_seconds = ttl_seconds
+        self.spare_limit = spare_agents
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._spares: List[object] = []
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Warm agent recycling
+    # ------------------------------------------------------------------
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """Build spare orchestrators ahead of time so new sessions start warm"""
+        for _ in range(self.spare_limit if count is None else count):
+            agent = self.agent_factory()
+            with self._lock:
+                self._spares.append(agent)
+
+    def _take_agent(self):
+        with self._lock:
+            if self._spares:
+                return self._spares.pop()
+        return self.agent_factory()
+
+    def _recycle(self, session: Session) -> None:
+        # Called with the manager lock and the (idle) session's lock held
+        agent, session._orchestrator = session._orchestrator, None
+        if agent is None or len(self._spares) >= self.spare_limit:
+            return
+        agent.messages.clear()
+        reset = getattr(agent.conversation_manager, "reset", None)
+        if reset is not None:
+            reset()
+        self._spares.append(agent)
+
+    # ------------------------------------------------------------------
+    # Session lookup & eviction
+    # ------------------------------------------------------------------
+
+    def get(self, session_id: str = DEFAULT_SESSION_ID, pinned: bool = False) -> Session:
+        """Return a session, creating it if needed and marking it most recently used"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                # The agent itself is built lazily, outside the manager lock
+                session = Session(session_id, self._take_agent, pinned=pinned)
+                self._sessions[session_id] = session
+            else:
+                session.pinned = session.pinned or pinned
+                self._sessions.move_to_end(session_id)
+            session.last_used = time.time()
+            self._evict_locked()
+            return session
+
+    def _evict_locked(self) -> None:
+        now = time.time()
+        for session_id, session in list(self._sessions.items()):
+            if session.pinned or session.busy:
+                continue
+            expired = now - session.last_used > self.ttl_seconds
+            over_capacity = len(self._sessions) > self.max_sessions
+            if not expired and not over_capacity:
+                # Sessions are in LRU order - nothing newer can be expired either
+                break
+            # Holding the session lock keeps a turn from starting while its agent is recycled
+            if not session.lock.acquire(blocking=False):
+                continue
+            try:
+                del self._sessions[session_id]
+                self._recycle(session)
+            finally:
+                session.lock.release()
+            release_session_worker(session_id)
+            release_session_files(session_id)
+            self.evictions += 1
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            before = self.evictions
+            self._evict_locked()
+            return self.evictions - before
+
+    def close(self, session_id: str) -> bool:
+        """End a session; False if there is none, or a turn is running in it (retry once it finishes)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            # Recycling a running session would clear its conversation mid-turn and hand its agent to another
+            if session is None or not session.lock.acquire(blocking=False):
+                return False
+            try:
+                del self._sessions[session_id]
+                self._recycle(session)
+            finally:
+                session.lock.release()
+        release_session_worker(session_id)
+        release_session_files(session_id)
+        return True
+
+    # ------------------------------------------------------------------
+    # Running turns
+    # ------------------------------------------------------------------
+
+    def run(self, session_id: str, query: str):
+        return self.get(session_id).run(query)
+
+    async def run_async(self, session_id: str, query: str):
+        """Run a turn without blocking the event loop (context, incl. session id, is preserved)"""
+        session = self.get(session_id)
+        return await asyncio.to_thread(session.run, query)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "busy": sum(1 for session in self._sessions.values() if session.busy),
+                "spare_agents": len(self._spares),
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+🐚 Shell Runner - Streaming `!` Commands with Job Control
+=========================================================
+
+Runs the shell commands typed after `!` in the F.R.A.N.K.I.E. CLI as child
+processes whose output streams while they run, instead of waiting for the
+command to finish and printing everything at once.
+
+EXECUTION:
+- Every command gets its own process group, so Ctrl-C at the terminal only
+  reaches F.R.A.N.K.I.E.; cancelling forwards SIGINT to the command's group,
+  then SIGTERM and SIGKILL if it is still running after a grace period
+- stdout and stderr are read line by line on reader threads into a bounded
+  scrollback buffer, and written in full to a log under FRANKIE_HOME/shell
+- `!&command` runs in the background: `jobs` lists background jobs, and the
+  ones that finished are announced at the next prompt
+
+Configuration:
+    FRANKIE_SHELL_SCROLLBACK   output lines kept in memory per command (default 500)
+    FRANKIE_SHELL_LOGS         command logs kept on disk (default 50)
+    FRANKIE_SHELL_CANCEL_GRACE seconds between cancel signals (default 3)
+"""
+
+import atexit
+import glob
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Tuple
+
+from sub_agents.frankie_home import frankie_path
+
+SCROLLBACK_LINES = int(os.getenv("FRANKIE_SHELL_SCROLLBACK", "500"))
+KEEP_LOGS = int(os.getenv("FRANKIE_SHELL_LOGS", "50"))
+CANCEL_GRACE = float(os.getenv("FRANKIE_SHELL_CANCEL_GRACE", "3"))
+LOG_DIR = frankie_path("shell", create_parent=False)
+
+# A line longer than this is split, so a binary blob without newlines can't grow unbounded
+MAX_LINE_BYTES = 8192
+
+if os.name == "posix":
+    SESSION_KWARGS = {"start_new_session": True}
+    CANCEL_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGKILL)
+else:
+    SESSION_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    CANCEL_SIGNALS = (signal.CTRL_BREAK_EVENT, signal.SIGTERM, signal.SIGTERM)
+
+
+@dataclass
+class ShellJob:
+    """One `!` command: its process, status and recent output"""
+    job_id: int
+    command: str
+    background: bool
+    log_path: str
+    process: Optional[subprocess.Popen] = None
+    started: float = field(default_factory=time.time)
+    ended: Optional[float] = None
+    returncode: Optional[int] = None
+    status: str = "running"  # running, done, failed, cancelled
+    lines: Deque[Tuple[str, str]] = field(default_factory=lambda: deque(maxlen=SCROLLBACK_LINES))
+    line_count: int = 0
+    cancel_level: int = 0
+
+    @property
+    def done(self) -> bool:
+        return self.ended is not None
+
+    @property
+    def duration_s(self) -> float:
+        return (self.ended or time.time()) - self.started
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    @property
+    def hidden_lines(self) -> int:
+        """Output lines that fell out of the scrollback (they are still in the log)"""
+        return self.line_count - len(self.lines)
+
+    def message(self) -> str:
+        if self.status == "running":
+            return f"[{self.job_id}] running for {self.duration_s:.1f}s: {self.command}"
+        return f"[{self.job_id}] {self.status} (exit {self.returncode}, {self.duration_s:.1f}s): {self.command}"
+
+
+class ShellRunner:
+    """Starts `!` commands, streams their output and keeps track of background jobs"""
+
+    def __init__(self, scrollback: int = SCROLLBACK_LINES, log_dir: str = LOG_DIR, keep_logs: int = KEEP_LOGS):
+        self.scrollback = scrollback
+        self.log_dir = log_dir
+        self.keep_logs = keep_logs
+        self._jobs: List[ShellJob] = []
+        self._next_id = 1
+        self._notifications: Deque[ShellJob] = deque()
+        self._changed = threading.Condition()
+
+    def _prune_logs(self) -> None:
+        logs = sorted(glob.glob(os.path.join(self.log_dir, "*.log")), key=os.path.getmtime)
+        for path in logs[:max(0, len(logs) - self.keep_logs + 1)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def start(self, command: str, background: bool = False) -> ShellJob:
+        """Start a command and return immediately; output is collected as it arrives"""
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._prune_logs()
+        with self._changed:
+            job_id = self._next_id
+            self._next_id += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        job = ShellJob(job_id, command, background, os.path.join(self.log_dir, f"{stamp}-{os.getpid()}-{job_id}.log"),
+                       lines=deque(maxlen=self.scrollback))
+        with self._changed:
+            self._jobs.append(job)
+        log = open(job.log_path, "w", encoding="utf-8", errors="replace")
+        log.write(f"$ {command}\n")
+        try:
+            job.process = subprocess.Popen(
+                command, shell=True, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, **SESSION_KWARGS,
+            )
+        except OSError as e:
+            log.close()
+            job.lines.append(("stderr", str(e)))
+            job.line_count = 1
+            self._finish(job, returncode=127, status="failed")
+            return job
+        log_lock = threading.Lock()
+        readers = [threading.Thread(target=self._read, args=(job, stream, name, log, log_lock), daemon=True,
+                                    name=f"frankie-shell-{job_id}-{name}")
+                   for stream, name in ((job.process.stdout, "stdout"), (job.process.stderr, "stderr"))]
+        for reader in readers:
+            reader.start()
+        threading.Thread(target=self._wait, args=(job, readers, log, log_lock), daemon=True,
+                         name=f"frankie-shell-{job_id}").start()
+        return job
+
+    def _read(self, job: ShellJob, stream, name: str, log, log_lock: threading.Lock) -> None:
+        for raw in iter(lambda: stream.readline(MAX_LINE_BYTES), b""):
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            with log_lock:
+                if not log.closed:
+                    log.write(line + "\n")
+            with self._changed:
+                job.lines.append((name, line))
+                job.line_count += 1
+        stream.close()
+
+    def _wait(self, job: ShellJob, readers: List[threading.Thread], log, log_lock: threading.Lock) -> None:
+        returncode = job.process.wait()
+        if job.cancel_level:
+            # Whatever the cancelled command left running in its group goes with it
+            self._signal(job, CANCEL_SIGNALS[-1])
+        # Background grandchildren may keep the pipes open; don't hold the job hostage to them
+        for reader in readers:
+            reader.join(timeout=1.0)
+        with log_lock:
+            log.write(f"[exit {returncode}]\n")
+            log.close()
+        status = "cancelled" if job.cancel_level else ("done" if returncode == 0 else "failed")
+        self._finish(job, returncode, status)
+
+    def _finish(self, job: ShellJob, returncode: int, status: str) -> None:
+        with self._changed:
+            job.returncode = returncode
+            job.status = status
+            job.ended = time.time()
+            if job.background:
+                self._notifications.append(job)
+            self._changed.notify_all()
+
+    def wait(self, job: ShellJob, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes (or the timeout passes); True once it is done"""
+        with self._changed:
+            if not job.done:
+                self._changed.wait(timeout)
+            return job.done
+
+    def _signal(self, job: ShellJob, sig) -> None:
+        if job.done or job.process is None:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(job.process.pid, sig)
+            else:
+                job.process.send_signal(sig)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+
+    def cancel(self, job: ShellJob) -> None:
+        """Interrupt the command's process group, escalating while it keeps running"""
+        if job.done:
+            return
+        level = min(job.cancel_level, len(CANCEL_SIGNALS) - 1)
+        job.cancel_level = level + 1
+        self._signal(job, CANCEL_SIGNALS[level])
+        if job.cancel_level < len(CANCEL_SIGNALS):
+            timer = threading.Timer(CANCEL_GRACE, self._escalate, args=(job, job.cancel_level))
+            timer.daemon = True
+            timer.start()
+
+    def _escalate(self, job: ShellJob, level: int) -> None:
+        if not job.done and job.cancel_level == level:
+            self.cancel(job)
+
+    def snapshot(self, job: ShellJob, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """The job's latest output lines as (stream, line) pairs"""
+        with self._changed:
+            lines = list(job.lines)
+        return lines[-limit:] if limit else lines
+
+    def get(self, job_id: int) -> Optional[ShellJob]:
+        with self._changed:
+            return next((job for job in self._jobs if job.job_id == job_id), None)
+
+    def jobs(self) -> List[ShellJob]:
+        """Background jobs, oldest first"""
+        with self._changed:
+            return [job for job in self._jobs if job.background]
+
+    def drain_notifications(self) -> List[ShellJob]:
+        """Background jobs that finished since the last call"""
+        with self._changed:
+            finished = list(self._notifications)
+            self._notifications.clear()
+        return finished
+
+    def shutdown(self) -> None:
+        """Kill whatever is still running (F.R.A.N.K.I.E. is exiting)"""
+        with self._changed:
+            running = [job for job in self._jobs if not job.done]
+        for job in running:
+            job.cancel_level = len(CANCEL_SIGNALS)
+            self._signal(job, CANCEL_SIGNALS[-1])
+
+
+_runner: Optional[ShellRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_shell_runner() -> ShellRunner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = ShellRunner()
+            atexit.register(_runner.shutdown)
+        return _runner
@@ -0,0 +1,166 @@
+"""
+Standard Strands hooks for F.R.A.N.K.I.E. agents
+
+Every agent (the orchestrator and each sub-agent) is built with
+`hooks=agent_hooks("<name>")`. Its LifecycleHooks publish turns, model calls
+and tool calls on the event bus (see event_bus.py), where tracing, usage
+accounting and the CLI's progress rows consume them, so all agents are
+observed the same way.
+Agents running under an adaptive budget pass their decision so its outcome
+is fed back to the budget policy. When FRANKIE_MODEL_MODE records or replays,
+third-party tool calls are recorded or stubbed too; live agents that read
+files get the session file-read cache instead.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from strands.hooks import (
+    AfterInvocationEvent,
+    AfterModelCallEvent,
+    AfterToolCallEvent,
+    BeforeInvocationEvent,
+    BeforeModelCallEvent,
+    BeforeToolCallEvent,
+    HookProvider,
+    HookRegistry,
+    MessageAddedEvent,
+)
+
+from .budget_policy import BudgetDecision, BudgetOutcomeHooks
+from .event_bus import (
+    BUS,
+    MacroStep,
+    ModelCallEnded,
+    ModelCallStarted,
+    OcrDone,
+    ToolEnded,
+    ToolStarted,
+    TurnEnded,
+    TurnStarted,
+    current_macro,
+)
+from .file_cache import CACHED_AGENTS, ENABLED as FILE_CACHE_ENABLED, FileReadCacheHooks
+from .model_replay import MODEL_MODE, ReplayToolHooks
+from .tracing import attach_tracer
+from .usage_metrics import attach_usage_recorder, reasoning_chars, usage_from_result
+
+DETAIL_CHARS = 60
+
+attach_tracer(BUS)
+attach_usage_recorder(BUS)
+
+
+def _input_detail(tool_input: Any) -> str:
+    """A short hint of what a tool call is about: its first string argument"""
+    if isinstance(tool_input, dict):
+        text = next((value for value in tool_input.values() if isinstance(value, str) and value.strip()), "")
+    else:
+        text = str(tool_input or "")
+    text = " ".join(text.split())
+    return text if len(text) <= DETAIL_CHARS else text[:DETAIL_CHARS - 1] + "…"
+
+
+def _last_user_text(messages) -> str:
+    for message in reversed(messages or []):
+        if message.get("role") == "user":
+            text = " ".join(block["text"] for block in message.get("content", []) if "text" in block)
+            if text:
+                return text[:200]
+    return ""
+
+
+def _error(exception: Optional[BaseException]) -> Optional[str]:
+    return f"{type(exception).__name__}: {exception}" if exception is not None else None
+
+
+class LifecycleHooks(HookProvider):
+    """Publishes an agent's turns, model calls and tool calls on the event bus"""
+
+    def __init__(self, agent_name: str, bus=BUS):
+        self.agent_name = agent_name
+        self.bus = bus
+        self._turns: Dict[int, float] = {}
+        self._reasoning_chars: Dict[int, int] = {}
+        self._model_calls: Dict[int, float] = {}
+        self._tool_calls: Dict[str, float] = {}
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(BeforeInvocationEvent, self._before_invocation)
+        registry.add_callback(MessageAddedEvent, self._message_added)
+        registry.add_callback(AfterInvocationEvent, self._after_invocation)
+        registry.add_callback(BeforeModelCallEvent, self._before_model)
+        registry.add_callback(AfterModelCallEvent, self._after_model)
+        registry.add_callback(BeforeToolCallEvent, self._before_tool)
+        registry.add_callback(AfterToolCallEvent, self._after_tool)
+
+    def _before_invocation(self, event: BeforeInvocationEvent) -> None:
+        key = id(event.agent)
+        self._turns[key] = time.perf_counter()
+        self._reasoning_chars[key] = 0
+        self.bus.publish(TurnStarted(self.agent_name, key, _last_user_text(getattr(event, "messages", None))))
+
+    def _message_added(self, event: MessageAddedEvent) -> None:
+        key = id(event.agent)
+        if key in self._reasoning_chars and event.message.get("role") == "assistant":
+            self._reasoning_chars[key] += reasoning_chars(event.message)
+
+    def _after_invocation(self, event: AfterInvocationEvent) -> None:
+        key = id(event.agent)
+        started = self._turns.pop(key, None)
+        # Bedrock bills thinking as output tokens without a separate count - estimate it from the text
+        thinking_tokens = self._reasoning_chars.pop(key, 0) // 4
+        if started is None:
+            return
+        self.bus.publish(TurnEnded(
+            self.agent_name, key, time.perf_counter() - started, ok=event.result is not None,
+            model_id=(getattr(event.agent.model, "config", None) or {}).get("model_id", ""),
+            usage=usage_from_result(event.result), thinking_tokens=thinking_tokens,
+        ))
+
+    def _before_model(self, event: BeforeModelCallEvent) -> None:
+        self._model_calls[id(event.agent)] = time.perf_counter()
+        self.bus.publish(ModelCallStarted(self.agent_name, id(event.agent)))
+
+    def _after_model(self, event: AfterModelCallEvent) -> None:
+        started = self._model_calls.pop(id(event.agent), None)
+        stop_reason = event.stop_response.stop_reason if event.stop_response is not None else None
+        self.bus.publish(ModelCallEnded(self.agent_name, id(event.agent),
+                                        time.perf_counter() - started if started is not None else 0.0,
+                                        stop_reason=stop_reason, error=_error(event.exception)))
+
+    def _before_tool(self, event: BeforeToolCallEvent) -> None:
+        tool_use_id = str(event.tool_use.get("toolUseId"))
+        self._tool_calls[tool_use_id] = time.perf_counter()
+        self.bus.publish(ToolStarted(self.agent_name, event.tool_use.get("name", "tool"), tool_use_id,
+                                     _input_detail(event.tool_use.get("input"))))
+
+    def _after_tool(self, event: AfterToolCallEvent) -> None:
+        tool_use_id = str(event.tool_use.get("toolUseId"))
+        started = self._tool_calls.pop(tool_use_id, None)
+        duration = time.perf_counter() - started if started is not None else 0.0
+        tool = event.tool_use.get("name", "tool")
+        status = (event.result or {}).get("status")
+        ok = event.exception is None and status != "error"
+        self.bus.publish(ToolEnded(self.agent_name, tool, tool_use_id, duration, ok,
+                                   status=status, error=_error(event.exception)))
+        tool_input = event.tool_use.get("input") or {}
+        action = tool_input.get("action", "") if isinstance(tool_input, dict) else ""
+        if tool == "use_computer" and action == "analyze_screen":
+            text_chars = sum(len(block.get("text", "")) for block in (event.result or {}).get("content", []))
+            self.bus.publish(OcrDone(self.agent_name, duration, ok, text_chars))
+        macro = current_macro()
+        if macro is not None:
+            macro.steps += 1
+            self.bus.publish(MacroStep(macro.name, macro.steps, tool, action, duration, ok))
+
+
+def agent_hooks(agent_name: str, decision: Optional[BudgetDecision] = None) -> List[HookProvider]:
+    hooks = [LifecycleHooks(agent_name)]
+    if decision is not None:
+        hooks.append(BudgetOutcomeHooks(decision))
+    if MODEL_MODE != "live":
+        hooks.append(ReplayToolHooks(agent_name))
+    elif FILE_CACHE_ENABLED and agent_name in CACHED_AGENTS:
+        hooks.append(FileReadCacheHooks(agent_name))
+    return hooks
@@ -0,0 +1,91 @@
+"""
+Sub-agent result envelope
+
+Sub-agent tools return a `SubAgentResult` instead of a decorated string.
+When the orchestrator calls the tool, Strands falls back to `str()` for the
+tool result, so the orchestrator only sees a budgeted summary with a
+reference to the full body. The full body is written once to the tool
+output store and fetched on demand, either with the `fetch_tool_output`
+tool or through `.body` when called from Python.
+"""
+
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from .output_store import OUTPUT_STORE
+from .usage_metrics import usage_from_result
+
+SUMMARY_BUDGET = int(os.getenv("FRANKIE_SUBAGENT_SUMMARY_CHARS", "2000"))
+
+
+def budget_text(text: str, budget: int = SUMMARY_BUDGET) -> str:
+    """Cut text to roughly `budget` characters, keeping the opening and the conclusion"""
+    if len(text) <= budget:
+        return text
+    head_budget = budget * 2 // 3
+    head = text[:head_budget]
+    # Prefer to stop at a paragraph or line break rather than mid-sentence
+    cut = max(head.rfind("\n\n"), head.rfind("\n"))
+    if cut > head_budget // 2:
+        head = head[:cut]
+    tail = text[-(budget - len(head)):]
+    newline = tail.find("\n")
+    if 0 <= newline < len(tail) // 2:
+        tail = tail[newline + 1:]
+    return f"{head.rstrip()}\n\n[... {len(text) - len(head) - len(tail)} characters omitted ...]\n\n{tail.lstrip()}"
+
+
+@dataclass
+class SubAgentResult:
+    """Structured result of one sub-agent run"""
+    agent: str
+    status: str
+    summary: str
+    body_ref: Optional[str] = None
+    body_chars: int = 0
+    duration_s: float = 0.0
+    usage: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(cls, agent: str, response, started: float, budget: int = SUMMARY_BUDGET) -> "SubAgentResult":
+        """Build a result from a Strands AgentResult (or plain text), storing the full body once"""
+        text = str(response).strip()
+        duration = time.perf_counter() - started
+        usage = usage_from_result(response)
+        if not text:
+            return cls.error(agent, f"No response received from the {agent} agent", started, usage=usage)
+        body_ref = OUTPUT_STORE.put(text) if len(text) > budget else None
+        return cls(agent, "success", budget_text(text, budget), body_ref, len(text), duration, usage)
+
+    @classmethod
+    def error(cls, agent: str, message: str, started: float, usage: Optional[Dict[str, int]] = None) -> "SubAgentResult":
+        return cls(agent, "error", message, None, len(message), time.perf_counter() - started, usage or {})
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "success"
+
+    @property
+    def body(self) -> str:
+        """The complete output, loaded from the store when it was too large to inline"""
+        if self.body_ref is None:
+            return self.summary
+        return OUTPUT_STORE.get(self.body_ref) or self.summary
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        if self.body_ref is None:
+            return self.summary
+        return (
+            f"{self.summary}\n\n[Summary of {self.body_chars} characters from the {self.agent} agent - "
+            f"call fetch_tool_output(ref='{self.body_ref}') for the full output]"
+        )
+
+
+def full_text(result) -> str:
+    """Complete text of any agent result, for display or for handing to another agent in full"""
+    return result.body if isinstance(result, SubAgentResult) else str(result)
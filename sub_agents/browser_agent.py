@@ -6,12 +6,17 @@ import argparse
 from strands import tool
 
 
-from botocore.config import Config
 from strands import Agent
-from strands.models import BedrockModel
 from strands_tools import http_request, speak, use_browser, memory 
 import sys
 import os
+import time
+from .agent_result import SubAgentResult
+from .agent_hooks import agent_hooks
+from .budget_policy import BUDGET_POLICY
+from .model_factory import build_model
+from .model_tiers import tiered_model
+from .event_bus import report_status
 
 # Configure logging to reduce noise while keeping errors
 logging.basicConfig(
@@ -28,21 +33,8 @@ logging.getLogger('boto3').setLevel(logging.WARNING)
 logging.getLogger('botocore').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
-model = BedrockModel(
-    model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", max_tokens=10000, # max 65536 ---> suggested
-    boto_client_config=Config(
-        read_timeout=900,
-        connect_timeout=900,
-        retries=dict(max_attempts=3, mode="adaptive"),
-    ),
-    additional_request_fields={
-        "anthropic_beta": ["interleaved-thinking-2025-05-14"],  # Enable computer use beta
-        "thinking": {
-            "type": os.getenv("STRANDS_THINKING_TYPE", "enabled"),
-            "budget_tokens": int(os.getenv("STRANDS_BUDGET_TOKENS", "2048")),
-        },
-    },
-)
+# Default model for interactive use; tool calls size the thinking budget per request
+model = build_model("browser")
 
 system_prompt = """
 You are an advanced Browser AI Agent with web automation capabilities. You execute web tasks with precision and reliability, following these core principles:
@@ -107,7 +99,7 @@ Priority: Accuracy and reliability over speed. Always verify before acting.
     
 
 @tool
-def use_browser_agent(query: str) -> str:
+def use_browser_agent(query: str) -> SubAgentResult:
     """
     Process and execute web browsing tasks using an automated browser agent.
     
@@ -122,13 +114,13 @@ def use_browser_agent(query: str) -> str:
             - Element interaction
             
     Returns:
-        A detailed response describing the executed actions, results, and any relevant
-        extracted information. In case of errors, returns explanatory error messages
-        with suggested alternatives.
+        A summary of the executed actions, results, and any relevant extracted
+        information, with a reference to the full output. In case of errors,
+        returns explanatory error messages with suggested alternatives.
     """
+    started = time.perf_counter()
     # Format the query for the math agent with clear instructions
     os.environ["BYPASS_TOOL_CONSENT"] = "true"
-    print("routed to browser agent")
     formatted_query = f"""
     Please help me with the following web automation task. Remember to:
     1. Analyze the page structure before interactions
@@ -140,23 +132,20 @@ def use_browser_agent(query: str) -> str:
     """
     
     try:
-        print("Executing Browser Automation Task")
+        report_status("🌐 Browser Agent: executing browser automation task")
         # Create the math agent with calculator capability
+        decision = BUDGET_POLICY.decide("browser", query)
         browser_agent = Agent(
             system_prompt=system_prompt,
-            model=model,
+            model=tiered_model("browser", build_model("browser", decision), decision=decision),
             tools=[use_browser, http_request, memory],
+            hooks=agent_hooks("browser", decision),
         )
         agent_response = browser_agent(formatted_query)
-        text_response = str(agent_response)
-
-        if len(text_response) > 0:
-            return f"\n🌐 BROWSER AGENT RESPONSE 🌐\n{'='*50}\n{text_response}\n{'='*50}"
-
-        return "\033[1;31m❌ Error: No response received from the browser automation task\033[0m"
+        return SubAgentResult.from_response("browser", agent_response, started)
     except Exception as e:
         # Return specific error message for math processing
-        return f"Browser Automation Error: {str(e)}\nPlease check your request and try again."
+        return SubAgentResult.error("browser", f"Browser Automation Error: {str(e)}\nPlease check your request and try again.", started)
 
 
 def start_research(agent):
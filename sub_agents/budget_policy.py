@@ -0,0 +1,275 @@
+"""
+Adaptive thinking-budget and max_tokens policy
+
+Instead of one fixed thinking budget and max_tokens per sub-agent, every
+request gets a `BudgetDecision` sized to the query:
+
+    simple    "open music", "take a screenshot"     → thinking off, small max_tokens
+    moderate  short single-goal tasks               → minimum thinking budget
+    complex   research, multi-step, code review     → full thinking budget and max_tokens
+
+The complexity tier comes from cheap query features (length, step markers,
+complexity/simple keywords, code). Historical outcomes then adjust it:
+output sizes seen per agent and tier raise max_tokens, and requests that hit
+max_tokens escalate the tier next time. Everything stays within per-agent
+bounds configured through the environment, and every decision is logged.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, Optional
+
+from strands.hooks import AfterInvocationEvent, AfterModelCallEvent, HookProvider, HookRegistry
+
+from .frankie_home import frankie_path
+from .session_context import current_session_id
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_BUDGET = os.getenv("FRANKIE_ADAPTIVE_BUDGET", "1") != "0"
+DECISION_LOG = os.getenv("FRANKIE_BUDGET_LOG", frankie_path("budget_decisions.jsonl"))
+OUTCOMES_FILE = frankie_path("budget_outcomes.json")
+
+# Anthropic requires at least 1024 thinking tokens when extended thinking is enabled
+MIN_THINKING_BUDGET = 1024
+TIERS = ("simple", "moderate", "complex")
+OUTCOME_WINDOW = 50
+
+COMPLEX_HINTS = (
+    "research", "analy", "compare", "investigat", "refactor", "debug", "design", "architect", "plan ",
+    "comprehensive", "step by step", "explain why", "review", "optimi", "summar", "implement", "migrate",
+    "find all", "extract", "document",
+)
+SIMPLE_HINTS = (
+    "open ", "play ", "launch", "close ", "click", "screenshot", "scroll", "go to", "navigate to",
+    "what time", "show me", "start ", "stop ", "type ",
+)
+STEP_MARKERS = re.compile(r"\bthen\b|\bafter that\b|\bnext\b|\bfinally\b|;|\n\s*(?:\d+[.)]|[-*•])\s", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class BudgetBounds:
+    """Configured limits for one agent"""
+    max_tokens_cap: int
+    thinking_cap: int
+    simple_max_tokens: int = 4096
+
+    @classmethod
+    def from_env(cls, agent: str, max_tokens_cap: int) -> "BudgetBounds":
+        prefix = f"FRANKIE_{agent.upper()}"
+        thinking_cap = int(os.getenv(f"{prefix}_THINKING_MAX", os.getenv("STRANDS_BUDGET_TOKENS", "2048")))
+        if os.getenv("STRANDS_THINKING_TYPE", "enabled") != "enabled":
+            thinking_cap = 0
+        return cls(
+            max_tokens_cap=int(os.getenv(f"{prefix}_MAX_TOKENS", str(max_tokens_cap))),
+            thinking_cap=thinking_cap,
+            simple_max_tokens=int(os.getenv(f"{prefix}_SIMPLE_MAX_TOKENS", "4096")),
+        )
+
+
+# Caps match the limits each agent was previously hard-coded to
+AGENT_BOUNDS = {
+    "browser": BudgetBounds.from_env("browser", 10000),
+    "coding": BudgetBounds.from_env("coding", 10000),
+    "computer": BudgetBounds.from_env("computer", 65536),
+}
+
+
+@dataclass
+class BudgetDecision:
+    """Thinking budget and max_tokens chosen for one request"""
+    agent: str
+    tier: str
+    thinking_budget: int
+    max_tokens: int
+    score: float
+    reason: str
+    features: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def thinking_enabled(self) -> bool:
+        return self.thinking_budget >= MIN_THINKING_BUDGET
+
+
+def query_features(query: str) -> Dict[str, float]:
+    """Cheap complexity features of a request"""
+    lowered = query.lower()
+    return {
+        "words": len(query.split()),
+        "steps": len(STEP_MARKERS.findall(query)),
+        "complex_hints": sum(1 for hint in COMPLEX_HINTS if hint in lowered),
+        "simple_hints": sum(1 for hint in SIMPLE_HINTS if hint in lowered),
+        "code": int("```" in query or bool(re.search(r"\bdef |\bclass |\w+\.\w{1,4}\b|[{};]\s*$", query, re.M))),
+    }
+
+
+def complexity_score(features: Dict[str, float]) -> float:
+    return (
+        features["words"] / 25
+        + 1.5 * features["steps"]
+        + 2.0 * features["complex_hints"]
+        + 1.0 * features["code"]
+        - 1.5 * features["simple_hints"]
+    )
+
+
+def _round_up(value: float, step: int = 1024) -> int:
+    return int(math.ceil(value / step) * step)
+
+
+class BudgetPolicy:
+    """Chooses per-request budgets and learns from their outcomes"""
+
+    def __init__(self, bounds: Dict[str, BudgetBounds] = None, outcomes_path: Optional[str] = OUTCOMES_FILE,
+                 decision_log: Optional[str] = DECISION_LOG, adaptive: bool = ADAPTIVE_BUDGET):
+        self.bounds = bounds or AGENT_BOUNDS
+        self.outcomes_path = outcomes_path
+        self.decision_log = decision_log
+        self.adaptive = adaptive
+        self._lock = threading.Lock()
+        self._output_tokens: Dict[str, Deque[int]] = {}
+        self._truncations: Dict[str, Deque[int]] = {}
+        self._load_outcomes()
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def decide(self, agent: str, query: str) -> BudgetDecision:
+        bounds = self.bounds[agent]
+        features = query_features(query)
+        score = complexity_score(features)
+
+        if not self.adaptive:
+            decision = BudgetDecision(agent, "complex", bounds.thinking_cap, bounds.max_tokens_cap, score,
+                                      "adaptive budgets disabled", features)
+            self._log(decision)
+            return decision
+
+        tier_index = 0 if score < 1.0 else 1 if score < 3.0 else 2
+        reason = f"complexity score {score:.1f}"
+        with self._lock:
+            truncations = self._truncations.get(f"{agent}:{TIERS[tier_index]}")
+            if truncations and sum(truncations) and tier_index < 2:
+                tier_index += 1
+                reason += f"; escalated after {sum(truncations)} max_tokens stop(s)"
+        tier = TIERS[tier_index]
+
+        thinking = {
+            "simple": 0,
+            "moderate": min(bounds.thinking_cap, MIN_THINKING_BUDGET),
+            "complex": bounds.thinking_cap,
+        }[tier]
+        if thinking < MIN_THINKING_BUDGET:
+            thinking = 0
+        max_tokens = {
+            "simple": bounds.simple_max_tokens,
+            "moderate": max(bounds.simple_max_tokens * 2, bounds.max_tokens_cap // 2),
+            "complex": bounds.max_tokens_cap,
+        }[tier]
+
+        # Leave room for the largest outputs this agent has produced at this tier
+        observed = self._observed_p95(f"{agent}:{tier}")
+        if observed and observed * 1.25 + thinking > max_tokens:
+            max_tokens = _round_up(observed * 1.25 + thinking)
+            reason += f"; raised max_tokens for p95 output {observed}"
+
+        # max_tokens must exceed the thinking budget and stay within the cap
+        max_tokens = min(bounds.max_tokens_cap, max(max_tokens, thinking + 1024))
+        decision = BudgetDecision(agent, tier, thinking, max_tokens, round(score, 2), reason, features)
+        self._log(decision)
+        return decision
+
+    def _log(self, decision: BudgetDecision) -> None:
+        logger.info("budget | agent=%s tier=%s thinking=%d max_tokens=%d | %s", decision.agent, decision.tier,
+                    decision.thinking_budget, decision.max_tokens, decision.reason)
+        if not self.decision_log:
+            return
+        record = {"ts": time.time(), "session_id": current_session_id(), **asdict(decision)}
+        try:
+            with self._lock, open(self.decision_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Outcomes
+    # ------------------------------------------------------------------
+
+    def record_outcome(self, decision: BudgetDecision, output_tokens: int, truncated: bool) -> None:
+        key = f"{decision.agent}:{decision.tier}"
+        with self._lock:
+            self._output_tokens.setdefault(key, deque(maxlen=OUTCOME_WINDOW)).append(int(output_tokens))
+            self._truncations.setdefault(key, deque(maxlen=OUTCOME_WINDOW // 2)).append(int(truncated))
+            self._save_outcomes()
+
+    def _observed_p95(self, key: str) -> int:
+        with self._lock:
+            values = sorted(self._output_tokens.get(key, ()))
+        if len(values) < 5:
+            return 0
+        return values[max(0, math.ceil(0.95 * len(values)) - 1)]
+
+    def _load_outcomes(self) -> None:
+        if not self.outcomes_path or not os.path.exists(self.outcomes_path):
+            return
+        try:
+            with open(self.outcomes_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        for key, values in data.get("output_tokens", {}).items():
+            self._output_tokens[key] = deque(values, maxlen=OUTCOME_WINDOW)
+        for key, values in data.get("truncations", {}).items():
+            self._truncations[key] = deque(values, maxlen=OUTCOME_WINDOW // 2)
+
+    def _save_outcomes(self) -> None:
+        # Called with the lock held
+        if not self.outcomes_path:
+            return
+        data = {
+            "output_tokens": {key: list(values) for key, values in self._output_tokens.items()},
+            "truncations": {key: list(values) for key, values in self._truncations.items()},
+        }
+        temp_path = f"{self.outcomes_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.outcomes_path)
+        except OSError:
+            pass
+
+
+BUDGET_POLICY = BudgetPolicy()
+
+
+class BudgetOutcomeHooks(HookProvider):
+    """Feeds the outcome of a budgeted invocation (output size, max_tokens stops) back to the policy"""
+
+    def __init__(self, decision: BudgetDecision, policy: BudgetPolicy = BUDGET_POLICY):
+        self.decision = decision
+        self.policy = policy
+        self._truncated = False
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(AfterModelCallEvent, self._after_model)
+        registry.add_callback(AfterInvocationEvent, self._after_invocation)
+
+    def _after_model(self, event: AfterModelCallEvent) -> None:
+        if event.stop_response is not None and event.stop_response.stop_reason == "max_tokens":
+            self._truncated = True
+
+    def _after_invocation(self, event: AfterInvocationEvent) -> None:
+        # max_tokens caps each model call, so learn from the largest single call rather than the total
+        invocation = event.agent.event_loop_metrics.latest_agent_invocation
+        cycles = invocation.cycles if invocation is not None else []
+        output_tokens = max((cycle.usage.get("outputTokens", 0) for cycle in cycles), default=0)
+        self.policy.record_outcome(self.decision, output_tokens, self._truncated)
+        self._truncated = False
@@ -0,0 +1,690 @@
+"""
+Local code index for the Coding Buddy Agent
+
+Finding code with file_read, shell (grep/find) and editor costs a model round
+trip per step, and on a large checkout the model needs many steps. This
+module keeps a per-repository index so one `code_search` call returns ranked
+snippets:
+
+    symbols    definitions (classes, functions, methods, types, constants)
+               found with per-language line patterns
+    trigrams   for every file, the set of 3-byte sequences in it (ASCII lowercased),
+               stored as posting lists (trigram -> file ids) written in
+               batches. A query only scans the files containing all of its
+               trigrams, then verifies the match line by line.
+    refresh    incremental: files are re-read only when their mtime or size
+               changed, and re-indexed only when their content hash changed.
+               Changed and deleted files get new ids, so their old postings
+               match nothing until the lists are compacted, which happens
+               once enough files went stale or enough batches piled up
+               since the last compaction. Searches refresh
+               at most every FRANKIE_CODE_INDEX_TTL seconds.
+
+The index for a repository lives in FRANKIE_HOME/code_index/<root hash>.sqlite3.
+The repository root is the enclosing git checkout, or the working directory.
+
+Benchmark indexing throughput on a checkout:
+    python -m sub_agents.code_index /path/to/checkout [--rebuild] [--query NAME ...]
+
+Configuration:
+    FRANKIE_CODE_INDEX_TTL        seconds between automatic refreshes (default 10)
+    FRANKIE_CODE_INDEX_MAX_FILES  files indexed per repository (default 50000)
+    FRANKIE_CODE_INDEX_MAX_KB     larger files are skipped (default 1024)
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from strands import tool
+
+from .frankie_home import frankie_path
+
+REFRESH_TTL = float(os.getenv("FRANKIE_CODE_INDEX_TTL", "10"))
+MAX_FILES = int(os.getenv("FRANKIE_CODE_INDEX_MAX_FILES", "50000"))
+MAX_FILE_BYTES = int(float(os.getenv("FRANKIE_CODE_INDEX_MAX_KB", "1024")) * 1024)
+
+SKIP_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv", "env", ".tox", ".nox",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", "dist", "build", "target", ".idea", ".vscode",
+    ".next", ".gradle", "coverage", ".eggs", "site-packages",
+}
+SKIP_SUFFIXES = (
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf", ".zip", ".gz", ".tar", ".whl", ".so", ".dylib",
+    ".dll", ".exe", ".class", ".jar", ".pyc", ".o", ".a", ".bin", ".lock", ".min.js", ".map", ".svg",
+    ".woff", ".woff2", ".ttf", ".mp3", ".mp4", ".mov", ".sqlite3", ".db",
+)
+
+# Definitions in languages without a parser here: (extensions, kind, pattern with a "name" group)
+SYMBOL_PATTERNS = [
+    ((".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"), "function",
+     r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(?P<name>[A-Za-z_$][\w$]*)"),
+    ((".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"), "function",
+     r"^\s*(?:export\s+)?(?:const|let|var)\s+(?P<name>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>|[A-Za-z_$][\w$]*\s*=>)"),
+    ((".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"), "class",
+     r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(?P<name>[A-Za-z_$][\w$]*)"),
+    ((".ts", ".tsx"), "type", r"^\s*(?:export\s+)?(?:interface|type|enum)\s+(?P<name>[A-Za-z_$][\w$]*)"),
+    ((".go",), "function", r"^func\s+(?:\([^)]*\)\s*)?(?P<name>[A-Za-z_]\w*)"),
+    ((".go",), "type", r"^type\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".rs",), "function", r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".rs",), "type", r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait|type|mod)\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".java", ".kt", ".cs", ".scala", ".swift"), "class",
+     r"^\s*(?:(?:public|private|protected|internal|abstract|final|sealed|static|data|open)\s+)*"
+     r"(?:class|interface|enum|record|object|struct|protocol)\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".java", ".cs"), "method",
+     r"^\s*(?:(?:public|private|protected|internal|static|final|abstract|synchronized|async|override|virtual)\s+)+"
+     r"[\w<>\[\],.?\s]+?\s+(?P<name>[A-Za-z_]\w*)\s*\("),
+    ((".kt", ".swift", ".scala"), "function", r"^\s*(?:[a-z]+\s+)*(?:fun|func|def)\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".rb",), "function", r"^\s*def\s+(?:self\.)?(?P<name>[A-Za-z_]\w*[?!=]?)"),
+    ((".rb",), "class", r"^\s*(?:class|module)\s+(?P<name>[A-Z]\w*)"),
+    ((".c", ".h", ".cc", ".cpp", ".hpp", ".cxx"), "function",
+     r"^(?:[A-Za-z_][\w\s\*&:<>,]*?[\s\*&])(?P<name>[A-Za-z_][\w:~]*)\s*\([^;]*$"),
+    ((".c", ".h", ".cc", ".cpp", ".hpp", ".cxx"), "type",
+     r"^\s*(?:typedef\s+)?(?:struct|class|enum|union)\s+(?P<name>[A-Za-z_]\w*)"),
+    ((".sh", ".bash", ".zsh"), "function", r"^\s*(?:function\s+)?(?P<name>[A-Za-z_][\w-]*)\s*\(\)\s*\{?"),
+]
+_COMPILED_PATTERNS = [(exts, kind, re.compile(pattern)) for exts, kind, pattern in SYMBOL_PATTERNS]
+PYTHON_DEFINITION = re.compile(r"^(?P<indent>[ \t]*)(?:async[ \t]+)?(?P<keyword>def|class)[ \t]+(?P<name>\w+)")
+PYTHON_CONSTANT = re.compile(r"^(?P<name>[A-Z][A-Z0-9_]*)\s*(?::[^=]+)?=(?!=)")
+
+# Postings buffered before they are written as one row per trigram
+BATCH_POSTINGS = 2_000_000
+# Deleted or changed files whose postings are left behind before the lists are rebuilt
+STALE_COMPACT_MIN = 1000
+# Batches written since the last rebuild before the lists are rebuilt anyway: every refresh that
+# changes a file adds a row per trigram, and each row is one more read per candidate lookup
+COMPACT_BATCHES = 32
+
+CONTEXT_LINES = 2
+MAX_SNIPPETS_PER_FILE = 3
+
+
+def find_repo_root(start: Optional[str] = None) -> str:
+    """The enclosing git checkout of `start` (default: the working directory), or `start` itself"""
+    start = os.path.abspath(start or os.getcwd())
+    path = start
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return start
+        path = parent
+
+
+def trigrams(data: bytes) -> Set[int]:
+    """Lowercase 3-byte sequences of some text, as 24-bit integers"""
+    data = data.lower()
+    return {(a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))}
+
+
+class _PostingBatch:
+    """Trigram -> file ids for files indexed since the last flush"""
+
+    def __init__(self):
+        self.postings: Dict[int, array] = {}
+        self.size = 0
+
+    @property
+    def full(self) -> bool:
+        return self.size >= BATCH_POSTINGS
+
+    def add(self, file_id: int, grams: array) -> None:
+        postings = self.postings
+        for tri in grams:
+            ids = postings.get(tri)
+            if ids is None:
+                postings[tri] = array("I", (file_id,))
+            else:
+                ids.append(file_id)
+        self.size += len(grams)
+
+    def clear(self) -> None:
+        self.postings = {}
+        self.size = 0
+
+
+def python_symbols(source: str) -> List[Tuple[str, str, int, str]]:
+    """(name, kind, line, signature) for classes, functions, methods and module constants
+
+    Definitions are found line by line and nested by indentation - much cheaper than
+    parsing, and it still works on files with syntax errors.
+    """
+    symbols = []
+    scopes: List[Tuple[int, str, str]] = []  # (indent, qualified name, keyword) of enclosing definitions
+    for number, line in enumerate(source.splitlines(), start=1):
+        match = PYTHON_DEFINITION.match(line)
+        if match:
+            indent = len(match.group("indent").expandtabs())
+            while scopes and scopes[-1][0] >= indent:
+                scopes.pop()
+            parent = scopes[-1] if scopes else None
+            name = f"{parent[1]}.{match.group('name')}" if parent else match.group("name")
+            if match.group("keyword") == "class":
+                kind = "class"
+            else:
+                kind = "method" if parent and parent[2] == "class" else "function"
+            symbols.append((name, kind, number, line.strip()[:200]))
+            scopes.append((indent, name, match.group("keyword")))
+        elif line[:1].isupper():
+            match = PYTHON_CONSTANT.match(line)
+            if match:
+                symbols.append((match.group("name"), "constant", number, line.strip()[:200]))
+    return symbols
+
+
+def pattern_symbols(path: str, text: str) -> List[Tuple[str, str, int, str]]:
+    patterns = [(kind, pattern) for exts, kind, pattern in _COMPILED_PATTERNS if path.endswith(exts)]
+    if not patterns:
+        return []
+    symbols = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        for kind, pattern in patterns:
+            match = pattern.match(line)
+            if match and match.group("name") not in ("if", "for", "while", "switch", "return", "catch"):
+                symbols.append((match.group("name"), kind, number, line.strip()[:200]))
+                break
+    return symbols
+
+
+def extract_symbols(path: str, text: str) -> List[Tuple[str, str, int, str]]:
+    if path.endswith((".py", ".pyi")):
+        return python_symbols(text)
+    return pattern_symbols(path, text)
+
+
+def index_fragments(literal: str) -> List[str]:
+    """Pieces of a literal the trigram index can look up case-insensitively
+
+    File bytes are lowercased for ASCII only, so a non-ASCII letter with another
+    case ("É" vs "é") may be stored either way; the literal is split there.
+    """
+    pieces, current = [], ""
+    for char in literal:
+        if not char.isascii() and char.lower() != char.upper():
+            pieces.append(current)
+            current = ""
+        else:
+            current += char
+    pieces.append(current)
+    return [piece for piece in pieces if piece]
+
+
+def literal_fragments(pattern: str) -> List[str]:
+    """Literal runs every match of a regex must contain (none when it has alternation)"""
+    if "|" in pattern:
+        return []
+    fragments, current, i = [], "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped.isalnum():  # \d, \w, \b ... are classes, not literals
+                fragments.append(current)
+                current = ""
+            else:
+                current += escaped
+            i += 2
+            continue
+        if char in "?*{":
+            current = current[:-1]  # the previous character is optional
+            fragments.append(current)
+            current = ""
+            if char == "{":
+                # {m,n} is a quantifier, not text - resume after it
+                end = pattern.find("}", i)
+                i = end if end != -1 else len(pattern)
+        elif char == "(":
+            # Groups may be optional or repeated; skip them rather than reason about their contents
+            depth = 0
+            while i < len(pattern):
+                if pattern[i] == "\\":
+                    i += 1
+                elif pattern[i] == "(":
+                    depth += 1
+                elif pattern[i] == ")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i += 1
+            fragments.append(current)
+            current = ""
+        elif char in ".^$)[]+":
+            if char == "[":
+                end = pattern.find("]", i + 2)
+                i = end if end != -1 else len(pattern)
+            fragments.append(current)
+            current = "" if char != "+" else current[-1:]
+        else:
+            current += char
+        i += 1
+    fragments.append(current)
+    return [fragment for fragment in fragments if len(fragment) >= 3]
+
+
+@dataclass
+class Snippet:
+    start_line: int
+    lines: List[str]
+    match_lines: List[int]
+
+
+@dataclass
+class FileHit:
+    """Matches in one file, with a ranking score"""
+    path: str
+    score: float
+    matches: int
+    snippets: List[Snippet] = field(default_factory=list)
+
+
+@dataclass
+class SymbolHit:
+    path: str
+    name: str
+    kind: str
+    line: int
+    signature: str
+
+
+@dataclass
+class SearchResults:
+    query: str
+    symbols: List[SymbolHit]
+    files: List[FileHit]
+    candidates: int
+    total_files: int
+    duration_s: float
+
+    def format(self, max_files: int) -> str:
+        if not self.symbols and not self.files:
+            return f"No matches for '{self.query}' in {self.total_files} indexed files."
+        out = []
+        if self.symbols:
+            out.append("Definitions:")
+            out.extend(f"  {hit.path}:{hit.line}  {hit.kind} {hit.name}  {hit.signature}" for hit in self.symbols)
+        if self.files:
+            shown = self.files[:max_files]
+            total = sum(hit.matches for hit in self.files)
+            out.append(f"Matches: {total} in {len(self.files)} files (showing {len(shown)})")
+            for hit in shown:
+                out.append(f"{hit.path}  ({hit.matches} match{'es' if hit.matches != 1 else ''})")
+                for snippet in hit.snippets:
+                    for offset, line in enumerate(snippet.lines):
+                        number = snippet.start_line + offset
+                        marker = ">" if number in snippet.match_lines else " "
+                        out.append(f"{marker}{number:>6}: {line}")
+                    out.append("")
+        out.append(f"[{self.candidates} of {self.total_files} files scanned, {self.duration_s * 1000:.0f} ms]")
+        return "\n".join(out)
+
+
+class CodeIndex:
+    """Symbol table and trigram index of one source tree"""
+
+    def __init__(self, root: str, db_path: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+        self.db_path = db_path or frankie_path("code_index", f"{digest}.sqlite3")
+        self.last_refresh = 0.0
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT UNIQUE NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                sha1 TEXT NOT NULL,
+                grams BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                tri INTEGER NOT NULL,
+                batch INTEGER NOT NULL,
+                file_ids BLOB NOT NULL,
+                PRIMARY KEY (tri, batch)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS symbols (
+                file_id INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                lname TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                line INTEGER NOT NULL,
+                signature TEXT
+            );
+            CREATE INDEX IF NOT EXISTS symbols_name ON symbols (lname);
+            CREATE INDEX IF NOT EXISTS symbols_file ON symbols (file_id);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        """)
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Iterator[Tuple[str, os.stat_result]]:
+        count = 0
+        for directory, dirs, files in os.walk(self.root):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+            for name in sorted(files):
+                if name.endswith(SKIP_SUFFIXES):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if stat.st_size > MAX_FILE_BYTES or not os.path.isfile(path):
+                    continue
+                yield os.path.relpath(path, self.root), stat
+                count += 1
+                if count >= MAX_FILES:
+                    return
+
+    def _meta(self, key: str) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def refresh(self, force: bool = False) -> Dict[str, float]:
+        """Bring the index up to date with the tree; returns what changed and how long it took"""
+        with self._lock:
+            started = time.perf_counter()
+            stats = {"files": 0, "indexed": 0, "unchanged": 0, "touched": 0, "removed": 0, "bytes": 0}
+            known = {path: (file_id, mtime, size, sha1) for file_id, path, mtime, size, sha1
+                     in self._conn.execute("SELECT id, path, mtime, size, sha1 FROM files")}
+            seen = set()
+            batch = _PostingBatch()
+            with self._conn:
+                for rel_path, stat in self._walk():
+                    stats["files"] += 1
+                    seen.add(rel_path)
+                    previous = known.get(rel_path)
+                    if previous and not force and previous[1] == stat.st_mtime and previous[2] == stat.st_size:
+                        stats["unchanged"] += 1
+                        continue
+                    try:
+                        with open(os.path.join(self.root, rel_path), "rb") as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    if b"\0" in data[:8192]:
+                        continue  # binary
+                    sha1 = hashlib.sha1(data).hexdigest()
+                    if previous and not force and previous[3] == sha1:
+                        self._conn.execute("UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                                           (stat.st_mtime, stat.st_size, previous[0]))
+                        stats["touched"] += 1
+                        continue
+                    if previous:
+                        self._remove_file(previous[0])
+                    self._index_file(rel_path, data, stat, sha1, batch)
+                    stats["indexed"] += 1
+                    stats["bytes"] += len(data)
+                    if batch.full:
+                        self._flush(batch)
+                for rel_path in set(known) - seen:
+                    self._remove_file(known[rel_path][0])
+                    stats["removed"] += 1
+                self._flush(batch)
+                if self._meta("stale_files") > max(STALE_COMPACT_MIN, len(seen)) or \
+                        self._meta("next_batch") - self._meta("compacted_batch") > COMPACT_BATCHES:
+                    self._compact()
+            self.last_refresh = time.time()
+            stats["duration_s"] = time.perf_counter() - started
+            return stats
+
+    def _index_file(self, rel_path: str, data: bytes, stat: os.stat_result, sha1: str,
+                    batch: "_PostingBatch") -> None:
+        # Called inside the refresh transaction
+        grams = array("I", sorted(trigrams(data)))
+        cursor = self._conn.execute("INSERT INTO files (path, mtime, size, sha1, grams) VALUES (?, ?, ?, ?, ?)",
+                                    (rel_path, stat.st_mtime, stat.st_size, sha1, grams.tobytes()))
+        batch.add(cursor.lastrowid, grams)
+        text = data.decode("utf-8", errors="replace")
+        self._conn.executemany(
+            "INSERT INTO symbols (file_id, name, lname, kind, line, signature) VALUES (?, ?, ?, ?, ?, ?)",
+            ((cursor.lastrowid, name, name.rsplit(".", 1)[-1].lower(), kind, line, signature)
+             for name, kind, line, signature in extract_symbols(rel_path, text)),
+        )
+
+    def _flush(self, batch: "_PostingBatch") -> None:
+        """Write a batch's posting lists as one row per trigram"""
+        if not batch.postings:
+            return
+        batch_id = self._meta("next_batch") + 1
+        self._set_meta("next_batch", batch_id)
+        self._conn.executemany("INSERT INTO postings (tri, batch, file_ids) VALUES (?, ?, ?)",
+                               ((tri, batch_id, ids.tobytes()) for tri, ids in sorted(batch.postings.items())))
+        batch.clear()
+
+    def _remove_file(self, file_id: int) -> None:
+        # Its postings stay behind until the next compaction; file ids are never reused, so they match nothing
+        self._conn.execute("DELETE FROM symbols WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self._set_meta("stale_files", self._meta("stale_files") + 1)
+
+    def _compact(self) -> None:
+        """Rebuild the posting lists from the live files' trigram lists, dropping stale entries"""
+        self._conn.execute("DELETE FROM postings")
+        batch = _PostingBatch()
+        for file_id, blob in self._conn.execute("SELECT id, grams FROM files ORDER BY id").fetchall():
+            grams = array("I")
+            grams.frombytes(blob)
+            batch.add(file_id, grams)
+            if batch.full:
+                self._flush(batch)
+        self._flush(batch)
+        self._set_meta("stale_files", 0)
+        self._set_meta("compacted_batch", self._meta("next_batch"))
+
+    def refresh_if_stale(self) -> None:
+        if time.time() - self.last_refresh > REFRESH_TTL:
+            self.refresh()
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+
+    def _candidate_files(self, required: List[str]) -> List[Tuple[int, str]]:
+        """Files containing every trigram of every required literal"""
+        grams = set()
+        for literal in required:
+            grams |= trigrams(literal.encode("utf-8"))
+        if not grams:
+            return list(self._conn.execute("SELECT id, path FROM files"))
+        per_gram: Dict[int, Set[int]] = {gram: set() for gram in grams}
+        placeholders = ",".join("?" * len(grams))
+        for tri, blob in self._conn.execute(f"SELECT tri, file_ids FROM postings WHERE tri IN ({placeholders})",
+                                            tuple(grams)):
+            ids = array("I")
+            ids.frombytes(blob)
+            per_gram[tri].update(ids)
+        ordered = sorted(per_gram.values(), key=len)
+        matching = set.intersection(*ordered) if ordered else set()
+        candidates = []
+        ids = sorted(matching)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            candidates.extend(self._conn.execute(
+                f"SELECT id, path FROM files WHERE id IN ({','.join('?' * len(chunk))})", chunk))
+        return candidates
+
+    def find_symbols(self, name: str, limit: int = 10) -> List[SymbolHit]:
+        """Definitions named like `name`: exact matches first, then prefix, then substring"""
+        needle = name.rsplit(".", 1)[-1].lower()
+        if not re.fullmatch(r"[\w$?!=~]+", needle):
+            return []
+        rows = self._conn.execute(
+            "SELECT f.path, s.name, s.kind, s.line, s.signature, s.lname FROM symbols s JOIN files f ON f.id = s.file_id "
+            "WHERE s.lname LIKE ? ESCAPE '\\' LIMIT 500",
+            ("%" + needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%",),
+        ).fetchall()
+        rank = lambda row: (row[5] != needle, not row[5].startswith(needle), len(row[5]), row[0], row[3])
+        return [SymbolHit(path, full_name, kind, line, signature or "")
+                for path, full_name, kind, line, signature, _ in sorted(rows, key=rank)[:limit]]
+
+    def search(self, query: str, regex: bool = False, path_filter: Optional[str] = None,
+               max_files: int = 20) -> SearchResults:
+        """Ranked definitions and matching snippets for a literal (case-insensitive) or regex query"""
+        started = time.perf_counter()
+        with self._lock:
+            self.refresh_if_stale()
+            total_files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            pattern = re.compile(query if regex else re.escape(query), re.IGNORECASE)
+            # Lowercasing happens on the bytes, as for the files (str.lower would also turn \D into \d)
+            literals = literal_fragments(query) if regex else [query]
+            required = [piece for literal in literals for piece in index_fragments(literal)]
+            candidates = self._candidate_files(required)
+            symbols = [] if regex else self.find_symbols(query)
+        if path_filter:
+            candidates = [(file_id, path) for file_id, path in candidates if path_filter in path]
+            symbols = [hit for hit in symbols if path_filter in hit.path]
+
+        word = re.compile(r"\b" + pattern.pattern + r"\b", re.IGNORECASE) if not regex else None
+        definition_lines = {(hit.path, hit.line) for hit in symbols}
+        hits = []
+        for _, rel_path in candidates:
+            hit = self._scan_file(rel_path, pattern, word, definition_lines)
+            if hit is not None:
+                hits.append(hit)
+        hits.sort(key=lambda hit: (-hit.score, hit.path))
+        return SearchResults(query, symbols, hits, len(candidates), total_files, time.perf_counter() - started)
+
+    def _scan_file(self, rel_path: str, pattern: "re.Pattern", word: Optional["re.Pattern"],
+                   definition_lines: Set[Tuple[str, int]]) -> Optional[FileHit]:
+        try:
+            with open(os.path.join(self.root, rel_path), "r", encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        matched = [number for number, line in enumerate(lines, start=1) if pattern.search(line)]
+        if not matched:
+            return None
+
+        score = 0.0
+        for number in matched:
+            line = lines[number - 1]
+            score += 1.0
+            if word is not None and word.search(line):
+                score += 1.0
+            if (rel_path, number) in definition_lines:
+                score += 5.0
+        score = score / (1 + 0.05 * len(matched))  # many matches help, with diminishing returns
+        name = os.path.basename(rel_path).lower()
+        if pattern.search(name):
+            score += 3.0
+        if re.search(r"(^|/)(tests?|spec|vendor|third_party|fixtures?)/|_test\.|\.test\.|test_", rel_path):
+            score *= 0.7
+
+        snippets: List[Snippet] = []
+        for number in matched:
+            if snippets and number <= snippets[-1].start_line + len(snippets[-1].lines) + CONTEXT_LINES:
+                snippet = snippets[-1]
+                end = min(len(lines), number + CONTEXT_LINES)
+                snippet.lines = lines[snippet.start_line - 1:end]
+                snippet.match_lines.append(number)
+                continue
+            if len(snippets) >= MAX_SNIPPETS_PER_FILE:
+                break
+            start = max(1, number - CONTEXT_LINES)
+            end = min(len(lines), number + CONTEXT_LINES)
+            snippets.append(Snippet(start, lines[start - 1:end], [number]))
+        for snippet in snippets:
+            snippet.lines = [line if len(line) <= 240 else line[:240] + " ..." for line in snippet.lines]
+        return FileHit(rel_path, score, len(matched), snippets)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "files": self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+                "symbols": self._conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0],
+                "posting_lists": self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0],
+            }
+
+
+_indexes: Dict[str, CodeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_code_index(root: Optional[str] = None) -> CodeIndex:
+    """Process-wide index of a repository (default: the one containing the working directory)"""
+    root = find_repo_root(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = CodeIndex(root)
+        return index
+
+
+def prewarm_code_index() -> None:
+    """Refresh the current checkout's index in the background; only inside a git checkout"""
+    root = find_repo_root()
+    if not os.path.exists(os.path.join(root, ".git")):
+        return
+    index = get_code_index(root)
+    if time.time() - index.last_refresh > REFRESH_TTL:
+        threading.Thread(target=index.refresh_if_stale, name="code-index-refresh", daemon=True).start()
+
+
+@tool
+def code_search(query: str, regex: bool = False, path_filter: str = None, max_files: int = 10) -> str:
+    """Search the current repository's code index for definitions and text in one call.
+
+    Use this before reading files or running grep/find: it returns ranked definitions
+    (classes, functions, methods, constants) and matching snippets with line numbers.
+    The index is refreshed automatically when files change.
+
+    Args:
+        query: Identifier or text to find (case-insensitive), or a regular expression when regex is true
+        regex: Treat query as a Python regular expression
+        path_filter: Only search files whose path contains this string (e.g. "src/api" or ".py")
+        max_files: Maximum number of files to show snippets for
+
+    Returns:
+        Matching definitions as path:line, then per-file snippets with matching lines marked ">"
+    """
+    try:
+        results = get_code_index().search(query, regex=regex, path_filter=path_filter, max_files=max_files)
+    except re.error as e:
+        return f"Invalid regular expression: {str(e)}"
+    return results.format(max_files)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index a checkout and report indexing and search throughput")
+    parser.add_argument("root", nargs="?", default=".", help="Checkout to index (default: current directory)")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every file instead of only changed ones")
+    parser.add_argument("--db", help="Index database path (default: a temporary file)")
+    parser.add_argument("--query", action="append", default=[], help="Query to time after indexing (repeatable)")
+    args = parser.parse_args()
+
+    import tempfile
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="frankie-code-index-"), "index.sqlite3")
+    index = CodeIndex(os.path.abspath(args.root), db_path)
+
+    first = index.refresh(force=args.rebuild)
+    mb = first["bytes"] / (1024 * 1024)
+    print(f"📚 Indexed {first['indexed']} of {first['files']} files ({mb:.1f} MB) in {first['duration_s']:.2f}s - "
+          f"{first['indexed'] / max(first['duration_s'], 1e-9):.0f} files/s, {mb / max(first['duration_s'], 1e-9):.1f} MB/s")
+    second = index.refresh()
+    print(f"🔁 No-change refresh: {second['files']} files checked in {second['duration_s'] * 1000:.0f} ms")
+    stats = index.stats()
+    print(f"🗂️  {stats['files']} files, {stats['symbols']} symbols, {stats['posting_lists']} posting lists, "
+          f"{os.path.getsize(db_path) / (1024 * 1024):.1f} MB on disk")
+    for query in args.query:
+        results = index.search(query)
+        print(f"🔎 {query!r}: {len(results.symbols)} definitions, {len(results.files)} files "
+              f"({results.candidates} scanned) in {results.duration_s * 1000:.0f} ms")
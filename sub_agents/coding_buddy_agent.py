@@ -7,32 +7,25 @@ This uses interleaved thinking sonnet 4 for better understanding coding principl
 """
 
 import os
-from botocore.config import Config
+import time
 from strands import Agent, tool
-from strands.models import BedrockModel
-from strands_tools import editor, shell, load_tool, http_request, python_repl, file_read, file_write
+from strands_tools import editor, shell, load_tool, http_request, file_read, file_write
+from .agent_result import SubAgentResult
+from .agent_hooks import agent_hooks
+from .budget_policy import BUDGET_POLICY
+from .code_index import code_search, prewarm_code_index
+from .model_factory import build_model
+from .model_tiers import tiered_model
+from .python_workers import get_worker_pool, python_repl
 os.environ["DEV"] = "true"
 os.environ["STRANDS_TOOL_CONSOLE_MODE"] = "enabled"
 
-def create_coding_agent():
+def create_coding_agent(decision=None):
     """Create and return the Coding Agent with specialized configuration."""
     
-    model = BedrockModel(
-        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", # max 65536 ---> suggested
-        max_tokens=10000,
-        boto_client_config=Config(
-            read_timeout=900,
-            connect_timeout=900,
-            retries=dict(max_attempts=3, mode="adaptive"),
-        ),
-        additional_request_fields={
-            "anthropic_beta": ["interleaved-thinking-2025-05-14"],
-            "thinking": {
-                "type": os.getenv("STRANDS_THINKING_TYPE", "enabled"),
-                "budget_tokens": int(os.getenv("STRANDS_BUDGET_TOKENS", "2048")),
-            },
-        },
-    )
+    # Thinking budget and max_tokens are sized per request by the budget policy;
+    # simple requests can also be tiered down to the fast model
+    model = tiered_model("coding", build_model("coding", decision), decision=decision)
 
     system_prompt = """
 You are an expert software engineering assistant focused on producing high-quality, production-ready code. You combine technical expertise with practical software engineering principles to deliver optimal solutions.
@@ -91,8 +84,10 @@ EXECUTION PROTOCOL:
 - Confirm security measures
 
 TOOLS UTILIZATION:
+- code_search: Find definitions and code by name, text or regex across the repository in one call -
+  use it before file_read, grep or find
 - editor: Code modification
-- python_repl: Code execution
+- python_repl: Code execution in this session's persistent Python worker (variables and imports carry over)
 - shell: System commands
 - file_read/write: File operations
 - http_request: API interactions
@@ -113,6 +108,7 @@ Priority: Maintainable, secure, and efficient code that follows software enginee
         system_prompt=system_prompt,
         model=model,
         tools=[
+            code_search,
             editor,
             python_repl,
             shell,
@@ -120,13 +116,14 @@ Priority: Maintainable, secure, and efficient code that follows software enginee
             file_write,
             load_tool,
             http_request
-        ]
+        ],
+        hooks=agent_hooks("coding", decision),
     )
     
     return agent
 
 @tool
-def coding_agent(user_input: str) -> str:
+def coding_agent(user_input: str) -> SubAgentResult:
     """
     Specialized coding assistant for software engineering tasks.
     
@@ -137,16 +134,21 @@ def coding_agent(user_input: str) -> str:
         user_input: The coding-related request or question
         
     Returns:
-        Expert response with code analysis, suggestions, or implementations
+        Budgeted summary of the expert response with code analysis, suggestions, or implementations
     """
-    agent = create_coding_agent()
+    started = time.perf_counter()
+    # A warm Python worker starts while the model plans, so the first python_repl call doesn't wait
+    get_worker_pool().prewarm()
+    # Bring the checkout's code index up to date in the background
+    prewarm_code_index()
+    agent = create_coding_agent(BUDGET_POLICY.decide("coding", user_input))
     os.environ["BYPASS_TOOL_CONSENT"] = "true"
 
     try:
         response = agent(user_input)
-        return response
+        return SubAgentResult.from_response("coding", response, started)
     except Exception as e:
-        return f"❌ Coding Agent Error: {str(e)}"
+        return SubAgentResult.error("coding", f"❌ Coding Agent Error: {str(e)}", started)
 
 # Test the agent directly if run as main
 if __name__ == "__main__":
@@ -159,5 +161,5 @@ if __name__ == "__main__":
         
         print("\n\033[1;36m--- Coding Agent Response ---\033[0m")
         result = coding_agent(user_input)
-        print(result)
+        print(result.body)
         print("\033[1;36m--- End of Response ---\033[0m\n")
\ No newline at end of file
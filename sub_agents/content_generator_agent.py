@@ -14,7 +14,9 @@ CORE CAPABILITIES:
 
 TOOLS AVAILABLE:
 - diagram: Creates technical diagrams using various diagramming standards
-- generate_image: Generates custom images from text descriptions using AI
+- render_diagrams: Creates several diagrams in parallel in one call
+- generate_image_async: Starts image generation in the background and returns a job id
+- image_job_status: Checks on (or briefly waits for) an image job
 
 ARCHITECTURE:
 Built on the Strands Agent framework with Claude 3.7 Sonnet model for high-quality
@@ -22,11 +24,19 @@ content generation and visual understanding.
 """
 
 import os
+import time
 from strands import tool
 from botocore.config import Config
 from strands import Agent
 from strands.models import BedrockModel
-from strands_tools import diagram, generate_image
+from .agent_result import SubAgentResult
+from .agent_hooks import agent_hooks
+from .diagram_batch import create_examples_for_all_diagrams, generate_diagram_batch, load_batch_file, print_manifest
+from .diagram_renderer import diagram, get_renderer, render_diagrams
+from .image_jobs import generate_image_async, get_image_queue, image_job_status
+from .model_factory import enable_prompt_caching
+from .model_tiers import tiered_model
+from .event_bus import report_status
 
 
 system_prompt = """
@@ -37,12 +47,15 @@ You are a Content Generator Agent specializing in visual content creation. You h
    - AWS cloud architecture diagrams
    - System design diagrams, flowcharts, and process maps
    - Network topology diagrams
+   - When a request needs several diagrams, create them together with render_diagrams
 
-2. **Generate Image Tool**: Create custom images including:
+2. **Generate Image Tool** (generate_image_async): Create custom images including:
    - Illustrations and artwork
    - Visual assets and graphics
    - Custom images from text descriptions
    - Creative visual content
+   - Images generate in the background: report the job id and finish your answer instead of waiting.
+     The user is notified when the image is ready. Use image_job_status only when asked about a job.
 
 Your role is to analyze requests and determine whether they need diagram creation or image generation,
 then use the appropriate tool to deliver high-quality visual content that meets the user's specifications.
@@ -53,7 +66,7 @@ Always provide clear explanations of your process and the visual content you're
 
 
 @tool
-def content_generator_agent(query: str) -> str:
+def content_generator_agent(query: str) -> SubAgentResult:
     """
     Content Generator Agent that creates visual content including diagrams and images.
     
@@ -86,7 +99,7 @@ def content_generator_agent(query: str) -> str:
             - Any styling, format, or layout preferences
     
     Returns:
-        str: Response containing:
+        SubAgentResult: Budgeted summary (with a reference to the full output) containing:
             - The completed visual content or file path
             - Progress updates during creation process
             - Technical details about the generated content
@@ -101,10 +114,17 @@ def content_generator_agent(query: str) -> str:
         query: "Generate an image of a futuristic city skyline"
         query: "Create an illustration of a data flow process"
     """
+    started = time.perf_counter()
+    # Render workers import graphviz/matplotlib while the model decides what to draw
+    get_renderer().prewarm()
     content_agent = Agent(
         system_prompt=system_prompt,
-        tools=[diagram, generate_image],
+        tools=[diagram, render_diagrams, generate_image_async, image_job_status],
+        hooks=agent_hooks("content"),
     )
+    enable_prompt_caching(content_agent.model)
+    # Picking between diagram and generate_image_async rarely needs the strong model
+    content_agent.model = tiered_model("content", content_agent.model, query=query)
     
     # Format the query for the content generator with clear instructions
     formatted_query = f"""
@@ -119,18 +139,13 @@ def content_generator_agent(query: str) -> str:
     """
     
     try:
-        print("🎨 Initiating Content Generation Process")
+        report_status("🎨 Initiating Content Generation Process")
         # Create the content generator agent with both tools
         agent_response = content_agent(formatted_query)
-        text_response = str(agent_response)
-
-        if len(text_response) > 0:
-            return f"\n🎨 CONTENT GENERATOR RESPONSE 🎨\n{'='*50}\n{text_response}\n{'='*50}"
-
-        return "\033[1;31m❌ Error: No content output received from the generation process\033[0m"
+        return SubAgentResult.from_response("content", agent_response, started)
     except Exception as e:
         # Return specific error message for content generation processing
-        return f"Content Generation Error: {str(e)}\nPlease verify your content requirements and try again."
+        return SubAgentResult.error("content", f"Content Generation Error: {str(e)}\nPlease verify your content requirements and try again.", started)
     
 if __name__ == "__main__":
     print(f"\n\033[1;36m🎨 Content Generator Agent 🎨\033[0m\n")
@@ -138,21 +153,31 @@ if __name__ == "__main__":
     print("Available capabilities:")
     print("  📊 Technical Diagrams: UML, AWS architectures, flowcharts, system designs")
     print("  🖼️  Custom Images: Illustrations, artwork, visual assets, creative content")
+    print("  🗂️  Batches: 'diagram examples' (every UML type) or 'diagram batch <file>' (JSON specs/prompts or one prompt per line)")
     print("  💬 Interactive Mode: Type your content request below")
     print("  🚪 Exit: Type 'exit' to quit")
     print("")
 
     # Create a direct instance for interactive use
-    interactive_agent = Agent(system_prompt=system_prompt, tools=[diagram, generate_image])
+    interactive_agent = Agent(system_prompt=system_prompt, tools=[diagram, render_diagrams, generate_image_async, image_job_status])
 
     while True:
+        for job in get_image_queue().drain_notifications():
+            print(f"🖼️  {job.message()}")
         user_input = input("\n\033[1;33m🎨 Content Request > \033[0m")  # Yellow prompt with emoji
         
         if user_input.lower() == "exit":
             print("\n\033[1;36m👋 Thanks for using Content Generator Agent! Goodbye!\033[0m")
             break
         if user_input.lower() == "diagram examples":
-           create_examples_for_all_diagrams(interactive_agent) 
+            create_examples_for_all_diagrams()
+            continue
+        if user_input.lower().startswith("diagram batch "):
+            try:
+                print_manifest(generate_diagram_batch(load_batch_file(user_input[len("diagram batch "):].strip())))
+            except (OSError, ValueError) as e:
+                print(f"❌ Batch error: {str(e)}")
+            continue
             
         # Use ANSI color codes to make the agent's response stand out
         print("\n\033[1;36m--- 🎨 Content Generator Response ---\033[0m")  # Cyan color, bold text
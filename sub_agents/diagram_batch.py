@@ -0,0 +1,247 @@
+"""
+Batch diagram generation for the Content Generator Agent
+
+Generating a diagram set (all 14 UML types, or the architecture variants for a
+design doc) one request at a time costs a full agent turn per diagram. The
+batch API takes a list of items, each either a ready diagram spec or a prompt:
+
+    1. all prompts are turned into specs by ONE structured-output model call
+    2. every spec is rendered concurrently by the diagram renderer
+       (cache hits return immediately)
+    3. a manifest with per-item timing is written next to the diagrams
+
+    manifest = generate_diagram_batch([
+        "Class diagram of the order service domain model",
+        "AWS architecture: CloudFront, API Gateway, Lambda, DynamoDB",
+        {"diagram_type": "sequence", "elements": [...], "relationships": [...], "title": "checkout"},
+    ])
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+from strands import Agent
+
+from .agent_hooks import agent_hooks
+from .diagram_renderer import get_renderer
+from .model_factory import enable_prompt_caching
+from .model_tiers import tiered_model
+
+SPEC_SYSTEM_PROMPT = """
+You turn diagram requests into diagram specifications. Produce exactly one specification per request,
+in the same order as the requests.
+
+Specification fields:
+- diagram_type: "cloud", "graph" or "network" for basic diagrams, or a UML type: "class", "object",
+  "component", "deployment", "package", "profile", "composite_structure", "use_case", "activity",
+  "state_machine", "sequence", "communication", "interaction_overview", "timing"
+- title: short file-name friendly title, unique within the batch
+- Basic diagrams: nodes (objects with "id", "label", and for cloud diagrams "type" = AWS service name)
+  and edges (objects with "from", "to", optional "label" and "order")
+- UML diagrams: elements (objects with "name", "type" and type-specific properties such as
+  "attributes", "methods", "class", "states", "multiplicity") and relationships (objects with
+  "from", "to", "type" and optional "label", "multiplicity_source", "multiplicity_target")
+
+State machine and activity diagrams need initial and final states/nodes. Keep every diagram complete
+but focused: the elements a reader needs, with meaningful labels.
+"""
+
+
+class DiagramSpecModel(BaseModel):
+    """One diagram specification produced from a prompt"""
+    diagram_type: str = Field(description="Basic type (cloud, graph, network) or one of the 14 UML types")
+    title: str = Field(description="Short, file-name friendly title, unique within the batch")
+    nodes: Optional[List[Dict[str, Any]]] = Field(None, description="Basic diagrams: nodes")
+    edges: Optional[List[Dict[str, Any]]] = Field(None, description="Basic diagrams: edges")
+    elements: Optional[List[Dict[str, Any]]] = Field(None, description="UML diagrams: elements")
+    relationships: Optional[List[Dict[str, Any]]] = Field(None, description="UML diagrams: relationships")
+    style: Optional[Dict[str, str]] = Field(None, description="Graphviz style, e.g. {\"rankdir\": \"LR\"}")
+
+
+class DiagramSpecBatch(BaseModel):
+    """Diagram specifications, one per request, in request order"""
+    diagrams: List[DiagramSpecModel]
+
+
+@dataclass
+class ManifestItem:
+    """What happened to one batch item"""
+    index: int
+    source: str  # "spec" or "prompt"
+    prompt: Optional[str]
+    diagram_type: str
+    title: str
+    status: str
+    path: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    spec_hash: Optional[str] = None
+    render_s: float = 0.0
+
+
+@dataclass
+class DiagramManifest:
+    """Per-item results and timing of one batch"""
+    created: str
+    output_format: str
+    items: List[ManifestItem] = field(default_factory=list)
+    spec_generation_s: float = 0.0
+    render_wall_s: float = 0.0
+    total_s: float = 0.0
+    path: Optional[str] = None
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for item in self.items if item.status == "ok")
+
+    def summary(self) -> str:
+        cached = sum(1 for item in self.items if item.cached)
+        return (f"{self.succeeded}/{len(self.items)} diagrams ({cached} cached) in {self.total_s:.1f}s - "
+                f"specs {self.spec_generation_s:.1f}s, rendering {self.render_wall_s:.1f}s")
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["succeeded"] = self.succeeded
+        return data
+
+
+def _spec_agent() -> Agent:
+    agent = Agent(system_prompt=SPEC_SYSTEM_PROMPT, callback_handler=None, hooks=agent_hooks("content"))
+    enable_prompt_caching(agent.model)
+    agent.model = tiered_model("content", agent.model)
+    return agent
+
+
+def generate_specs(prompts: List[str], agent: Optional[Agent] = None) -> List[Dict[str, Any]]:
+    """Turn prompts into diagram specs with a single structured-output model call"""
+    if not prompts:
+        return []
+    agent = agent or _spec_agent()
+    numbered = "\n".join(f"{i}. {prompt}" for i, prompt in enumerate(prompts, start=1))
+    result = agent(f"Create one diagram specification for each of these {len(prompts)} requests:\n{numbered}",
+                   structured_output_model=DiagramSpecBatch)
+    batch = result.structured_output
+    return [spec.model_dump(exclude_none=True) for spec in batch.diagrams]
+
+
+def _dedupe_titles(specs: Dict[int, Dict[str, Any]]) -> None:
+    """Give every spec its own title, which is also its file name under ./diagrams"""
+    taken = set()
+    for index in sorted(specs):
+        base = specs[index].get("title") or "diagram"
+        title = base
+        # Case-insensitive, since the files may land on a case-insensitive file system
+        while title.lower() in taken:
+            title = f"{base}-{index + 1}" if title == base else f"{title}-{index + 1}"
+        taken.add(title.lower())
+        specs[index]["title"] = title
+
+
+def generate_diagram_batch(items: List[Union[str, Dict[str, Any]]], output_format: str = "png",
+                           agent: Optional[Agent] = None, manifest_dir: Optional[str] = None) -> DiagramManifest:
+    """Generate a set of diagrams from specs and/or prompts and write a manifest"""
+    started = time.perf_counter()
+    manifest = DiagramManifest(created=datetime.now().isoformat(timespec="seconds"), output_format=output_format)
+
+    prompts = [(i, item if isinstance(item, str) else item.get("prompt", "")) for i, item in enumerate(items)
+               if isinstance(item, str) or "diagram_type" not in item]
+    specs: Dict[int, Dict[str, Any]] = {i: dict(item) for i, item in enumerate(items)
+                                        if isinstance(item, dict) and "diagram_type" in item}
+
+    spec_error = None
+    if prompts:
+        spec_started = time.perf_counter()
+        try:
+            generated = generate_specs([prompt for _, prompt in prompts], agent)
+        except Exception as e:
+            generated, spec_error = [], f"Spec generation failed: {str(e)}"
+        manifest.spec_generation_s = time.perf_counter() - spec_started
+        for (index, _), spec in zip(prompts, generated):
+            specs[index] = spec
+        if len(generated) < len(prompts) and spec_error is None:
+            spec_error = f"The model returned {len(generated)} specs for {len(prompts)} prompts"
+
+    _dedupe_titles(specs)
+    order = sorted(specs)
+    render_specs = [{"output_format": output_format, **specs[i], "open_diagram_flag": False} for i in order]
+    render_started = time.perf_counter()
+    results = dict(zip(order, get_renderer().render_many(render_specs)))
+    manifest.render_wall_s = time.perf_counter() - render_started
+
+    prompt_text = dict(prompts)
+    for index in range(len(items)):
+        spec = specs.get(index, {})
+        result = results.get(index)
+        item = ManifestItem(
+            index=index,
+            source="prompt" if index in prompt_text else "spec",
+            prompt=prompt_text.get(index),
+            diagram_type=spec.get("diagram_type", ""),
+            title=spec.get("title", ""),
+            status="ok" if result is not None and result.ok else "error",
+        )
+        if result is None:
+            item.error = spec_error
+        else:
+            item.path, item.cached, item.error = result.path, result.cached, result.error
+            item.spec_hash, item.render_s = result.spec_hash, round(result.duration_s, 3)
+        manifest.items.append(item)
+
+    manifest.total_s = time.perf_counter() - started
+    manifest_dir = manifest_dir or os.path.join(os.getcwd(), "diagrams")
+    os.makedirs(manifest_dir, exist_ok=True)
+    manifest.path = os.path.join(manifest_dir, f"manifest-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(manifest.path, "w", encoding="utf-8") as f:
+        json.dump(manifest.to_dict(), f, indent=2)
+    return manifest
+
+
+# One example request per UML type, plus an AWS architecture
+EXAMPLE_PROMPTS = {
+    "class": "Class diagram of a library management system: Book, Member, Loan, Librarian",
+    "object": "Object diagram of one customer with two orders and their line items",
+    "component": "Component diagram of a web shop: web UI, API, order service, payment service, database",
+    "deployment": "Deployment diagram of a three-tier web application on load-balanced servers",
+    "package": "Package diagram of a layered application: presentation, application, domain, infrastructure",
+    "profile": "Profile diagram defining <<Entity>> and <<Service>> stereotypes for a domain model",
+    "composite_structure": "Composite structure diagram of a car with engine, four wheels and a transmission",
+    "use_case": "Use case diagram of an ATM with customer and bank actors",
+    "activity": "Activity diagram of an online checkout from cart to order confirmation",
+    "state_machine": "State machine diagram of an order: created, paid, shipped, delivered, cancelled",
+    "sequence": "Sequence diagram of a user logging in through a web app, auth service and database",
+    "communication": "Communication diagram of a customer placing an order with cart, order and inventory objects",
+    "interaction_overview": "Interaction overview diagram of user registration with email verification",
+    "timing": "Timing diagram of a traffic light cycling through red, green and yellow",
+    "cloud": "AWS architecture of a serverless API: CloudFront, API Gateway, Lambda, DynamoDB, S3",
+}
+
+
+def load_batch_file(path: str) -> List[Union[str, Dict[str, Any]]]:
+    """Batch items from a JSON list, or a text file with one prompt per line"""
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    if content.lstrip().startswith("["):
+        return json.loads(content)
+    return [line.strip() for line in content.splitlines() if line.strip()]
+
+
+def print_manifest(manifest: DiagramManifest) -> None:
+    print(f"📊 {manifest.summary()}")
+    for item in manifest.items:
+        marker = "✅" if item.status == "ok" else "❌"
+        detail = item.path if item.status == "ok" else item.error
+        print(f"  {marker} {item.diagram_type or '?':<22} {item.render_s:>6.2f}s  {detail}")
+    print(f"🗂️  Manifest: {manifest.path}")
+
+
+def create_examples_for_all_diagrams() -> DiagramManifest:
+    """Generate an example of every UML diagram type (and an AWS architecture) in one batch"""
+    prompts = [f"{prompt} (diagram_type: {diagram_type})" for diagram_type, prompt in EXAMPLE_PROMPTS.items()]
+    manifest = generate_diagram_batch(prompts)
+    print_manifest(manifest)
+    return manifest
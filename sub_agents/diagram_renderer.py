@@ -0,0 +1,404 @@
+"""
+Diagram rendering for the Content Generator Agent
+
+The strands `diagram` tool renders every request from scratch in the agent's
+own process: graphviz, the `diagrams` package and matplotlib are imported on
+first use and each diagram is laid out and rasterised again even when the
+model sends a spec it has already rendered. This module puts a render cache
+and a warm worker pool in front of the same builders:
+
+    cache    rendered files are stored under FRANKIE_HOME/diagram_cache, keyed
+             by a canonical hash of everything that affects the output (type,
+             nodes/elements, edges/relationships, title, style, format). A hit
+             is copied to ./diagrams/<title>.<ext> without rendering.
+    workers  misses render in a process pool whose workers import the
+             renderers once and stay up, so later requests skip the import
+             and layout start-up cost; several diagrams render in parallel.
+
+Configuration:
+    FRANKIE_DIAGRAM_WORKERS     worker processes (default: min(4, CPUs))
+    FRANKIE_DIAGRAM_CACHE_MB    cache size before least-recently-used eviction (default 200)
+    FRANKIE_DIAGRAM_TIMEOUT     seconds before a render is abandoned (default 120)
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+from strands import tool
+
+from .frankie_home import frankie_path
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv("FRANKIE_DIAGRAM_CACHE", frankie_path("diagram_cache", create_parent=False))
+MAX_WORKERS = int(os.getenv("FRANKIE_DIAGRAM_WORKERS", str(min(4, os.cpu_count() or 1))))
+CACHE_LIMIT_BYTES = int(float(os.getenv("FRANKIE_DIAGRAM_CACHE_MB", "200")) * 1024 * 1024)
+RENDER_TIMEOUT = float(os.getenv("FRANKIE_DIAGRAM_TIMEOUT", "120"))
+
+UML_TYPES = (
+    "class", "object", "component", "deployment", "package", "profile", "composite_structure",
+    "use_case", "activity", "state_machine", "sequence", "communication", "interaction_overview", "timing",
+)
+# Spec fields that change the rendered file; open_diagram_flag only affects what happens afterwards
+RENDER_FIELDS = ("diagram_type", "nodes", "edges", "elements", "relationships", "output_format", "title", "style")
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one diagram spec"""
+    spec_hash: str
+    diagram_type: str
+    path: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    duration_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def message(self) -> str:
+        """The same wording the strands diagram tool uses, so prompts and callers keep working"""
+        if not self.ok:
+            return self.error
+        kind = "UML diagram" if self.diagram_type in UML_TYPES else "diagram"
+        return f"Created {self.diagram_type} {kind}: {self.path}" + (" (cached)" if self.cached else "")
+
+
+def normalize_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in the strands diagram tool's defaults so equivalent specs hash the same"""
+    return {
+        "diagram_type": (spec.get("diagram_type") or "").lower().replace(" ", "_").replace("-", "_"),
+        "nodes": spec.get("nodes") or None,
+        "edges": spec.get("edges") or None,
+        "elements": spec.get("elements") or None,
+        "relationships": spec.get("relationships") or None,
+        "output_format": (spec.get("output_format") or "png").lower().lstrip("."),
+        "title": spec.get("title") or "diagram",
+        "style": spec.get("style") or None,
+        "open_diagram_flag": spec.get("open_diagram_flag", True),
+    }
+
+
+def spec_hash(spec: Dict[str, Any]) -> str:
+    canonical = {field: spec.get(field) for field in RENDER_FIELDS}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:24]
+
+
+def open_diagram(path: str) -> None:
+    """Open a rendered diagram with the system viewer"""
+    try:
+        system = platform.system()
+        if system == "Darwin":
+            subprocess.Popen(["open", path], start_new_session=True)
+        elif system == "Windows":
+            os.startfile(path)
+        else:
+            subprocess.Popen(["xdg-open", path], start_new_session=True)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("could not open diagram %s: %s", path, e)
+
+
+# ----------------------------------------------------------------------
+# Worker side - runs in the pool processes
+# ----------------------------------------------------------------------
+
+def _warm_worker() -> None:
+    """Pool initializer: pay the renderer import cost once per worker"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import strands_tools.diagram  # noqa: F401  graphviz, diagrams, matplotlib, networkx
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _render_in_worker(spec: Dict[str, Any], digest: str, cache_dir: str) -> str:
+    """Render one spec in a scratch directory and move the result into the cache"""
+    from strands_tools.diagram import DiagramBuilder, UMLDiagramBuilder
+
+    cwd = os.getcwd()
+    scratch = tempfile.mkdtemp(prefix="frankie-diagram-")
+    try:
+        # The builders write to ./diagrams; each worker renders one spec at a time, so chdir is safe
+        os.chdir(scratch)
+        if spec["diagram_type"] in UML_TYPES:
+            if not spec["elements"]:
+                raise ValueError("'elements' parameter is required for UML diagrams")
+            builder = UMLDiagramBuilder(spec["diagram_type"], spec["elements"], spec["relationships"],
+                                        spec["title"], spec["style"], open_diagram_flag=False)
+            rendered = builder.render(spec["output_format"])
+        else:
+            if not spec["nodes"]:
+                raise ValueError("'nodes' parameter is required for basic diagrams")
+            builder = DiagramBuilder(spec["nodes"], spec["edges"], spec["title"], spec["style"], open_diagram_flag=False)
+            rendered = builder.render(spec["diagram_type"], spec["output_format"])
+
+        extension = os.path.splitext(rendered)[1] or f".{spec['output_format']}"
+        cached_path = os.path.join(cache_dir, f"{digest}{extension}")
+        os.makedirs(cache_dir, exist_ok=True)
+        # Publish atomically so a concurrent lookup never sees a partial file
+        shutil.move(os.path.abspath(rendered), cached_path + ".part")
+        os.replace(cached_path + ".part", cached_path)
+        return cached_path
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+# ----------------------------------------------------------------------
+# Agent side
+# ----------------------------------------------------------------------
+
+class DiagramRenderer:
+    """Content-addressed render cache in front of a warm pool of render workers"""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_workers: int = MAX_WORKERS,
+                 cache_limit_bytes: int = CACHE_LIMIT_BYTES):
+        self.cache_dir = cache_dir
+        self.max_workers = max(1, max_workers)
+        self.cache_limit_bytes = cache_limit_bytes
+        self.hits = 0
+        self.misses = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            return self._get_pool_locked()
+
+    def _get_pool_locked(self) -> ProcessPoolExecutor:
+        # Called with the lock held
+        if self._pool is None:
+            # spawn: the agent process runs threads, which fork() doesn't copy safely. Spawned
+            # workers re-run the entry script as __mp_main__; frankie.py keeps that import-free
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def prewarm(self) -> None:
+        """Start the workers in the background so the first diagram doesn't wait for imports"""
+        with self._lock:
+            if self._pool is not None:
+                return
+            pool = self._get_pool_locked()
+        for _ in range(self.max_workers):
+            pool.submit(_ping)
+
+    def lookup(self, digest: str) -> Optional[str]:
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(digest + ".") and not name.endswith(".part"):
+                path = os.path.join(self.cache_dir, name)
+                os.utime(path)  # most recently used
+                return path
+        return None
+
+    def submit(self, spec: Dict[str, Any]) -> "Future[str] | str":
+        """Cached path for a spec, or a future rendering it (shared with identical in-flight specs)"""
+        digest = spec_hash(spec)
+        cached = self.lookup(digest)
+        if cached:
+            return cached
+        with self._lock:
+            future = self._inflight.get(digest)
+            if future is None:
+                future = self._get_pool_locked().submit(_render_in_worker, spec, digest, self.cache_dir)
+                self._inflight[digest] = future
+                future.add_done_callback(lambda _, digest=digest: self._forget(digest))
+        return future
+
+    def _forget(self, digest: str) -> None:
+        with self._lock:
+            self._inflight.pop(digest, None)
+
+    def render_many(self, specs: List[Dict[str, Any]]) -> List[RenderResult]:
+        """Render specs in parallel; cache hits return immediately"""
+        normalized = [normalize_spec(spec) for spec in specs]
+        started = time.perf_counter()
+        finished: Dict[int, float] = {}
+        pending = []
+        for index, spec in enumerate(normalized):
+            try:
+                outcome = self.submit(spec)
+            except Exception as e:
+                outcome = e
+            if isinstance(outcome, Future):
+                outcome.add_done_callback(lambda _, index=index: finished.setdefault(index, time.perf_counter()))
+            else:
+                finished[index] = time.perf_counter()
+            pending.append(outcome)
+
+        results = []
+        broken = False
+        for index, (spec, outcome) in enumerate(zip(normalized, pending)):
+            result = RenderResult(spec_hash(spec), spec["diagram_type"])
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                if isinstance(outcome, str):
+                    cached_path, result.cached = outcome, True
+                else:
+                    cached_path = outcome.result(timeout=RENDER_TIMEOUT)
+                result.path = self._publish(cached_path, spec)
+            except FutureTimeoutError:
+                result.error = f"Error creating diagram: rendering took longer than {RENDER_TIMEOUT:.0f}s"
+            except BrokenProcessPool:
+                broken = True
+                result.error = "Error creating diagram: the render worker crashed - please try again"
+            except Exception as e:
+                result.error = f"Error creating diagram: {str(e)}"
+            result.duration_s = finished.get(index, time.perf_counter()) - started
+            with self._lock:
+                if result.cached:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            results.append(result)
+
+        if broken:
+            # A crashed worker poisons the whole pool; start a fresh one on the next request
+            self.shutdown()
+        self._evict()
+        return results
+
+    def render(self, spec: Dict[str, Any]) -> RenderResult:
+        return self.render_many([spec])[0]
+
+    def _publish(self, cached_path: str, spec: Dict[str, Any]) -> str:
+        """Copy a cached render to ./diagrams/<title>.<ext>, where the diagram tool has always put them"""
+        diagrams_dir = os.path.join(os.getcwd(), "diagrams")
+        os.makedirs(diagrams_dir, exist_ok=True)
+        output_path = os.path.join(diagrams_dir, spec["title"] + os.path.splitext(cached_path)[1])
+        shutil.copyfile(cached_path, output_path)
+        if spec["open_diagram_flag"]:
+            open_diagram(output_path)
+        return output_path
+
+    def _evict(self) -> None:
+        """Drop least recently used renders beyond the cache size limit"""
+        try:
+            entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)]
+            stats = sorted(((os.stat(path), path) for path in entries if os.path.isfile(path)),
+                           key=lambda item: item[0].st_mtime)
+        except OSError:
+            return
+        total = sum(stat.st_size for stat, _ in stats)
+        for stat, path in stats:
+            if total <= self.cache_limit_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= stat.st_size
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "inflight": len(self._inflight),
+                    "workers": self.max_workers if self._pool is not None else 0}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_renderer: Optional[DiagramRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> DiagramRenderer:
+    """Process-wide renderer, created on first use"""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = DiagramRenderer()
+        return _renderer
+
+
+@tool
+def diagram(
+    diagram_type: str,
+    nodes: List[Dict[str, str]] = None,
+    edges: List[Dict[str, Union[str, int]]] = None,
+    output_format: str = "png",
+    title: str = "diagram",
+    style: Dict[str, str] = None,
+    elements: List[Dict[str, str]] = None,
+    relationships: List[Dict[str, Union[str, int]]] = None,
+    open_diagram_flag: bool = True,
+) -> str:
+    """Create diagrams including AWS cloud diagrams and all 14 UML diagram types.
+
+    Identical diagrams are returned from a render cache instantly.
+
+    Args:
+        diagram_type: Type of diagram - Basic: "cloud", "graph", "network" | UML: "class", "object", "component",
+                     "deployment", "package", "profile", "composite_structure", "use_case", "activity",
+                     "state_machine", "sequence", "communication", "interaction_overview", "timing"
+        nodes: For basic diagrams - List of node objects with "id" (required), "label", and "type" (AWS service name)
+        edges: For basic diagrams - List of edge objects with "from", "to", optional "label", "order" (int)
+        output_format: Output format ("png", "svg", "pdf")
+        title: Title of the diagram
+        style: Style parameters (e.g., {"rankdir": "LR"} for left-to-right layout)
+        elements: For UML diagrams - List of UML elements with "name" (required), "type", and type-specific properties
+        relationships: For UML diagrams - List of UML relationships between elements
+        open_diagram_flag: Whether to open the diagram after creation
+
+    Note:
+        For STATE MACHINE and ACTIVITY diagrams: Include initial and final states/nodes in your elements.
+
+        For COMPOSITE STRUCTURE diagrams: Add "multiplicity" to elements and
+        "multiplicity_source"/"multiplicity_target" to relationships (e.g., "1", "*", "0..1").
+
+        For OBJECT diagrams: Use "class" for the object type and an "attributes" string for values
+        (e.g., {"name": "john", "class": "Customer", "attributes": "name = John Doe\nID = 12345"}).
+
+        For TIMING diagrams: Use a "states" string like "Idle:0-10,Opening:10-15,Heating:15-30".
+
+    Returns:
+        Path to the created diagram file
+    """
+    spec = {
+        "diagram_type": diagram_type, "nodes": nodes, "edges": edges, "output_format": output_format,
+        "title": title, "style": style, "elements": elements, "relationships": relationships,
+        "open_diagram_flag": open_diagram_flag,
+    }
+    return get_renderer().render(spec).message()
+
+
+@tool
+def render_diagrams(diagrams: List[Dict[str, Any]]) -> str:
+    """Create several diagrams at once, rendered in parallel.
+
+    Use this instead of repeated diagram calls when a request needs more than one diagram.
+
+    Args:
+        diagrams: List of diagram specs, each with the same fields as the diagram tool
+                 ("diagram_type" required; "nodes"/"edges" or "elements"/"relationships", "title",
+                 "output_format", "style"). Diagrams are not opened unless "open_diagram_flag" is true.
+
+    Returns:
+        One line per diagram with its file path or error
+    """
+    specs = [{"open_diagram_flag": False, **spec} for spec in diagrams]
+    results = get_renderer().render_many(specs)
+    return "\n".join(f"{i}. {result.message()}" for i, result in enumerate(results, start=1))
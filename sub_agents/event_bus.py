@@ -0,0 +1,316 @@
+"""
+F.R.A.N.K.I.E. event bus
+
+In-process publish/subscribe for agent and tool lifecycle events. The Strands
+hooks every agent gets (see agent_hooks.py) publish what happens, and the
+consumers - the tracer, the usage store, the CLI's live renderer - attach to
+the bus instead of each hooking into the agents on their own.
+
+Events (all carry a timestamp and the session id they happened in):
+    TurnStarted / TurnEnded           one agent invocation, with usage when it ends
+    ModelCallStarted / ModelCallEnded one model request
+    ToolStarted / ToolEnded           one tool call
+    MacroStep                         a tool call made by a pre-recorded computer macro
+    OcrDone                           a screen analysis (use_computer analyze_screen) finished
+    StatusChanged / Note              free-form progress for whoever shows it
+
+Two ways to consume:
+    listener      `add_listener(callback, *types)` runs the callback on the
+                  publishing thread, in its context (the tracer relies on this
+                  to nest spans). Listeners must be quick and must not block.
+    subscription  `subscribe(*types)` gets a bounded queue of its own, read with
+                  get()/drain() from a thread or `async for` from asyncio
+                  (`subscribe_async()` inside the event loop). A full queue
+                  drops its oldest event, so a slow consumer never holds up
+                  the agents.
+
+Publishing never blocks and never raises. With nobody listening,
+report_status() and report_note() fall back to stderr, so stdout stays free
+for results (batch JSONL, headless output).
+"""
+
+import asyncio
+import contextvars
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type
+
+from .session_context import current_session_id
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE = 1000
+
+
+@dataclass
+class Event:
+    timestamp: float = field(default_factory=time.time, init=False)
+    session_id: str = field(default_factory=current_session_id, init=False)
+
+    @property
+    def kind(self) -> str:
+        return type(self).__name__
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, **asdict(self)}
+
+
+@dataclass
+class TurnStarted(Event):
+    agent: str
+    agent_id: int
+    query: str = ""
+
+
+@dataclass
+class TurnEnded(Event):
+    agent: str
+    agent_id: int
+    duration_s: float
+    ok: bool
+    model_id: str = ""
+    usage: Dict[str, int] = field(default_factory=dict)
+    thinking_tokens: int = 0
+
+
+@dataclass
+class ModelCallStarted(Event):
+    agent: str
+    agent_id: int
+
+
+@dataclass
+class ModelCallEnded(Event):
+    agent: str
+    agent_id: int
+    duration_s: float
+    stop_reason: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ToolStarted(Event):
+    agent: str
+    tool: str
+    tool_use_id: str
+    detail: str = ""
+
+
+@dataclass
+class ToolEnded(Event):
+    agent: str
+    tool: str
+    tool_use_id: str
+    duration_s: float
+    ok: bool
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class MacroStep(Event):
+    macro: str
+    step: int
+    tool: str
+    action: str
+    duration_s: float
+    ok: bool
+
+
+@dataclass
+class OcrDone(Event):
+    agent: str
+    duration_s: float
+    ok: bool
+    text_chars: int = 0
+
+
+@dataclass
+class StatusChanged(Event):
+    message: str
+
+
+@dataclass
+class Note(Event):
+    message: str
+
+
+EventTypes = Tuple[Type[Event], ...]
+
+
+class Subscription:
+    """A consumer's own bounded queue of events"""
+
+    def __init__(self, bus: "EventBus", event_types: EventTypes, maxsize: int = SUBSCRIBER_QUEUE,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.bus = bus
+        self.event_types = event_types or (Event,)
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.closed = False
+        self._events: Deque[Event] = deque()
+        self._ready = threading.Condition()
+        self._loop = loop
+        self._async_ready = asyncio.Event() if loop is not None else None
+
+    def _push(self, event: Event) -> None:
+        with self._ready:
+            if len(self._events) >= self.maxsize:
+                self._events.popleft()
+                self.dropped += 1
+            self._events.append(event)
+            self._ready.notify()
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_ready.set)
+            except RuntimeError:  # the loop is closed
+                pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """Next event, waiting up to `timeout` seconds; None if none arrived"""
+        with self._ready:
+            if not self._events and not self.closed:
+                self._ready.wait(timeout)
+            return self._events.popleft() if self._events else None
+
+    def drain(self, limit: Optional[int] = None) -> List[Event]:
+        """Every queued event (or the oldest `limit`), without waiting"""
+        with self._ready:
+            count = len(self._events) if limit is None else min(limit, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    async def next(self) -> Optional[Event]:
+        """Wait for the next event in asyncio; None once the subscription is closed"""
+        if self._async_ready is None:
+            raise RuntimeError("use EventBus.subscribe_async() for asyncio consumers")
+        while True:
+            with self._ready:
+                if self._events:
+                    return self._events.popleft()
+                if self.closed:
+                    return None
+                self._async_ready.clear()
+            await self._async_ready.wait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.next()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self) -> None:
+        self.bus._remove_subscription(self)
+        with self._ready:
+            self.closed = True
+            self._ready.notify_all()
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_ready.set)
+            except RuntimeError:
+                pass
+
+
+class EventBus:
+    """Fans published events out to listeners and subscriptions"""
+
+    def __init__(self):
+        self._listeners: List[Tuple[Callable[[Event], None], EventTypes]] = []
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, event: Event) -> None:
+        self.published += 1
+        listeners, subscriptions = self._listeners, self._subscriptions
+        for callback, event_types in listeners:
+            if isinstance(event, event_types):
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception("event listener %r failed on %s", callback, event.kind)
+        for subscription in subscriptions:
+            if isinstance(event, subscription.event_types):
+                subscription._push(event)
+
+    def add_listener(self, callback: Callable[[Event], None], *event_types: Type[Event]) -> Callable[[], None]:
+        """Call `callback` inline for each matching event; returns a function that detaches it"""
+        entry = (callback, event_types or (Event,))
+        with self._lock:
+            self._listeners = self._listeners + [entry]
+
+        def remove() -> None:
+            with self._lock:
+                self._listeners = [e for e in self._listeners if e is not entry]
+        return remove
+
+    def subscribe(self, *event_types: Type[Event], maxsize: int = SUBSCRIBER_QUEUE) -> Subscription:
+        """A queue of matching events for a consumer thread; close() it when done"""
+        subscription = Subscription(self, event_types, maxsize)
+        with self._lock:
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def subscribe_async(self, *event_types: Type[Event], maxsize: int = SUBSCRIBER_QUEUE) -> Subscription:
+        """Like subscribe(), read with `async for` in the running event loop"""
+        subscription = Subscription(self, event_types, maxsize, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def _remove_subscription(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+
+    def has_consumers(self, event_type: Type[Event]) -> bool:
+        return any(issubclass(event_type, types) for _, types in self._listeners) or \
+            any(issubclass(event_type, s.event_types) for s in self._subscriptions)
+
+
+BUS = EventBus()
+
+
+def report_status(message: str) -> None:
+    """Tell whoever shows progress what the request is doing now (stderr if nobody listens)"""
+    if BUS.has_consumers(StatusChanged):
+        BUS.publish(StatusChanged(message))
+    else:
+        print(message, file=sys.stderr, flush=True)
+
+
+def report_note(message: str) -> None:
+    """A progress line worth keeping in the scrollback (stderr if nobody listens)"""
+    if BUS.has_consumers(Note):
+        BUS.publish(Note(message))
+    else:
+        print(message, file=sys.stderr, flush=True)
+
+
+class _MacroRun:
+    def __init__(self, name: str):
+        self.name = name
+        self.steps = 0
+
+
+_current_macro: contextvars.ContextVar[Optional[_MacroRun]] = contextvars.ContextVar("frankie_macro", default=None)
+
+
+@contextmanager
+def macro_scope(name: str):
+    """Tool calls made inside this block are also published as steps of macro `name`"""
+    token = _current_macro.set(_MacroRun(name))
+    try:
+        yield
+    finally:
+        _current_macro.reset(token)
+
+
+def current_macro() -> Optional[_MacroRun]:
+    return _current_macro.get()
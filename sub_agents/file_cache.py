@@ -0,0 +1,439 @@
+"""
+Session file-read cache for the Coding Buddy and Memory Brain agents
+
+Agents look at the same files again and again: `file_read`/`editor` reread the
+whole file from disk every time and send it to the model in full, even when
+nothing changed since the model last saw it. FileReadCacheHooks intercepts
+single-file reads and serves them from a cache instead:
+
+    store    file contents are cached per session, keyed by path, mtime and
+             size. Small files are kept decoded; files of FRANKIE_FILE_CACHE_MMAP_KB
+             or more are memory-mapped with a line-offset index, so a line
+             range is served by slicing the mapping instead of reading and
+             splitting the whole file. Converted documents (markitdown_convert
+             on a local file) are cached the same way.
+    repeat   each agent keeps a ledger of what its model has been shown. Reading
+             the same file (and range) again answers "unchanged since turn N"
+             while the earlier result is still in the conversation, or a
+             unified diff when the file changed and the diff is smaller than
+             the content. Asking again right after an "unchanged" answer
+             returns the full content, so the model can always get it back.
+
+Reads the cache can't answer exactly like the original tool (globs, several
+paths, other modes, directories) go to the tool unchanged. The hooks are only
+installed for live model calls: recordings and replays need the tools' own
+results (see model_replay.py).
+
+Configuration:
+    FRANKIE_FILE_CACHE              on/off (default on)
+    FRANKIE_FILE_CACHE_MB           cached bytes per session before LRU eviction (default 64)
+    FRANKIE_FILE_CACHE_MMAP_KB      files this size or larger are memory-mapped (default 256)
+    FRANKIE_FILE_CACHE_DIFF_RATIO   largest diff served, as a share of the content (default 0.5)
+"""
+
+import difflib
+import mmap
+import os
+import re
+import stat as stat_module
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from strands.hooks import AfterToolCallEvent, BeforeToolCallEvent, HookProvider, HookRegistry
+from strands.tools.tools import PythonAgentTool
+
+from .session_context import current_session_id
+
+ENABLED = os.getenv("FRANKIE_FILE_CACHE", "on").lower() not in ("0", "off", "false", "no")
+SESSION_LIMIT_BYTES = int(float(os.getenv("FRANKIE_FILE_CACHE_MB", "64")) * 1024 * 1024)
+MMAP_MIN_BYTES = int(float(os.getenv("FRANKIE_FILE_CACHE_MMAP_KB", "256")) * 1024)
+DIFF_MAX_RATIO = float(os.getenv("FRANKIE_FILE_CACHE_DIFF_RATIO", "0.5"))
+
+CACHED_AGENTS = ("coding", "memory")
+GLOB_CHARS = re.compile(r"[*?\[]")
+MARKDOWN_PREFIX = "Markdown content:\n\n"
+
+
+def _normalize_newlines(text: str) -> str:
+    """Match what open(path, "r") returns"""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class CachedFile:
+    """A file's content at one (mtime, size), decoded or memory-mapped"""
+
+    def __init__(self, path: str, st: os.stat_result):
+        self.path = path
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self._text: Optional[str] = None
+        self._map: Optional[mmap.mmap] = None
+        self._bounds: Optional[array] = None
+        with open(path, "rb") as f:
+            if self.size >= MMAP_MIN_BYTES:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._text = _normalize_newlines(f.read().decode("utf-8"))
+
+    def matches(self, st: os.stat_result) -> bool:
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+    @property
+    def mapped(self) -> bool:
+        return self._map is not None
+
+    def text(self) -> str:
+        if self._text is not None:
+            return self._text
+        return _normalize_newlines(self._map[:].decode("utf-8"))
+
+    def _line_bounds(self) -> array:
+        """Byte offset where each line starts, plus the end of the file"""
+        if self._bounds is None:
+            bounds = array("q", [0])
+            bounds.extend(m.end() for m in re.finditer(b"\n", self._map))
+            if bounds[-1] != self.size:
+                bounds.append(self.size)
+            self._bounds = bounds
+        return self._bounds
+
+    def lines(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Lines [start, end) with their line endings, like readlines()[start:end]"""
+        if self._map is None:
+            lines = self._text.split("\n")
+            lines = [line + "\n" for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+            return "".join(lines[start:end])
+        bounds = self._line_bounds()
+        count = len(bounds) - 1
+        start = min(max(start, 0), count)
+        end = count if end is None else min(max(end, start), count)
+        return _normalize_newlines(self._map[bounds[start]:bounds[end]].decode("utf-8"))
+
+
+@dataclass
+class Conversion:
+    """markitdown_convert's result for a file at one (mtime, size)"""
+    mtime_ns: int
+    size: int
+    markdown: str
+    content: List[Dict[str, Any]]
+
+    def matches(self, st: os.stat_result) -> bool:
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+
+class SessionFileCache:
+    """One session's cached files and conversions, evicted least-recently-used"""
+
+    def __init__(self, limit_bytes: int = SESSION_LIMIT_BYTES):
+        self.limit_bytes = limit_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cost(entry) -> int:
+        if isinstance(entry, Conversion):
+            return len(entry.markdown)
+        return entry.size
+
+    def _lookup(self, key: Tuple[str, str], st: os.stat_result):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.matches(st):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def _store(self, key: Tuple[str, str], entry) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._cost(old)
+            self._entries[key] = entry
+            self._bytes += self._cost(entry)
+            # Mappings are not closed here: a reader in another thread may still be slicing one
+            while self._bytes > self.limit_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._cost(evicted)
+
+    def file(self, path: str, st: os.stat_result) -> CachedFile:
+        """The file's content, read (or mapped) only when it changed since last time"""
+        cached = self._lookup(("file", path), st)
+        if cached is None:
+            cached = CachedFile(path, st)
+            self._store(("file", path), cached)
+        return cached
+
+    def conversion(self, path: str, st: os.stat_result) -> Optional[Conversion]:
+        return self._lookup(("markdown", path), st)
+
+    def put_conversion(self, path: str, conversion: Conversion) -> None:
+        self._store(("markdown", path), conversion)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "mapped": sum(1 for e in self._entries.values() if isinstance(e, CachedFile) and e.mapped),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_sessions: Dict[str, SessionFileCache] = {}
+_sessions_lock = threading.Lock()
+
+
+def session_file_cache(session_id: Optional[str] = None) -> SessionFileCache:
+    session_id = session_id or current_session_id()
+    with _sessions_lock:
+        cache = _sessions.get(session_id)
+        if cache is None:
+            cache = _sessions[session_id] = SessionFileCache()
+        return cache
+
+
+def release_session_files(session_id: str) -> None:
+    """Drop a session's cached files (called when the session ends)"""
+    with _sessions_lock:
+        _sessions.pop(session_id, None)
+
+
+@dataclass(frozen=True)
+class FileRead:
+    """A read the cache can answer: one file, whole or a line range"""
+    tool: str
+    path: str
+    start: int = 0
+    end: Optional[int] = None
+    ranged: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.tool}:{self.path}:{self.start}:{self.end}" if self.ranged else f"{self.tool}:{self.path}"
+
+    @property
+    def label(self) -> str:
+        if not self.ranged:
+            return self.path
+        last = "end" if self.end is None else self.end
+        return f"{self.path} lines {self.start + 1}-{last}"
+
+    def content(self, cached: CachedFile) -> str:
+        """What the tool would show the model, without its wrapper text"""
+        if not self.ranged:
+            return cached.text()
+        text = cached.lines(self.start, self.end)
+        if self.tool == "editor":
+            # editor joins split("\n") lines, so the last line has no newline
+            text = text[:-1] if text.endswith("\n") else text
+        return text
+
+    def wrap(self, content: str) -> str:
+        """The tool's own output format"""
+        if self.tool == "editor":
+            return f"File content displayed in console.\nContent: {content}"
+        if self.ranged:
+            return content
+        return f"Content of {self.path}:\n{content}"
+
+
+def _file_read_request(tool_name: str, tool_input: Dict[str, Any]) -> Optional[FileRead]:
+    if tool_name == "markitdown_convert":
+        source = tool_input.get("source")
+        if not isinstance(source, str) or "://" in source:
+            return None
+        return FileRead(tool_name, os.path.expanduser(source))
+    path = tool_input.get("path")
+    if not isinstance(path, str) or not path.strip():
+        return None
+    if tool_name == "file_read":
+        if "," in path or GLOB_CHARS.search(path):
+            return None
+        path = os.path.expanduser(path.strip())
+        mode = tool_input.get("mode")
+        if mode == "view":
+            return FileRead(tool_name, path)
+        if mode == "lines":
+            start = tool_input.get("start_line", int(os.getenv("FILE_READ_START_LINE_DEFAULT", "0")))
+            end = tool_input.get("end_line")
+            if not isinstance(start, int) or not (end is None or isinstance(end, int)) or (end is not None and end < start):
+                return None
+            return FileRead(tool_name, path, max(start, 0), end, ranged=True)
+        return None
+    if tool_name == "editor" and tool_input.get("command") == "view":
+        path = os.path.expanduser(path)
+        view_range = tool_input.get("view_range")
+        if not view_range:
+            return FileRead(tool_name, path)
+        if (not isinstance(view_range, list) or len(view_range) != 2
+                or not all(isinstance(n, int) for n in view_range) or view_range[0] < 1):
+            return None
+        end = None if view_range[1] == -1 else view_range[1]
+        if end is not None and end < view_range[0]:
+            return None
+        return FileRead(tool_name, path, view_range[0] - 1, end, ranged=True)
+    return None
+
+
+@dataclass
+class SeenRead:
+    """What the model was shown for one read, and where in the conversation"""
+    turn: int
+    mtime_ns: int
+    size: int
+    text: str
+    tool_use_ids: List[str] = field(default_factory=list)
+    stubbed: bool = False
+
+    def matches(self, st: os.stat_result) -> bool:
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+
+def _model_turn(agent) -> int:
+    return sum(1 for message in getattr(agent, "messages", []) if message.get("role") == "assistant")
+
+
+def _in_conversation(agent, tool_use_ids: List[str]) -> bool:
+    """Whether every one of these tool results is still in the agent's messages"""
+    wanted = set(tool_use_ids)
+    for message in getattr(agent, "messages", []):
+        for block in message.get("content", []):
+            result = block.get("toolResult") if isinstance(block, dict) else None
+            if result is not None:
+                wanted.discard(result.get("toolUseId"))
+    return not wanted
+
+
+def _unified_diff(old: str, new: str, label: str, turn: int) -> str:
+    return "".join(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True),
+        fromfile=f"{label} (turn {turn})", tofile=f"{label} (now)",
+    ))
+
+
+def _result(tool_use, text: str, status: str = "success") -> Dict[str, Any]:
+    return {"toolUseId": tool_use["toolUseId"], "status": status, "content": [{"text": text}]}
+
+
+class FileReadCacheHooks(HookProvider):
+    """Serves an agent's repeat file reads from the session cache as "unchanged" notes or diffs"""
+
+    def __init__(self, agent_name: str):
+        self.agent_name = agent_name
+        self._seen: Dict[str, SeenRead] = {}
+        self._pending: Dict[str, Tuple[FileRead, os.stat_result]] = {}
+        self._lock = threading.Lock()
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(BeforeToolCallEvent, self._serve_read)
+        registry.add_callback(AfterToolCallEvent, self._record_conversion)
+
+    def _unchanged(self, read: FileRead, seen: SeenRead, agent) -> Optional[str]:
+        """The "unchanged" note, if the model can still see what it read"""
+        if seen.stubbed or not _in_conversation(agent, seen.tool_use_ids):
+            return None
+        seen.stubbed = True
+        return (f"{read.label} is unchanged since you read it in turn {seen.turn}; "
+                f"that result is still in this conversation. Read it again to get the full content.")
+
+    def _reply(self, read: FileRead, text: str, st: os.stat_result, tool_use_id: str, agent,
+               full: str) -> str:
+        """Reply to a read whose current content is `text` (`full` is the tool's complete output)"""
+        turn = _model_turn(agent)
+        with self._lock:
+            seen = self._seen.get(read.key)
+            if seen is not None and seen.text == text:
+                note = self._unchanged(read, seen, agent)
+                seen.mtime_ns, seen.size = st.st_mtime_ns, st.st_size
+                if note is not None:
+                    return note
+            elif seen is not None and _in_conversation(agent, seen.tool_use_ids):
+                diff = _unified_diff(seen.text, text, read.label, seen.turn)
+                if diff and len(diff) <= DIFF_MAX_RATIO * len(text):
+                    self._seen[read.key] = SeenRead(turn, st.st_mtime_ns, st.st_size, text,
+                                                    seen.tool_use_ids + [tool_use_id])
+                    return f"{read.label} changed since turn {seen.turn}. Unified diff against what you read then:\n{diff}"
+            self._seen[read.key] = SeenRead(turn, st.st_mtime_ns, st.st_size, text, [tool_use_id])
+        return full
+
+    def _serve_read(self, event: BeforeToolCallEvent) -> None:
+        tool = event.selected_tool
+        if tool is None or event.cancel_tool:
+            return
+        read = _file_read_request(event.tool_use.get("name"), event.tool_use.get("input") or {})
+        if read is None:
+            return
+        try:
+            st = os.stat(read.path)
+        except OSError:
+            return  # the tool reports missing files in its own words
+        if not stat_module.S_ISREG(st.st_mode):
+            return
+        agent = event.agent
+        tool_use_id = event.tool_use.get("toolUseId")
+        with self._lock:
+            seen = self._seen.get(read.key)
+            # Unchanged on disk: no need to even look at the cache
+            note = self._unchanged(read, seen, agent) if seen is not None and seen.matches(st) else None
+        if note is not None:
+            event.selected_tool = PythonAgentTool(tool.tool_name, tool.tool_spec,
+                                                  lambda tool_use, **kwargs: _result(tool_use, note))
+            return
+        cache = session_file_cache()
+
+        if read.tool == "markitdown_convert":
+            conversion = cache.conversion(read.path, st)
+            if conversion is None:
+                # Convert for real; the result is cached (and maybe diffed) after the call
+                with self._lock:
+                    self._pending[tool_use_id] = (read, st)
+                return
+
+            def serve_conversion(tool_use, **kwargs):
+                reply = self._reply(read, conversion.markdown, st, tool_use["toolUseId"], agent, None)
+                if reply is None:
+                    return {"toolUseId": tool_use["toolUseId"], "status": "success", "content": conversion.content}
+                return _result(tool_use, reply)
+
+            event.selected_tool = PythonAgentTool(tool.tool_name, tool.tool_spec, serve_conversion)
+            return
+
+        def serve_file(tool_use, **kwargs):
+            try:
+                content = read.content(cache.file(read.path, st))
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                return _result(tool_use, f"Error reading file {read.path}: {str(e)}", status="error")
+            return _result(tool_use, self._reply(read, content, st, tool_use["toolUseId"], agent, read.wrap(content)))
+
+        event.selected_tool = PythonAgentTool(tool.tool_name, tool.tool_spec, serve_file)
+
+    def _record_conversion(self, event: AfterToolCallEvent) -> None:
+        with self._lock:
+            pending = self._pending.pop(event.tool_use.get("toolUseId"), None)
+        if pending is None or event.exception is not None:
+            return
+        read, st = pending
+        result = event.result or {}
+        if result.get("status") != "success":
+            return
+        blocks = result.get("content", [])
+        markdown = next((b["text"][len(MARKDOWN_PREFIX):] for b in blocks
+                         if isinstance(b.get("text"), str) and b["text"].startswith(MARKDOWN_PREFIX)), None)
+        if markdown is None:
+            return
+        session_file_cache().put_conversion(read.path, Conversion(st.st_mtime_ns, st.st_size, markdown, blocks))
+        reply = self._reply(read, markdown, st, event.tool_use["toolUseId"], event.agent, None)
+        if reply is not None:
+            event.result = _result(event.tool_use, reply)
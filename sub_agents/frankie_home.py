@@ -0,0 +1,18 @@
+"""
+F.R.A.N.K.I.E. local state directory
+
+Config files, logs and caches shared by the CLI and the sub-agents live under
+FRANKIE_HOME (defaults to ~/.frankie).
+"""
+
+import os
+
+FRANKIE_HOME = os.path.expanduser(os.getenv("FRANKIE_HOME", "~/.frankie"))
+
+
+def frankie_path(*parts: str, create_parent: bool = True) -> str:
+    """Return a path inside FRANKIE_HOME, creating its parent directory on demand"""
+    path = os.path.join(FRANKIE_HOME, *parts)
+    if create_parent:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
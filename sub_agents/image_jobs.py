@@ -0,0 +1,448 @@
+"""
+Image generation jobs for the Content Generator Agent
+
+The strands `generate_image` tool blocks the agent - and with it the whole
+orchestrator turn - while the image model runs, and regenerates the same
+picture every time the same prompt comes back. This module runs image
+generation as background jobs:
+
+    dedup    a job is keyed by the normalized prompt and the parameters that
+             change the picture (model, aspect ratio, format, negative prompt,
+             seed when one is given). A key that is already queued or running
+             returns the existing job; a key that has been generated before is
+             served from the image store without calling the model.
+    queue    jobs run on a small thread pool (Bedrock calls are I/O bound), so
+             a few images generate in parallel while the agent keeps talking.
+             Submitting returns a job handle immediately; listeners and
+             `drain_notifications()` report completions to the CLI; batch and
+             daemon requests collect the jobs they start with `track_jobs()`.
+    store    generated images are kept under FRANKIE_HOME/images, addressed by
+             the SHA-256 of their bytes, with least-recently-used eviction once
+             the store grows past its size limit. The published copy goes to
+             ./output/<prompt words>.<format>, where generate_image puts them.
+
+Configuration:
+    FRANKIE_IMAGE_WORKERS      concurrent image jobs (default 2)
+    FRANKIE_IMAGE_STORE_MB     image store size before eviction (default 500)
+    FRANKIE_IMAGE_STORE        image store directory (default ~/.frankie/images)
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from strands import tool
+
+from .frankie_home import frankie_path
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR = os.getenv("FRANKIE_IMAGE_STORE", frankie_path("images", create_parent=False))
+MAX_WORKERS = int(os.getenv("FRANKIE_IMAGE_WORKERS", "2"))
+STORE_LIMIT_BYTES = int(float(os.getenv("FRANKIE_IMAGE_STORE_MB", "500")) * 1024 * 1024)
+
+# generate_image's own defaults, so an omitted parameter and its default share a key
+DEFAULT_PARAMS = {
+    "model_id": "stability.stable-image-core-v1:1",
+    "aspect_ratio": "1:1",
+    "output_format": "jpeg",
+    "negative_prompt": "bad lighting, harsh lighting",
+}
+INDEX_FILE = "index.json"
+JOB_STATES = ("queued", "running", "done", "error")
+
+# Jobs submitted by the request being served. Strands copies the caller's context into its
+# worker threads, so tools running for a batch item or a daemon request append to its list.
+_tracked_jobs = contextvars.ContextVar("frankie_image_jobs", default=None)
+
+
+def normalize_prompt(prompt: str) -> str:
+    return re.sub(r"\s+", " ", (prompt or "").strip()).lower()
+
+
+def normalize_params(prompt: str, **params: Any) -> Dict[str, Any]:
+    """Parameters that change the generated image, with defaults filled in"""
+    normalized = {"prompt": normalize_prompt(prompt)}
+    for name, default in DEFAULT_PARAMS.items():
+        value = params.get(name) or default
+        normalized[name] = value.strip().lower() if isinstance(value, str) else value
+    if normalized["output_format"] == "jpg":
+        normalized["output_format"] = "jpeg"
+    # Without a seed every generation is a random sample, so one of them is as good as another
+    if params.get("seed") is not None:
+        normalized["seed"] = int(params["seed"])
+    return normalized
+
+
+def job_key(normalized: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+
+
+@dataclass
+class ImageJob:
+    """Handle for one image generation request"""
+    job_id: str
+    key: str
+    prompt: str
+    params: Dict[str, Any]
+    status: str = "queued"
+    path: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "error")
+
+    @property
+    def duration_s(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def message(self) -> str:
+        if self.status == "done":
+            note = " (reused an identical earlier image)" if self.cached else f" in {self.duration_s:.1f}s"
+            return f"Image job {self.job_id} finished{note}: {self.path}"
+        if self.status == "error":
+            return f"Image job {self.job_id} failed: {self.error}"
+        return f"Image job {self.job_id} is {self.status} - check again with image_job_status"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"job_id": self.job_id, "status": self.status, "path": self.path, "error": self.error}
+
+
+class ImageStore:
+    """Content-addressed image files plus an index from job key to image hash"""
+
+    def __init__(self, store_dir: str = STORE_DIR, limit_bytes: int = STORE_LIMIT_BYTES):
+        self.store_dir = store_dir
+        self.limit_bytes = limit_bytes
+        self._lock = threading.Lock()
+        os.makedirs(store_dir, exist_ok=True)
+        self._index: Dict[str, str] = self._load_index()
+
+    def _load_index(self) -> Dict[str, str]:
+        try:
+            with open(os.path.join(self.store_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        # Called with the lock held
+        path = os.path.join(self.store_dir, INDEX_FILE)
+        try:
+            with open(path + ".part", "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(path + ".part", path)
+        except OSError as e:
+            logger.warning("could not save image index: %s", e)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Stored image for a job key, or None (also when it has been evicted)"""
+        with self._lock:
+            name = self._index.get(key)
+        if not name:
+            return None
+        path = os.path.join(self.store_dir, name)
+        try:
+            os.utime(path)  # most recently used
+        except OSError:
+            with self._lock:
+                self._index.pop(key, None)
+            return None
+        return path
+
+    def put(self, key: str, data: bytes, output_format: str) -> str:
+        name = f"{hashlib.sha256(data).hexdigest()}.{output_format}"
+        path = os.path.join(self.store_dir, name)
+        if not os.path.exists(path):
+            with open(path + ".part", "wb") as f:
+                f.write(data)
+            os.replace(path + ".part", path)
+        with self._lock:
+            self._index[key] = name
+            self._save_index()
+        self.evict()
+        return path
+
+    def evict(self) -> None:
+        """Drop least recently used images beyond the size limit"""
+        try:
+            entries = [os.path.join(self.store_dir, name) for name in os.listdir(self.store_dir)
+                       if name != INDEX_FILE and not name.endswith(".part")]
+            stats = sorted(((os.stat(path), path) for path in entries if os.path.isfile(path)),
+                           key=lambda item: item[0].st_mtime)
+        except OSError:
+            return
+        total = sum(stat.st_size for stat, _ in stats)
+        removed = set()
+        for stat, path in stats:
+            if total <= self.limit_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= stat.st_size
+                removed.add(os.path.basename(path))
+            except OSError:
+                pass
+        if removed:
+            with self._lock:
+                self._index = {key: name for key, name in self._index.items() if name not in removed}
+                self._save_index()
+
+    def size_bytes(self) -> int:
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(self.store_dir)
+                       if entry.is_file() and entry.name != INDEX_FILE)
+        except OSError:
+            return 0
+
+
+def _generate(job: ImageJob) -> bytes:
+    """Run the strands generate_image tool for a job and return the image bytes"""
+    from strands_tools import generate_image
+
+    tool_input = {"prompt": job.prompt, **{name: value for name, value in job.params.items()
+                                           if name != "prompt" and value is not None}}
+    result = generate_image.generate_image({"toolUseId": job.job_id, "input": tool_input})
+    if result.get("status") != "success":
+        text = " ".join(block.get("text", "") for block in result.get("content", []))
+        raise RuntimeError(text.split("\n")[0].strip() or "image generation failed")
+    for block in result["content"]:
+        if "image" in block:
+            return block["image"]["source"]["bytes"]
+    raise RuntimeError("image generation returned no image")
+
+
+def publish_image(stored_path: str, prompt: str, output_format: str) -> str:
+    """Copy a stored image to ./output/<prompt words>.<format>, reusing an identical copy"""
+    from strands_tools.generate_image import create_filename
+
+    output_dir = os.path.join(os.getcwd(), "output")
+    os.makedirs(output_dir, exist_ok=True)
+    digest = os.path.basename(stored_path).split(".")[0]
+    base = create_filename(prompt) or "image"
+    candidate, i = os.path.join(output_dir, f"{base}.{output_format}"), 1
+    while os.path.exists(candidate):
+        with open(candidate, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() == digest:
+                return candidate
+        candidate, i = os.path.join(output_dir, f"{base}_{i}.{output_format}"), i + 1
+    shutil.copyfile(stored_path, candidate)
+    return candidate
+
+
+class ImageJobQueue:
+    """Deduplicating background queue of image generation jobs"""
+
+    def __init__(self, store: Optional[ImageStore] = None, max_workers: int = MAX_WORKERS):
+        self.store = store or ImageStore()
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ImageJob] = {}
+        self._active: Dict[str, ImageJob] = {}  # job key -> queued or running job
+        self._listeners: List[Callable[[ImageJob], None]] = []
+        self._notifications: deque = deque()
+        self._done = threading.Condition(self._lock)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Called with the lock held
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="frankie-image")
+        return self._executor
+
+    def add_listener(self, listener: Callable[[ImageJob], None]) -> None:
+        """Call listener(job) from the worker thread whenever a job finishes"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def submit(self, prompt: str, **params: Any) -> ImageJob:
+        """Job handle for a prompt: an existing identical job, a stored image, or a new queued job"""
+        job = self._submit(prompt, **params)
+        tracked = _tracked_jobs.get()
+        if tracked is not None and job not in tracked:
+            tracked.append(job)
+        return job
+
+    def _submit(self, prompt: str, **params: Any) -> ImageJob:
+        normalized = normalize_params(prompt, **params)
+        key = job_key(normalized)
+        job_params = {name: value for name, value in normalized.items() if name != "prompt"}
+        with self._lock:
+            active = self._active.get(key)
+            if active is not None:
+                return active
+            job = ImageJob(job_id=uuid.uuid4().hex[:8], key=key, prompt=prompt.strip(), params=job_params)
+            self._jobs[job.job_id] = job
+
+        stored = self.store.lookup(key)
+        if stored:
+            job.started = job.finished = time.time()
+            try:
+                job.path = publish_image(stored, job.prompt, job_params["output_format"])
+                job.status, job.cached = "done", True
+            except OSError as e:
+                job.status, job.error = "error", str(e)
+            return job
+
+        with self._lock:
+            # Another thread may have queued the same key while we checked the store
+            active = self._active.get(key)
+            if active is not None:
+                self._jobs.pop(job.job_id, None)
+                return active
+            self._active[key] = job
+            self._get_executor().submit(self._run, job)
+        return job
+
+    def _run(self, job: ImageJob) -> None:
+        job.status, job.started = "running", time.time()
+        try:
+            data = _generate(job)
+            stored = self.store.put(job.key, data, job.params["output_format"])
+            job.path = publish_image(stored, job.prompt, job.params["output_format"])
+            job.status = "done"
+        except Exception as e:
+            job.status, job.error = "error", str(e)
+        job.finished = time.time()
+        with self._lock:
+            self._active.pop(job.key, None)
+            self._notifications.append(job)
+            listeners = list(self._listeners)
+            self._done.notify_all()
+        for listener in listeners:
+            try:
+                listener(job)
+            except Exception as e:
+                logger.warning("image job listener failed: %s", e)
+
+    def get(self, job_id: str) -> Optional[ImageJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: float) -> Optional[ImageJob]:
+        """The job once it finishes, or as it is when the timeout runs out"""
+        deadline = time.time() + timeout
+        with self._lock:
+            job = self._jobs.get(job_id)
+            while job is not None and not job.done and time.time() < deadline:
+                self._done.wait(deadline - time.time())
+        return job
+
+    def jobs(self) -> List[ImageJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.submitted)
+
+    def drain_notifications(self) -> List[ImageJob]:
+        """Jobs finished since the last call, for a CLI to announce"""
+        with self._lock:
+            finished = list(self._notifications)
+            self._notifications.clear()
+        return finished
+
+    def stats(self) -> Dict[str, Any]:
+        jobs = self.jobs()
+        counts = {state: sum(1 for job in jobs if job.status == state) for state in JOB_STATES}
+        return {**counts, "reused": sum(1 for job in jobs if job.cached),
+                "store_mb": self.store.size_bytes() / (1024 * 1024)}
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+@contextmanager
+def track_jobs():
+    """Collect the image jobs submitted inside this block, including from tool threads"""
+    jobs: List[ImageJob] = []
+    token = _tracked_jobs.set(jobs)
+    try:
+        yield jobs
+    finally:
+        _tracked_jobs.reset(token)
+
+
+_queue: Optional[ImageJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_image_queue() -> ImageJobQueue:
+    """Process-wide image job queue, created on first use"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ImageJobQueue()
+        return _queue
+
+
+@tool
+def generate_image_async(
+    prompt: str,
+    aspect_ratio: str = None,
+    output_format: str = None,
+    model_id: str = None,
+    negative_prompt: str = None,
+    seed: int = None,
+) -> str:
+    """Start generating an image from a text prompt and return immediately with a job id.
+
+    The image is generated in the background and the user is notified when it is ready, so there is
+    no need to wait for it. Identical requests reuse an image that was already generated or is
+    being generated. Pass a seed only when the user wants a specific or different variant.
+
+    Args:
+        prompt: Detailed text description of the image
+        aspect_ratio: Aspect ratio, e.g. "1:1" (default), "16:9", "2:3", "3:2", "4:5", "5:4", "9:16", "21:9", "9:21"
+        output_format: "jpeg" (default) or "png"
+        model_id: stability.stable-image-core-v1:1 (default), stability.sd3-5-large-v1:0 or
+                  stability.stable-image-ultra-v1:1
+        negative_prompt: What the image should not contain (default "bad lighting, harsh lighting")
+        seed: Random seed for a reproducible variant
+
+    Returns:
+        The job id and status, or the file path when an identical image already exists
+    """
+    job = get_image_queue().submit(prompt, aspect_ratio=aspect_ratio, output_format=output_format,
+                                   model_id=model_id, negative_prompt=negative_prompt, seed=seed)
+    if job.done:
+        return job.message()
+    return (f"Image job {job.job_id} started for '{job.prompt}'. It will be saved under ./output and "
+            f"the user will be notified when it is ready.")
+
+
+@tool
+def image_job_status(job_id: str, wait_seconds: float = 0) -> str:
+    """Check on an image job started with generate_image_async.
+
+    Args:
+        job_id: Job id returned by generate_image_async
+        wait_seconds: Wait up to this many seconds for the job to finish (default: don't wait)
+
+    Returns:
+        The job's status, and its file path once finished
+    """
+    queue = get_image_queue()
+    job = queue.wait(job_id, wait_seconds) if wait_seconds > 0 else queue.get(job_id)
+    if job is None:
+        return f"No image job with id {job_id}"
+    return job.message()
@@ -1,7 +1,13 @@
 from strands import Agent, tool
 from strands_tools import memory, use_aws, retrieve
 from .markitdown_memory_tool import markitdown_convert
+from .agent_result import SubAgentResult
+from .agent_hooks import agent_hooks
+from .model_factory import enable_prompt_caching
+from .model_tiers import tiered_model
+from .event_bus import report_status
 import os
+import time
 
 memory_system_prompt = '''
 You are the Memory Brain Agent for the F.R.A.N.K.I.E. multiagent system.
@@ -63,7 +69,7 @@ Always format your responses clearly and provide context about what information
 '''
 
 @tool
-def use_memory_brain_agent(query: str) -> str:
+def use_memory_brain_agent(query: str) -> SubAgentResult:
     """
     Memory Brain Agent for managing knowledge base and system memory.
     
@@ -75,8 +81,9 @@ def use_memory_brain_agent(query: str) -> str:
         query: The memory-related task or query to process
             
     Returns:
-        str: Formatted response from the memory brain agent
+        SubAgentResult: Budgeted summary of the memory brain agent's response
     """
+    started = time.perf_counter()
     # Format the query for the memory agent with clear instructions
     formatted_query = f"""
 Memory Management Task: {query}
@@ -86,21 +93,19 @@ Provide clear feedback about what information was stored, retrieved, or organize
     """
     
     try:
-        print("🧠 Accessing Memory Brain Agent...")
+        report_status("🧠 Accessing Memory Brain Agent...")
         os.environ["BYPASS_TOOL_CONSENT"] = "true"
         # Create the memory brain agent with memory management tools
         memory_brain_agent = Agent(
             system_prompt=memory_system_prompt,
             tools=[memory, use_aws, retrieve, markitdown_convert],
+            hooks=agent_hooks("memory"),
         )
+        enable_prompt_caching(memory_brain_agent.model)
+        memory_brain_agent.model = tiered_model("memory", memory_brain_agent.model, query=query)
         
         agent_response = memory_brain_agent(formatted_query)
-        text_response = str(agent_response)
-
-        if len(text_response) > 0:
-            return f"\n🧠 MEMORY BRAIN RESPONSE 🧠\n{'='*50}\n{text_response}\n{'='*50}"
-
-        return "\033[1;31m❌ Error: No response received from the memory brain agent\033[0m"
+        return SubAgentResult.from_response("memory", agent_response, started)
         
     except Exception as e:
-        return f"Memory Brain Agent Error: {str(e)}\nPlease check your memory request and try again."
\ No newline at end of file
+        return SubAgentResult.error("memory", f"Memory Brain Agent Error: {str(e)}\nPlease check your memory request and try again.", started)
\ No newline at end of file
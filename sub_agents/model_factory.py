@@ -0,0 +1,107 @@
+"""
+Bedrock model factory for F.R.A.N.K.I.E. sub-agents
+
+Builds the BedrockModel for a sub-agent from its base settings and a
+per-request `BudgetDecision`. Models are cached per (agent, model, thinking
+budget, max_tokens) and share one boto3 session, so adaptive budgets don't
+mean a new Bedrock client on every request.
+
+Every Claude model also gets prompt caching: cache points after the static
+system prompt (`cache_prompt`) and the tool specs (`cache_tools`), so repeated
+calls read that prefix from the cache instead of paying full input cost and
+time-to-first-token for it. These model-level settings work on every
+strands-agents release; newer ones also offer CacheConfig, whose fields vary
+between versions.
+"""
+
+import os
+import threading
+import warnings
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from strands.models import BedrockModel
+
+from .budget_policy import AGENT_BOUNDS, BudgetDecision
+
+DEFAULT_MODEL_ID = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+PROMPT_CACHING = os.getenv("FRANKIE_PROMPT_CACHE", "1") != "0"
+
+# Newer strands releases flag the model-level cache settings as deprecated; they still work everywhere
+warnings.filterwarnings("ignore", message="cache_(prompt|tools) is deprecated")
+
+# Beta features each agent needs on every request
+AGENT_BETAS = {
+    "browser": ["interleaved-thinking-2025-05-14"],
+    "coding": ["interleaved-thinking-2025-05-14"],
+    "computer": ["interleaved-thinking-2025-05-14", "computer-use-2025-01-24"],
+}
+
+_models: Dict[Tuple, BedrockModel] = {}
+_models_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_boto_session() -> boto3.Session:
+    """One boto3 session shared by every sub-agent model"""
+    return boto3.Session()
+
+
+def _client_config() -> Config:
+    return Config(
+        read_timeout=900,
+        connect_timeout=900,
+        retries=dict(max_attempts=3, mode="adaptive"),
+    )
+
+
+def prompt_cache_settings(model_id: str) -> Dict[str, str]:
+    """BedrockModel settings placing cache points after the system prompt and the tool specs"""
+    model_id = (model_id or "").lower()
+    # Bedrock rejects cache points for models without prompt caching support
+    if not PROMPT_CACHING or not ("claude" in model_id or "anthropic" in model_id):
+        return {}
+    return {"cache_prompt": "default", "cache_tools": "default"}
+
+
+def enable_prompt_caching(model) -> None:
+    """Turn on prompt caching for a model built elsewhere (e.g. an Agent's default model)"""
+    if isinstance(model, BedrockModel):
+        settings = prompt_cache_settings(model.get_config().get("model_id", ""))
+        if settings:
+            model.update_config(**settings)
+
+
+def default_decision(agent: str) -> BudgetDecision:
+    """The agent's configured maximum budget, used when there is no query to size it from"""
+    bounds = AGENT_BOUNDS[agent]
+    return BudgetDecision(agent, "complex", bounds.thinking_cap, bounds.max_tokens_cap, 0.0, "default")
+
+
+def build_model(agent: str, decision: Optional[BudgetDecision] = None, model_id: Optional[str] = None) -> BedrockModel:
+    """Return a (cached) BedrockModel configured for the agent and budget decision"""
+    decision = decision or default_decision(agent)
+    model_id = model_id or os.getenv(f"FRANKIE_{agent.upper()}_MODEL_ID", DEFAULT_MODEL_ID)
+    key = (agent, model_id, decision.thinking_budget if decision.thinking_enabled else 0, decision.max_tokens)
+
+    with _models_lock:
+        model = _models.get(key)
+        if model is not None:
+            return model
+
+        additional_request_fields = {"anthropic_beta": list(AGENT_BETAS.get(agent, []))}
+        if decision.thinking_enabled:
+            additional_request_fields["thinking"] = {"type": "enabled", "budget_tokens": decision.thinking_budget}
+
+        model = BedrockModel(
+            model_id=model_id,
+            max_tokens=decision.max_tokens,
+            boto_session=get_boto_session(),
+            boto_client_config=_client_config(),
+            additional_request_fields=additional_request_fields,
+            **prompt_cache_settings(model_id),
+        )
+        _models[key] = model
+        return model
@@ -0,0 +1,359 @@
+"""
+Record/replay of model calls for offline F.R.A.N.K.I.E. benchmarks
+
+Benchmarking FRANKIE against live Bedrock mixes our own overhead with model
+latency and costs real tokens, so regressions in FRANKIE itself go unseen.
+This module puts a record/replay layer at the model boundary:
+
+    FRANKIE_MODEL_MODE=record   every model call is passed through to Bedrock and
+                                its stream events, time-to-first-token and latency
+                                are appended to FRANKIE_REPLAY_DIR/<agent>.jsonl
+    FRANKIE_MODEL_MODE=replay   model calls are answered from those fixtures with
+                                simulated latency - no Bedrock, no credentials
+
+Third-party tools (browser, desktop, shell, ...) and FRANKIE's image jobs are
+recorded and stubbed the same way, so a replay never clicks, types, browses or
+generates images. FRANKIE's other tools - the sub-agent tools, diagrams and
+fetch_tool_output - always run for real, which is what makes a replay exercise
+the whole orchestration path.
+
+Replayed latency comes from FRANKIE_REPLAY_LATENCY:
+
+    recorded                   the latency captured with the fixture (default)
+    zero                       no waiting - pure FRANKIE overhead
+    fixed:<seconds>            every model call takes the same time
+    lognormal:<median>:<sigma> sampled per call, seeded by FRANKIE_REPLAY_SEED
+
+Fixtures are matched on a hash of the model, system prompt, tool names and
+messages (tool use ids excluded). When nothing matches exactly, the next
+recording with the same system prompt and conversation length is used, so
+small prompt changes don't invalidate a whole fixture set.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
+
+from strands.hooks import AfterToolCallEvent, BeforeToolCallEvent, HookProvider, HookRegistry
+from strands.models import Model
+from strands.tools.tools import PythonAgentTool
+
+from .frankie_home import frankie_path
+
+logger = logging.getLogger(__name__)
+
+MODEL_MODE = os.getenv("FRANKIE_MODEL_MODE", "live").lower()
+REPLAY_DIR = os.getenv("FRANKIE_REPLAY_DIR", frankie_path("replay"))
+REPLAY_LATENCY = os.getenv("FRANKIE_REPLAY_LATENCY", "recorded")
+REPLAY_SEED = os.getenv("FRANKIE_REPLAY_SEED")
+
+# Tools defined in these packages are FRANKIE's own and always run, even in replay
+FRANKIE_PACKAGES = ("sub_agents", "agent_registry")
+# ...except these, which call paid external services and are recorded and stubbed like third-party tools
+EXTERNAL_FRANKIE_TOOLS = ("generate_image_async", "image_job_status")
+
+
+class ReplayMissError(Exception):
+    """No recorded model response matches a replayed call"""
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:24]
+
+
+def _strip_ids(value: Any) -> Any:
+    """Drop toolUseIds, which differ between a recording and its replay"""
+    if isinstance(value, dict):
+        return {k: _strip_ids(v) for k, v in value.items() if k != "toolUseId"}
+    if isinstance(value, list):
+        return [_strip_ids(v) for v in value]
+    return value
+
+
+def call_keys(model_id: str, messages: list, tool_specs: Optional[list], system_prompt: Optional[str]) -> Tuple[str, str]:
+    """Exact key of a model call, and the looser key used when nothing matches exactly"""
+    tool_names = sorted(spec["name"] for spec in tool_specs or [])
+    exact = _digest([model_id, system_prompt, tool_names, _strip_ids(messages)])
+    shape = _digest([model_id, system_prompt, tool_names, len(messages)])
+    return exact, shape
+
+
+def tool_key(tool_name: str, tool_input: Any) -> str:
+    return _digest([tool_name, tool_input])
+
+
+def is_frankie_tool(tool) -> bool:
+    if getattr(tool, "tool_name", None) in EXTERNAL_FRANKIE_TOOLS:
+        return False
+    func = getattr(tool, "_tool_func", None)
+    module = getattr(func, "__module__", None) or type(tool).__module__
+    return module.split(".")[0] in FRANKIE_PACKAGES
+
+
+class LatencyModel:
+    """Simulated model latency for replayed calls"""
+
+    def __init__(self, spec: str = REPLAY_LATENCY, seed: Optional[str] = REPLAY_SEED):
+        self.spec = spec
+        self.kind, _, params = spec.partition(":")
+        self.params = [float(p) for p in params.split(":") if p]
+        self._random = random.Random(seed)
+        if self.kind not in ("recorded", "zero", "fixed", "lognormal"):
+            raise ValueError(f"Unknown replay latency '{spec}' - use recorded, zero, fixed:<s> or lognormal:<median>:<sigma>")
+
+    def sample(self, recorded_s: float) -> float:
+        if self.kind == "recorded":
+            return recorded_s
+        if self.kind == "zero":
+            return 0.0
+        if self.kind == "fixed":
+            return self.params[0]
+        median, sigma = self.params
+        return self._random.lognormvariate(math.log(median), sigma)
+
+
+class FixtureStore:
+    """Recorded model responses and tool results, one JSON-lines file per agent"""
+
+    def __init__(self, root: str = REPLAY_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._cursors: Dict[str, int] = {}
+
+    def _path(self, agent: str) -> str:
+        return os.path.join(self.root, f"{agent}.jsonl")
+
+    def append(self, agent: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, open(self._path(agent), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    def _index(self, agent: str) -> Dict[str, List[Dict[str, Any]]]:
+        # Called with the lock held
+        if agent not in self._loaded:
+            index: Dict[str, List[Dict[str, Any]]] = {}
+            path = self._path(agent)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        index.setdefault(entry["key"], []).append(entry)
+                        if "shape" in entry:
+                            index.setdefault(f"shape:{entry['shape']}", []).append(entry)
+            self._loaded[agent] = index
+        return self._loaded[agent]
+
+    def lookup(self, agent: str, *keys: str) -> Optional[Dict[str, Any]]:
+        """Next recording for the first key that has one; repeated calls cycle through repeated recordings"""
+        with self._lock:
+            index = self._index(agent)
+            for key in keys:
+                entries = index.get(key)
+                if entries:
+                    cursor = self._cursors.get(f"{agent}:{key}", 0)
+                    self._cursors[f"{agent}:{key}"] = cursor + 1
+                    return entries[cursor % len(entries)]
+        return None
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._cursors.clear()
+
+
+class ReplayClock:
+    """Simulated seconds spent waiting on replayed models and stubbed tools"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.model_s = 0.0
+        self.tool_s = 0.0
+        self.model_calls = 0
+        self.misses = 0
+
+    def add_model(self, seconds: float) -> None:
+        with self._lock:
+            self.model_s += seconds
+            self.model_calls += 1
+
+    def add_tool(self, seconds: float) -> None:
+        with self._lock:
+            self.tool_s += seconds
+
+    def add_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.model_s = self.tool_s = 0.0
+            self.model_calls = self.misses = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {"model_s": self.model_s, "tool_s": self.tool_s, "model_calls": self.model_calls,
+                    "misses": self.misses}
+
+
+FIXTURES = FixtureStore()
+REPLAY_CLOCK = ReplayClock()
+
+
+class _ModelWrapper(Model):
+    """Delegates configuration to the wrapped model"""
+
+    def __init__(self, agent: str, inner: Model):
+        self.agent = agent
+        self.inner = inner
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.inner.get_config()
+
+    def get_config(self) -> Any:
+        return self.inner.get_config()
+
+    def update_config(self, **model_config: Any) -> None:
+        self.inner.update_config(**model_config)
+
+    @property
+    def stateful(self) -> bool:
+        return self.inner.stateful
+
+    async def count_tokens(self, *args, **kwargs) -> int:
+        return await self.inner.count_tokens(*args, **kwargs)
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        return self.inner.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    def _model_id(self) -> str:
+        return self.get_config().get("model_id", "")
+
+
+class RecordingModel(_ModelWrapper):
+    """Passes calls through to the real model and records them as fixtures"""
+
+    def __init__(self, agent: str, inner: Model, fixtures: FixtureStore = FIXTURES):
+        super().__init__(agent, inner)
+        self.fixtures = fixtures
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncIterable[Dict[str, Any]]:
+        exact, shape = call_keys(self._model_id(), messages, tool_specs, system_prompt)
+        events: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        first_event_s = None
+        async for event in self.inner.stream(messages, tool_specs, system_prompt, **kwargs):
+            if first_event_s is None:
+                first_event_s = time.perf_counter() - started
+            events.append(event)
+            yield event
+        self.fixtures.append(self.agent, {
+            "kind": "model",
+            "key": exact,
+            "shape": shape,
+            "model_id": self._model_id(),
+            "events": events,
+            "ttft_s": round(first_event_s or 0.0, 4),
+            "latency_s": round(time.perf_counter() - started, 4),
+            "recorded_at": time.time(),
+        })
+
+
+class ReplayModel(_ModelWrapper):
+    """Answers calls from recorded fixtures with simulated latency"""
+
+    def __init__(self, agent: str, inner: Model, fixtures: FixtureStore = FIXTURES,
+                 latency: Optional[LatencyModel] = None, clock: ReplayClock = REPLAY_CLOCK):
+        super().__init__(agent, inner)
+        self.fixtures = fixtures
+        self.latency = latency or LatencyModel()
+        self.clock = clock
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncIterable[Dict[str, Any]]:
+        exact, shape = call_keys(self._model_id(), messages, tool_specs, system_prompt)
+        fixture = self.fixtures.lookup(self.agent, exact, f"shape:{shape}")
+        if fixture is None:
+            self.clock.add_miss()
+            raise ReplayMissError(f"No recorded {self.agent} response for this call - "
+                                  f"record one with FRANKIE_MODEL_MODE=record")
+
+        recorded = fixture["latency_s"]
+        total = self.latency.sample(recorded)
+        ttft = total * (fixture["ttft_s"] / recorded if recorded else 0.3)
+        events = fixture["events"]
+        per_event = (total - ttft) / max(1, len(events) - 1)
+        self.clock.add_model(total)
+
+        await asyncio.sleep(ttft)
+        for i, event in enumerate(events):
+            if i:
+                await asyncio.sleep(per_event)
+            yield event
+
+
+class ReplayToolHooks(HookProvider):
+    """Records third-party tool results, or stubs those tools with their recordings during replay"""
+
+    def __init__(self, agent_name: str, mode: str = MODEL_MODE, fixtures: FixtureStore = FIXTURES,
+                 clock: ReplayClock = REPLAY_CLOCK):
+        self.agent_name = agent_name
+        self.mode = mode
+        self.fixtures = fixtures
+        self.clock = clock
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        if self.mode == "record":
+            registry.add_callback(AfterToolCallEvent, self._record_tool)
+        elif self.mode == "replay":
+            registry.add_callback(BeforeToolCallEvent, self._stub_tool)
+
+    def _record_tool(self, event: AfterToolCallEvent) -> None:
+        if event.selected_tool is None or is_frankie_tool(event.selected_tool) or event.exception is not None:
+            return
+        name = event.tool_use.get("name")
+        self.fixtures.append(self.agent_name, {
+            "kind": "tool",
+            "key": tool_key(name, event.tool_use.get("input")),
+            "tool": name,
+            "result": _strip_ids(event.result),
+            "duration_s": round(event.duration or 0.0, 4),
+        })
+
+    def _stub_tool(self, event: BeforeToolCallEvent) -> None:
+        tool = event.selected_tool
+        if tool is None or is_frankie_tool(tool):
+            return
+        name = event.tool_use.get("name")
+        fixture = self.fixtures.lookup(self.agent_name, tool_key(name, event.tool_use.get("input")))
+        wait = fixture["duration_s"] if fixture is not None and REPLAY_LATENCY == "recorded" else 0.0
+        self.clock.add_tool(wait)
+        if fixture is None:
+            self.clock.add_miss()
+
+        def replayed(tool_use, **kwargs):
+            time.sleep(wait)
+            if fixture is None:
+                return {"toolUseId": tool_use["toolUseId"], "status": "error",
+                        "content": [{"text": f"Replay: no recorded result for {name}"}]}
+            return {**fixture["result"], "toolUseId": tool_use["toolUseId"]}
+
+        event.selected_tool = PythonAgentTool(name, tool.tool_spec, replayed)
+
+
+def instrument_model(agent: str, model: Model) -> Model:
+    """Wrap a model for recording or replay according to FRANKIE_MODEL_MODE"""
+    if MODEL_MODE == "record":
+        return RecordingModel(agent, model)
+    if MODEL_MODE == "replay":
+        return ReplayModel(agent, model)
+    return model
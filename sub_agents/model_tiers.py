@@ -0,0 +1,319 @@
+"""
+Model tiering for F.R.A.N.K.I.E. agents
+
+Most model calls don't need Sonnet: the orchestrator picking a sub-agent
+tool, or the content agent picking between `diagram` and `generate_image`,
+is a routing decision a small model makes in a fraction of the time.
+`TieredModel` wraps an agent's model and sends eligible calls to a fast
+model first:
+
+    eligible    the turn is simple (budget tier, or complexity score of the
+                request) and, in "routing" mode, the call is the first of the
+                turn rather than a follow-up on tool results
+    escalate    the fast model fails, stops at max_tokens, calls an unknown
+                tool, sends invalid tool input, answers nothing, or hedges
+                → the same call is re-run on the strong model
+
+The fast model's response is buffered until it passes those checks, so an
+escalated call never reaches the agent twice. Once a turn escalates, its
+remaining calls stay on the strong model.
+
+Configured per agent through the environment:
+
+    FRANKIE_<AGENT>_MODEL_TIERING     off | routing | all
+    FRANKIE_<AGENT>_FAST_MODEL_ID     defaults to FRANKIE_FAST_MODEL_ID (Haiku 4.5)
+
+Every tiered call is logged to FRANKIE_HOME/model_tiers.jsonl with the model
+that served it, its latency and any escalation; `tier_summary()` aggregates
+the log for the CLI `tiers` command.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, AsyncIterable, Dict, List, Optional
+
+from strands.models import Model
+
+from .budget_policy import BudgetDecision, complexity_score, query_features
+from .frankie_home import frankie_path
+from .model_factory import build_model
+from .model_replay import instrument_model
+from .session_context import current_session_id
+from .usage_metrics import percentile
+
+logger = logging.getLogger(__name__)
+
+FAST_MODEL_ID = os.getenv("FRANKIE_FAST_MODEL_ID", "us.anthropic.claude-haiku-4-5-20251001-v1:0")
+FAST_MAX_TOKENS = int(os.getenv("FRANKIE_FAST_MAX_TOKENS", "4096"))
+# Requests scoring at or above this go straight to the strong model (3.0 is the budget policy's complex tier)
+FAST_MAX_SCORE = float(os.getenv("FRANKIE_FAST_MAX_SCORE", "3.0"))
+TIER_LOG = os.getenv("FRANKIE_TIER_LOG", frankie_path("model_tiers.jsonl"))
+
+TIERING_MODES = ("off", "routing", "all")
+# Computer use needs the strong model's screen understanding; browser and coding turns are rarely trivial
+DEFAULT_TIERING = {
+    "orchestrator": "routing",
+    "content": "all",
+    "memory": "routing",
+    "browser": "off",
+    "coding": "off",
+    "computer": "off",
+}
+
+LOW_CONFIDENCE_MARKERS = (
+    "i'm not sure", "i am not sure", "not certain", "i don't know", "i do not know",
+    "could you clarify", "can you clarify", "unclear what", "i cannot determine", "i can't determine",
+)
+
+
+def tiering_mode(agent: str) -> str:
+    mode = os.getenv(f"FRANKIE_{agent.upper()}_MODEL_TIERING", DEFAULT_TIERING.get(agent, "off")).lower()
+    if mode not in TIERING_MODES:
+        logger.warning("unknown model tiering mode %r for %s - tiering disabled", mode, agent)
+        return "off"
+    return mode
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    return " ".join(block["text"] for block in message.get("content", []) if "text" in block)
+
+
+def _has_tool_results(message: Dict[str, Any]) -> bool:
+    return any("toolResult" in block for block in message.get("content", []))
+
+
+def check_fast_response(events: List[Dict[str, Any]], tool_specs: Optional[list]) -> Optional[str]:
+    """Return why a buffered fast-model response should be escalated, or None if it can be used"""
+    specs = {spec["name"]: spec for spec in tool_specs or []}
+    stop_reason = None
+    text_parts: List[str] = []
+    tool_uses: List[Dict[str, Any]] = []
+
+    for event in events:
+        if "contentBlockStart" in event:
+            tool_use = event["contentBlockStart"].get("start", {}).get("toolUse")
+            if tool_use:
+                tool_uses.append({"name": tool_use.get("name"), "input": ""})
+        elif "contentBlockDelta" in event:
+            delta = event["contentBlockDelta"].get("delta", {})
+            if "text" in delta:
+                text_parts.append(delta["text"])
+            elif "toolUse" in delta and tool_uses:
+                tool_uses[-1]["input"] += delta["toolUse"].get("input", "")
+        elif "messageStop" in event:
+            stop_reason = event["messageStop"].get("stopReason")
+
+    if stop_reason in ("max_tokens", "content_filtered", "guardrail_intervened"):
+        return f"stop reason {stop_reason}"
+
+    for tool_use in tool_uses:
+        spec = specs.get(tool_use["name"])
+        if spec is None:
+            return f"unknown tool {tool_use['name']}"
+        try:
+            tool_input = json.loads(tool_use["input"] or "{}")
+        except json.JSONDecodeError:
+            return f"invalid input for {tool_use['name']}"
+        required = spec.get("inputSchema", {}).get("json", {}).get("required", [])
+        missing = [name for name in required if name not in tool_input]
+        if missing:
+            return f"{tool_use['name']} missing {', '.join(missing)}"
+
+    text = "".join(text_parts).strip().lower()
+    if not tool_uses and not text:
+        return "empty response"
+    marker = next((marker for marker in LOW_CONFIDENCE_MARKERS if marker in text), None)
+    if marker:
+        return f"low confidence ({marker!r})"
+    return None
+
+
+class TierLog:
+    """Append-only JSON-lines log of tiered model calls"""
+
+    def __init__(self, path: Optional[str] = TIER_LOG):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, **entry) -> None:
+        if not self.path:
+            return
+        entry = {"ts": time.time(), "session_id": current_session_id(), **entry}
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass
+
+    def entries(self, since_days: Optional[int] = None) -> List[Dict[str, Any]]:
+        if not self.path or not os.path.exists(self.path):
+            return []
+        cutoff = time.time() - since_days * 86400 if since_days is not None else 0
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("ts", 0) >= cutoff:
+                    entries.append(entry)
+        return entries
+
+
+TIER_LOG_STORE = TierLog()
+
+
+def tier_summary(log: TierLog = TIER_LOG_STORE, since_days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Per-agent share of calls served by the fast model, escalation rate and latency per tier"""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in log.entries(since_days):
+        groups.setdefault(entry.get("agent", "-"), []).append(entry)
+
+    summary = []
+    for agent, entries in groups.items():
+        fast = [e for e in entries if e["served_by"] == "fast"]
+        strong = [e for e in entries if e["served_by"] == "strong"]
+        attempted = [e for e in entries if e["tier"] == "fast"]
+        escalated = [e for e in attempted if e.get("escalation")]
+        reasons = Counter(e["escalation"].split(" (")[0] for e in escalated)
+        summary.append({
+            "agent": agent,
+            "calls": len(entries),
+            "fast_calls": len(fast),
+            "escalations": len(escalated),
+            "escalation_rate": len(escalated) / len(attempted) if attempted else 0.0,
+            "fast_p50_s": percentile([e["latency_s"] for e in fast], 50),
+            "strong_p50_s": percentile([e["latency_s"] for e in strong], 50),
+            "wasted_s": sum(e.get("fast_latency_s", 0.0) for e in escalated),
+            "top_escalation": reasons.most_common(1)[0][0] if reasons else "",
+        })
+    return sorted(summary, key=lambda item: item["calls"], reverse=True)
+
+
+class TieredModel(Model):
+    """Serves eligible calls from a fast model and escalates them to the strong model when they fail a check"""
+
+    def __init__(self, agent: str, strong: Model, fast: Model, mode: str, query: Optional[str] = None,
+                 decision: Optional[BudgetDecision] = None, log: TierLog = TIER_LOG_STORE):
+        self.agent = agent
+        self.strong = strong
+        self.fast = fast
+        self.mode = mode
+        self.query = query
+        self.decision = decision
+        self.log = log
+        self.last_model = strong
+        self._escalated_turn = False
+
+    # Usage accounting reads `model.config`; report the model that served the latest call
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.last_model.get_config()
+
+    def get_config(self) -> Any:
+        return self.strong.get_config()
+
+    def update_config(self, **model_config: Any) -> None:
+        self.strong.update_config(**model_config)
+
+    @property
+    def stateful(self) -> bool:
+        return self.strong.stateful
+
+    async def count_tokens(self, *args, **kwargs) -> int:
+        return await self.strong.count_tokens(*args, **kwargs)
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        return self.strong.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    def choose_tier(self, messages: List[Dict[str, Any]]) -> tuple:
+        """Pick "fast" or "strong" for the next call, with the reason"""
+        last = messages[-1] if messages else {}
+        follow_up = _has_tool_results(last)
+        if not follow_up:
+            self._escalated_turn = False
+
+        if self.mode == "off":
+            return "strong", "tiering off"
+        if self._escalated_turn:
+            return "strong", "turn already escalated"
+        if follow_up and self.mode == "routing":
+            return "strong", "follow-up on tool results"
+        if self.decision is not None:
+            if self.decision.tier != "simple":
+                return "strong", f"{self.decision.tier} budget tier"
+            return "fast", "simple budget tier"
+
+        request = self.query if self.query is not None else next(
+            (_message_text(m) for m in reversed(messages) if m.get("role") == "user" and not _has_tool_results(m)), "")
+        score = complexity_score(query_features(request))
+        if score >= FAST_MAX_SCORE:
+            return "strong", f"complexity score {score:.1f}"
+        return "fast", f"complexity score {score:.1f}"
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncIterable[Dict[str, Any]]:
+        tier, reason = self.choose_tier(messages)
+        started = time.perf_counter()
+        escalation = None
+        fast_latency = 0.0
+
+        if tier == "fast":
+            events: List[Dict[str, Any]] = []
+            try:
+                async for event in self.fast.stream(messages, tool_specs, system_prompt, **kwargs):
+                    events.append(event)
+                escalation = check_fast_response(events, tool_specs)
+            except Exception as e:
+                escalation = f"fast model error {type(e).__name__}"
+            fast_latency = time.perf_counter() - started
+
+            if escalation is None:
+                self.last_model = self.fast
+                self._record(tier, reason, "fast", started, fast_latency, None)
+                for event in events:
+                    yield event
+                return
+            self._escalated_turn = True
+            logger.info("model tier | agent=%s escalated to strong model: %s", self.agent, escalation)
+
+        self.last_model = self.strong
+        try:
+            async for event in self.strong.stream(messages, tool_specs, system_prompt, **kwargs):
+                yield event
+        finally:
+            self._record(tier, reason, "strong", started, fast_latency, escalation)
+
+    def _record(self, tier: str, reason: str, served_by: str, started: float, fast_latency: float,
+                escalation: Optional[str]) -> None:
+        self.log.record(
+            agent=self.agent,
+            tier=tier,
+            reason=reason,
+            served_by=served_by,
+            model_id=(self.fast if served_by == "fast" else self.strong).get_config().get("model_id", ""),
+            latency_s=round(time.perf_counter() - started, 4),
+            fast_latency_s=round(fast_latency, 4),
+            escalation=escalation,
+        )
+
+
+def tiered_model(agent: str, strong: Model, query: Optional[str] = None,
+                 decision: Optional[BudgetDecision] = None) -> Model:
+    """Wrap an agent's model with fast-model tiering, or return it unchanged when tiering is off
+
+    Every agent's model passes through here, so this is also where models are
+    instrumented for record/replay (see model_replay).
+    """
+    strong = instrument_model(agent, strong)
+    mode = tiering_mode(agent)
+    if mode == "off":
+        return strong
+    fast_model_id = os.getenv(f"FRANKIE_{agent.upper()}_FAST_MODEL_ID", FAST_MODEL_ID)
+    fast_decision = BudgetDecision(agent, "simple", 0, FAST_MAX_TOKENS, 0.0, "fast model tier")
+    fast = instrument_model(agent, build_model(agent, fast_decision, model_id=fast_model_id))
+    return TieredModel(agent, strong, fast, mode, query=query, decision=decision)
@@ -0,0 +1,80 @@
+"""
+Tool Output Store
+
+Content-addressed store for large tool outputs. Conversation history keeps a
+short excerpt plus a reference; the full text stays on disk under
+FRANKIE_HOME and can be fetched back by any agent with `fetch_tool_output`.
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from strands import tool
+
+from .frankie_home import frankie_path
+
+DEFAULT_PAGE_SIZE = 8000
+
+
+class OutputStore:
+    """Stores text blobs by the hash of their content"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or frankie_path("tool_outputs", "")
+
+    def _path(self, ref: str) -> str:
+        return os.path.join(self.root, ref[:2], f"{ref}.txt")
+
+    def put(self, text: str) -> str:
+        """Store text and return its reference; identical outputs are stored once"""
+        data = text.encode("utf-8")
+        ref = hashlib.sha256(data).hexdigest()[:20]
+        path = self._path(ref)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        return ref
+
+    def get(self, ref: str) -> Optional[str]:
+        if not ref.isalnum():
+            return None
+        try:
+            with open(self._path(ref), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+OUTPUT_STORE = OutputStore()
+
+
+@tool
+def fetch_tool_output(ref: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+    """
+    Retrieve the full text of a tool output that was offloaded from the conversation history.
+
+    Older, large tool results are replaced in the history by an excerpt and a reference.
+    Use this tool when you need details from such a result.
+
+    Args:
+        ref: The output reference shown in the history (e.g. "3f9a1c...")
+        offset: Character offset to start reading from
+        limit: Maximum number of characters to return
+
+    Returns:
+        A dictionary containing the status and the requested slice of the output
+    """
+    text = OUTPUT_STORE.get(ref.strip())
+    if text is None:
+        return {"status": "error", "content": [{"text": f"No stored tool output with reference '{ref}'"}]}
+
+    offset = max(0, offset)
+    chunk = text[offset:offset + max(1, limit)]
+    end = offset + len(chunk)
+    remaining = len(text) - end
+    footer = f"\n\n[{remaining} more characters - call again with offset={end}]" if remaining > 0 else ""
+    return {"status": "success", "content": [{"text": chunk + footer}]}
@@ -0,0 +1,166 @@
+"""
+Child side of a FRANKIE Python worker (see python_workers.py)
+
+Runs as its own interpreter with no FRANKIE or strands imports, so a fresh
+worker is ready in the time it takes to import the preload modules. Requests
+and replies are JSON lines: the protocol uses private copies of stdin/stdout,
+and fds 0/1 are pointed at /dev/null and stderr so user code calling input()
+or writing to the raw file descriptors can't corrupt it.
+
+    argv[1]  {"preload": ["numpy", ...], "limits": {"cpu_s": 1800, "memory_bytes": ..., "open_files": 1024}}
+    -> {"code": "...", "reset": false, "cpu_seconds": 60, "max_output": 20000}
+    <- {"stdout": "...", "error": null, "duration_s": 0.01, "cpu_s": 0.01}
+
+Variables persist in one namespace between requests until a reset. A request
+that runs past its CPU allowance gets a CPUTimeExceeded exception (SIGXCPU on
+the soft limit) and the namespace survives. The hard limits from argv are set
+before anything else runs, and a process can't raise its own hard limits.
+"""
+
+import ast
+import builtins
+import importlib
+import io
+import json
+import os
+import signal
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None
+
+
+class CPUTimeExceeded(Exception):
+    """The request used up its CPU time allowance"""
+
+
+def _on_sigxcpu(signum, frame):
+    raise CPUTimeExceeded("CPU time limit exceeded")
+
+
+def _fresh_namespace(preloaded):
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    namespace.update(preloaded)
+    return namespace
+
+
+def _preload(names):
+    modules = {}
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            continue
+        top = name.split(".")[0]
+        modules[top] = sys.modules[top]
+    return modules
+
+
+def _apply_limits(limits):
+    if resource is None:
+        return
+    for limit, value in ((resource.RLIMIT_CPU, limits.get("cpu_s")),
+                         (resource.RLIMIT_AS, limits.get("memory_bytes")),
+                         (resource.RLIMIT_NOFILE, limits.get("open_files"))):
+        if not value:
+            continue
+        try:
+            _, hard = resource.getrlimit(limit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            resource.setrlimit(limit, (value, value))
+        except (ValueError, OSError):
+            pass  # e.g. RLIMIT_AS can't be enforced on macOS
+
+
+def _cpu_used():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _limit_cpu(seconds):
+    """Move the soft CPU limit to `seconds` from now (never past the hard limit)"""
+    if resource is None:
+        return
+    seconds = seconds or 3600
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(_cpu_used() + seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _execute(code, namespace):
+    """Run code REPL-style: the value of a trailing expression is echoed"""
+    tree = ast.parse(code, "<python_repl>", mode="exec")
+    last = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last = ast.Expression(tree.body.pop().value)
+    exec(compile(tree, "<python_repl>", "exec"), namespace)
+    if last is not None:
+        value = eval(compile(last, "<python_repl>", "eval"), namespace)
+        if value is not None:
+            print(repr(value))
+
+
+def _user_traceback(tb):
+    """The traceback from the first frame of the user's code on, without the worker's own frames"""
+    while tb is not None and tb.tb_frame.f_code.co_filename != "<python_repl>":
+        tb = tb.tb_next
+    return tb
+
+
+def main():
+    config = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    # Private protocol channel; the standard fds become harmless for user code
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+    sys.stdin = open(os.devnull, "r")
+
+    _apply_limits(config.get("limits", {}))
+    if resource is not None:
+        signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    preloaded = _preload(config.get("preload", []))
+    namespace = _fresh_namespace(preloaded)
+    replies.write(json.dumps({"ready": True, "pid": os.getpid(), "preloaded": sorted(preloaded)}) + "\n")
+
+    for line in requests:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        if request.get("reset"):
+            namespace = _fresh_namespace(preloaded)
+        output = io.StringIO()
+        error = None
+        started, cpu_started = time.perf_counter(), _cpu_used() if resource else 0.0
+        try:
+            _limit_cpu(request.get("cpu_seconds"))
+            with redirect_stdout(output), redirect_stderr(output):
+                _execute(request.get("code", ""), namespace)
+        except CPUTimeExceeded:
+            error = f"CPUTimeExceeded: stopped after {request.get('cpu_seconds')}s of CPU time"
+        except BaseException as e:  # SystemExit and KeyboardInterrupt from user code are results too
+            error = "".join(traceback.format_exception(type(e), e, _user_traceback(e.__traceback__)))
+        text = output.getvalue()
+        max_output = request.get("max_output") or len(text)
+        if len(text) > max_output:
+            text = text[:max_output] + f"\n... [{len(text) - max_output} more characters truncated]"
+        replies.write(json.dumps({
+            "stdout": text,
+            "error": error,
+            "duration_s": time.perf_counter() - started,
+            "cpu_s": (_cpu_used() - cpu_started) if resource else 0.0,
+        }) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Warm Python workers for the Coding Buddy's python_repl
+
+The coding agent is rebuilt for every request, and the strands python_repl
+runs code in the agent's own process, so every code execution starts from
+whatever state happened to be left behind, re-imports its libraries and can
+take FRANKIE down with it. This module gives each session its own Python
+worker process instead:
+
+    warm       workers import common modules at start-up, and a spare worker
+               is kept ready so a new session doesn't wait for an interpreter
+    stateful   variables, imports and definitions persist between calls from
+               the same session (current_session_id()) until reset_state
+    limited    each worker runs in its own process group with rlimits: CPU
+               time per call and per worker, address space and open files.
+               A call that runs past its wall-clock timeout kills the worker
+               (the session starts fresh on its next call).
+    recycled   workers idle for longer than the idle timeout are stopped (spares
+               that waited that long are replaced), and the least recently
+               used session's worker makes room when the pool is full
+
+This is resource isolation, not a security boundary: the worker runs as the
+same user, in the same working directory, with the same file system access
+the strands python_repl had.
+
+Configuration:
+    FRANKIE_PYTHON_WORKERS         maximum session workers (default 4)
+    FRANKIE_PYTHON_SPARE_WORKERS   warm workers kept ready for new sessions (default 1)
+    FRANKIE_PYTHON_IDLE_TIMEOUT    seconds before an idle worker is stopped (default 900)
+    FRANKIE_PYTHON_TIMEOUT         wall-clock seconds per call (default 120)
+    FRANKIE_PYTHON_CPU_SECONDS     CPU seconds per call (default 60)
+    FRANKIE_PYTHON_CPU_BUDGET      CPU seconds over a worker's lifetime (default 1800)
+    FRANKIE_PYTHON_MEMORY_MB       address space limit per worker (default 4096)
+    FRANKIE_PYTHON_PRELOAD         comma-separated modules imported at start-up
+"""
+
+import atexit
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from strands import tool
+
+from .session_context import current_session_id
+
+MAX_WORKERS = int(os.getenv("FRANKIE_PYTHON_WORKERS", "4"))
+SPARE_WORKERS = int(os.getenv("FRANKIE_PYTHON_SPARE_WORKERS", "1"))
+IDLE_TIMEOUT = float(os.getenv("FRANKIE_PYTHON_IDLE_TIMEOUT", "900"))
+CALL_TIMEOUT = float(os.getenv("FRANKIE_PYTHON_TIMEOUT", "120"))
+CPU_SECONDS = int(os.getenv("FRANKIE_PYTHON_CPU_SECONDS", "60"))
+CPU_BUDGET = int(os.getenv("FRANKIE_PYTHON_CPU_BUDGET", "1800"))
+MEMORY_LIMIT_BYTES = int(float(os.getenv("FRANKIE_PYTHON_MEMORY_MB", "4096")) * 1024 * 1024)
+MAX_OPEN_FILES = 1024
+MAX_OUTPUT_CHARS = 20000
+PRELOAD = [name.strip() for name in os.getenv(
+    "FRANKIE_PYTHON_PRELOAD",
+    "os,sys,re,json,math,random,time,datetime,itertools,functools,collections,pathlib,typing,"
+    "dataclasses,statistics,decimal,csv,textwrap,numpy,pandas",
+).split(",") if name.strip()]
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python_worker_process.py")
+
+
+class WorkerDiedError(Exception):
+    """The worker process exited or was killed while running a call"""
+
+
+@dataclass
+class ExecutionResult:
+    """Outcome of one python_repl call"""
+    output: str
+    error: Optional[str] = None
+    duration_s: float = 0.0
+    cpu_s: float = 0.0
+
+    def message(self) -> str:
+        parts = []
+        if self.output:
+            parts.append(self.output.rstrip("\n"))
+        if self.error:
+            parts.append(self.error.rstrip("\n"))
+        if not parts:
+            parts.append("(no output)")
+        return "\n".join(parts)
+
+
+class PythonWorker:
+    """One worker interpreter, talking JSON lines over its stdin/stdout"""
+
+    def __init__(self, preload: List[str] = PRELOAD):
+        self.session_id: Optional[str] = None
+        self.started_at = self.last_used = time.time()
+        self.calls = 0
+        self._replies: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._ready = False
+        self._lock = threading.Lock()
+        # The worker lowers its own hard limits before running anything, so user code can't raise them
+        config = json.dumps({
+            "preload": preload,
+            "limits": {"cpu_s": CPU_BUDGET, "memory_bytes": MEMORY_LIMIT_BYTES, "open_files": MAX_OPEN_FILES},
+        })
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", WORKER_SCRIPT, config],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1,
+            # Own process group: FRANKIE's Ctrl+C doesn't reach it and a kill takes its children too
+            start_new_session=os.name == "posix",
+        )
+        threading.Thread(target=self._read_replies, name=f"python-worker-{self.process.pid}", daemon=True).start()
+
+    def _read_replies(self) -> None:
+        for line in self.process.stdout:
+            try:
+                self._replies.put(json.loads(line))
+            except ValueError:
+                continue
+        self._replies.put(None)  # EOF: the worker exited
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def _next_reply(self, timeout: float) -> Dict[str, Any]:
+        try:
+            reply = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            raise TimeoutError(f"Execution took longer than {timeout:.0f}s - the worker was stopped")
+        if reply is None:
+            raise WorkerDiedError(self._exit_reason())
+        return reply
+
+    def _exit_reason(self) -> str:
+        try:
+            code = self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            return "The Python worker stopped responding"
+        if code < 0:
+            return f"The Python worker was killed by signal {-code} - it probably hit the memory or CPU limit"
+        return f"The Python worker exited with status {code}"
+
+    def execute(self, code: str, reset: bool = False, timeout: float = CALL_TIMEOUT) -> ExecutionResult:
+        with self._lock:
+            started = time.perf_counter()
+            if not self._ready:
+                # Preloading counts against the call's timeout; it only happens once per worker
+                self._next_reply(timeout)
+                self._ready = True
+            request = {"code": code, "reset": reset, "cpu_seconds": CPU_SECONDS, "max_output": MAX_OUTPUT_CHARS}
+            try:
+                self.process.stdin.write(json.dumps(request) + "\n")
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                raise WorkerDiedError(self._exit_reason())
+            reply = self._next_reply(max(1.0, timeout - (time.perf_counter() - started)))
+            self.calls += 1
+            self.last_used = time.time()
+            return ExecutionResult(reply.get("stdout", ""), reply.get("error"), reply.get("duration_s", 0.0),
+                                   reply.get("cpu_s", 0.0))
+
+    def kill(self) -> None:
+        if not self.alive:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+
+class PythonWorkerPool:
+    """Session-bound warm Python workers with idle recycling"""
+
+    def __init__(self, max_workers: int = MAX_WORKERS, spare_workers: int = SPARE_WORKERS,
+                 idle_timeout: float = IDLE_TIMEOUT):
+        self.max_workers = max(1, max_workers)
+        self.spare_limit = max(0, spare_workers)
+        self.idle_timeout = idle_timeout
+        self._workers: "OrderedDict[str, PythonWorker]" = OrderedDict()
+        self._spares: List[PythonWorker] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        self.started = 0
+        self.recycled = 0
+        self.restarts = 0
+
+    def _spawn(self) -> PythonWorker:
+        self.started += 1
+        return PythonWorker()
+
+    def prewarm(self) -> None:
+        """Start spare workers in the background (interpreter start-up and preloads run concurrently)"""
+        with self._lock:
+            missing = self.spare_limit - len(self._spares)
+            for _ in range(max(0, missing)):
+                self._spares.append(self._spawn())
+            self._start_reaper_locked()
+
+    def _start_reaper_locked(self) -> None:
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = threading.Thread(target=self._reap_loop, name="python-worker-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while not self._stop.wait(min(60.0, self.idle_timeout / 2)):
+            self.recycle_idle()
+
+    def worker_for(self, session_id: str) -> PythonWorker:
+        """The session's worker, taking a warm spare (or starting one) if it has none"""
+        with self._lock:
+            worker = self._workers.get(session_id)
+            if worker is not None and not worker.alive:
+                del self._workers[session_id]
+                worker = None
+            assigned = worker is None
+            if assigned:
+                spares = [spare for spare in self._spares if spare.alive]
+                worker = spares.pop(0) if spares else self._spawn()
+                self._spares = spares
+                worker.session_id = session_id
+                self._workers[session_id] = worker
+                self._make_room_locked()
+            # A spare's clock still reads its spawn time; without this the reaper could stop it before the call
+            worker.last_used = time.time()
+            self._workers.move_to_end(session_id)
+            self._start_reaper_locked()
+        if assigned:
+            # Replace the spare we just used, outside the caller's critical path
+            threading.Thread(target=self.prewarm, daemon=True).start()
+        return worker
+
+    def _make_room_locked(self) -> None:
+        for session_id, worker in list(self._workers.items()):
+            if len(self._workers) <= self.max_workers:
+                break
+            if worker.busy:
+                continue
+            del self._workers[session_id]
+            worker.kill()
+            self.recycled += 1
+
+    def execute(self, code: str, session_id: Optional[str] = None, reset_state: bool = False,
+                timeout: float = CALL_TIMEOUT) -> ExecutionResult:
+        session_id = session_id or current_session_id()
+        worker = self.worker_for(session_id)
+        try:
+            return worker.execute(code, reset_state, timeout)
+        except (TimeoutError, WorkerDiedError) as e:
+            self.release(session_id)
+            self.restarts += 1
+            return ExecutionResult("", f"{type(e).__name__}: {str(e)}. Variables from earlier calls are gone.")
+
+    def release(self, session_id: str) -> bool:
+        """Stop a session's worker (its state is discarded)"""
+        with self._lock:
+            worker = self._workers.pop(session_id, None)
+        if worker is None:
+            return False
+        worker.kill()
+        return True
+
+    def recycle_idle(self) -> int:
+        """Stop workers that have been idle longer than the idle timeout; stale spares are replaced"""
+        cutoff = time.time() - self.idle_timeout
+        with self._lock:
+            idle = [session_id for session_id, worker in self._workers.items()
+                    if not worker.busy and (worker.last_used < cutoff or not worker.alive)]
+            workers = [self._workers.pop(session_id) for session_id in idle]
+            stale_spares = [spare for spare in self._spares if spare.last_used < cutoff or not spare.alive]
+            self._spares = [spare for spare in self._spares if spare not in stale_spares]
+            self.recycled += len(workers) + len(stale_spares)
+        for worker in workers + stale_spares:
+            worker.kill()
+        if stale_spares:
+            self.prewarm()
+        return len(workers) + len(stale_spares)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": len(self._workers),
+                "busy": sum(1 for worker in self._workers.values() if worker.busy),
+                "spares": sum(1 for worker in self._spares if worker.alive),
+                "started": self.started,
+                "recycled": self.recycled,
+                "restarts": self.restarts,
+                "calls": sum(worker.calls for worker in self._workers.values()),
+            }
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        with self._lock:
+            workers = list(self._workers.values()) + self._spares
+            self._workers.clear()
+            self._spares = []
+        for worker in workers:
+            worker.kill()
+
+
+_pool: Optional[PythonWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> PythonWorkerPool:
+    """Process-wide worker pool, created on first use and stopped at exit"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PythonWorkerPool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def release_session_worker(session_id: str) -> None:
+    """Drop a closed session's worker, without starting a pool that doesn't exist yet"""
+    if _pool is not None:
+        _pool.release(session_id)
+
+
+@tool
+def python_repl(code: str, reset_state: bool = False) -> str:
+    """Execute Python code in a persistent Python worker for this session.
+
+    Variables, imports and function definitions are kept between calls, so build on earlier
+    results instead of re-running setup code. The value of a final expression is printed, as in
+    an interactive interpreter. Common modules (os, sys, re, json, math, collections, pathlib,
+    and numpy/pandas when installed) are already imported. input() is not available.
+
+    Args:
+        code: The Python code to execute
+        reset_state: Start from a fresh namespace before running the code
+
+    Returns:
+        Captured stdout/stderr, followed by the traceback if the code raised
+    """
+    return get_worker_pool().execute(code, reset_state=reset_state).message()
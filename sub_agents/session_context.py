@@ -0,0 +1,28 @@
+"""
+Current F.R.A.N.K.I.E. session
+
+The session manager sets the id of the session being served around each
+turn. Strands copies the caller's context into its worker threads, so
+sub-agents and their tools can key per-session state off `current_session_id()`.
+"""
+
+import contextvars
+from contextlib import contextmanager
+
+DEFAULT_SESSION_ID = "local"
+
+_current_session = contextvars.ContextVar("frankie_session_id", default=DEFAULT_SESSION_ID)
+
+
+def current_session_id() -> str:
+    return _current_session.get()
+
+
+@contextmanager
+def session_scope(session_id: str):
+    """Mark code running inside this block as belonging to a session"""
+    token = _current_session.set(session_id)
+    try:
+        yield session_id
+    finally:
+        _current_session.reset(token)
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+⚡ Shortcut Matcher - Compiled Intent Matching for Computer Shortcuts
+=====================================================================
+
+All shortcut phrases (direct shortcuts, natural-language variations, explicit
+routing phrases and the computer agent's macro keywords) are compiled once
+into a single Aho-Corasick automaton, so matching an input is one linear pass
+over the text no matter how many phrases are registered.
+
+Shared by `frankie.py` (auto-routing of shortcuts) and `use_computer_agent`
+(macro dispatch), so the phrase tables live in exactly one place.
+
+USER SHORTCUTS:
+Extra shortcuts can be declared in FRANKIE_SHORTCUTS_FILE
+(defaults to ~/.frankie/shortcuts.json):
+
+    {
+        "shortcuts": {
+            "play my music": ["tunes please"],
+            "join standup": {
+                "variations": ["standup time", "open the standup"],
+                "query": "Open Zoom and join my standup meeting",
+                "description": "Joins the daily standup call"
+            }
+        },
+        "explicit_routing": ["hey computer"]
+    }
+
+A list extends the variations of a shortcut; a new shortcut name is routed to
+the computer agent with its `query` (or its name when no query is given).
+
+BENCHMARK:
+    python -m sub_agents.shortcut_matcher --bench 5000
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .frankie_home import frankie_path
+
+logger = logging.getLogger(__name__)
+
+SHORTCUTS_FILE = os.getenv("FRANKIE_SHORTCUTS_FILE", frankie_path("shortcuts.json", create_parent=False))
+
+# Shortcuts that are auto-routed when typed exactly
+COMPUTER_SHORTCUTS = [
+    "start my day",
+    "start demo record",
+    "stop demo record",
+    "start focus mode",
+    "play my music",
+    "start presentation",
+    "research mode",
+]
+
+# Phrases that mean the user is routing explicitly - never intercept these
+EXPLICIT_ROUTING_PATTERNS = [
+    "send computer",
+    "use computer",
+    "route to computer",
+    "computer agent",
+    "send to computer",
+    "ask computer",
+]
+
+# Natural language variations that should be auto-routed
+NATURAL_VARIATIONS = {
+    "start my day": [
+        "start my morning setup",
+        "begin my day",
+        "morning setup",
+        "daily startup",
+        "morning routine",
+    ],
+    "start demo record": [
+        "start recording a demo",
+        "begin demo recording",
+        "record a demo",
+        "start demo capture",
+        "initiate demo recording",
+    ],
+    "stop demo record": [
+        "stop recording demo",
+        "end demo recording",
+        "stop demo capture",
+        "finish recording",
+    ],
+    "start focus mode": [
+        "enter focus mode",
+        "begin focus session",
+        "start focus session",
+        "focus mode please",
+    ],
+    "play my music": [
+        "open music",
+        "start music",
+        "launch music app",
+        "open the music app",
+        "play music",
+        "start playing music",
+        "music please",
+    ],
+}
+
+# Macro keywords recognised inside computer agent queries, in dispatch priority order
+COMPUTER_MACRO_COMMANDS = [
+    "start my day",
+    "start demo record",
+    "start focus mode",
+    "stop demo record",
+    "play my music",
+    "research mode",
+    "start presentation",
+    "setup_quip_for_research",
+]
+
+EXPLICIT = "explicit"
+VARIATION = "variation"
+COMMAND = "command"
+
+
+@dataclass(frozen=True)
+class PhraseRule:
+    """A single compiled phrase and the intent it maps to"""
+    phrase: str
+    kind: str
+    target: str
+    priority: int
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (Aho-Corasick automaton)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[PhraseRule]] = [[]]
+        self._built = False
+
+    def add(self, phrase: str, rule: PhraseRule) -> None:
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(rule)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first"""
+        queue = deque()
+        for next_state in self._goto[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[PhraseRule]:
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                yield from out[state]
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+
+@dataclass
+class IntentMatcher:
+    """Compiled shortcut / macro matcher shared across FRANKIE"""
+    shortcuts: List[str] = field(default_factory=list)
+    queries: Dict[str, str] = field(default_factory=dict)
+    descriptions: Dict[str, str] = field(default_factory=dict)
+    user_shortcuts: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._automaton = AhoCorasick()
+        self._exact: Dict[str, str] = {}
+        self._rule_count = 0
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _add(self, phrase: str, kind: str, target: str) -> None:
+        phrase = phrase.lower().strip()
+        if not phrase:
+            return
+        self._automaton.add(phrase, PhraseRule(phrase, kind, target, self._rule_count))
+        self._rule_count += 1
+
+    def add_shortcut(self, name: str, variations: Optional[List[str]] = None,
+                     query: Optional[str] = None, description: Optional[str] = None) -> None:
+        name = name.lower().strip()
+        if name not in self._exact:
+            self.shortcuts.append(name)
+            self._exact[name] = name
+        for variation in variations or []:
+            self._add(variation, VARIATION, name)
+        if query:
+            self.queries[name] = query
+        if description:
+            self.descriptions[name] = description
+
+    def add_explicit_routing(self, phrase: str) -> None:
+        self._add(phrase, EXPLICIT, "")
+
+    def add_command(self, keyword: str) -> None:
+        self._add(keyword, COMMAND, keyword.lower().strip())
+
+    def load_user_shortcuts(self, path: str) -> None:
+        """Merge shortcuts declared in a JSON config file"""
+        try:
+            with open(path, "r") as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring shortcuts file %s: %s", path, e)
+            return
+
+        for name, spec in config.get("shortcuts", {}).items():
+            if isinstance(spec, dict):
+                self.add_shortcut(name, spec.get("variations"), spec.get("query"), spec.get("description"))
+            else:
+                self.add_shortcut(name, list(spec))
+            if name.lower().strip() not in COMPUTER_SHORTCUTS:
+                self.user_shortcuts.append(name.lower().strip())
+        for phrase in config.get("explicit_routing", []):
+            self.add_explicit_routing(phrase)
+
+    def build(self) -> "IntentMatcher":
+        self._automaton.build()
+        return self
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def detect_shortcut(self, user_input: str) -> Optional[str]:
+        """
+        Return the shortcut for a user input, or None.
+
+        Explicit routing phrases always win so multi-agent requests are never intercepted;
+        otherwise an exact shortcut match, then the highest-priority natural variation.
+        """
+        input_lower = user_input.lower().strip()
+
+        best_variation = None
+        for rule in self._automaton.iter_matches(input_lower):
+            if rule.kind == EXPLICIT:
+                return None
+            if rule.kind == VARIATION and (best_variation is None or rule.priority < best_variation.priority):
+                best_variation = rule
+
+        if input_lower in self._exact:
+            return self._exact[input_lower]
+        return best_variation.target if best_variation else None
+
+    def match_command(self, query: str) -> Optional[str]:
+        """Return the highest-priority macro keyword contained in a computer agent query"""
+        best = None
+        for rule in self._automaton.iter_matches(query.lower()):
+            if rule.kind == COMMAND and (best is None or rule.priority < best.priority):
+                best = rule
+        return best.target if best else None
+
+    def query_for(self, shortcut: str) -> str:
+        """The request to send to the computer agent for a shortcut"""
+        return self.queries.get(shortcut, shortcut)
+
+    @property
+    def phrase_count(self) -> int:
+        return self._rule_count + len(self._exact)
+
+
+def build_intent_matcher(config_path: Optional[str] = SHORTCUTS_FILE) -> IntentMatcher:
+    """Compile the built-in phrase tables plus any user-defined shortcuts"""
+    matcher = IntentMatcher()
+    for phrase in EXPLICIT_ROUTING_PATTERNS:
+        matcher.add_explicit_routing(phrase)
+    for keyword in COMPUTER_MACRO_COMMANDS:
+        matcher.add_command(keyword)
+    for shortcut in COMPUTER_SHORTCUTS:
+        matcher.add_shortcut(shortcut, NATURAL_VARIATIONS.get(shortcut))
+    if config_path:
+        matcher.load_user_shortcuts(config_path)
+    return matcher.build()
+
+
+# Compiled once at import and shared by every caller
+INTENT_MATCHER = build_intent_matcher()
+
+
+def _linear_detect(user_input: str, phrases: List[Tuple[str, str]]) -> Optional[str]:
+    """The pre-compilation algorithm, kept for benchmarking only"""
+    input_lower = user_input.lower().strip()
+    for phrase, target in phrases:
+        if phrase in input_lower:
+            return target
+    return None
+
+
+def run_benchmark(phrase_count: int = 5000, iterations: int = 2000) -> None:
+    """Compare compiled matching against a linear scan over the same phrases"""
+    import random
+    import time
+
+    rng = random.Random(42)
+    words = ["open", "start", "stop", "my", "the", "app", "music", "demo", "focus", "record",
+             "daily", "report", "launch", "session", "window", "team", "sync", "notes"]
+    matcher = build_intent_matcher(config_path=None)
+    phrases = []
+    for index in range(phrase_count):
+        phrase = " ".join(rng.choice(words) for _ in range(rng.randint(2, 4))) + f" {index}"
+        phrases.append((phrase, f"shortcut-{index}"))
+        matcher.add_shortcut(f"shortcut-{index}", [phrase])
+
+    build_start = time.perf_counter()
+    matcher.build()
+    build_time = time.perf_counter() - build_start
+
+    inputs = [
+        "please start my day",
+        "can you open the music app for me",
+        "send computer start demo record, then use browser to go to wordle",
+        "summarize the latest aws news and create a diagram of it",
+        phrases[-1][0],
+    ]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in inputs:
+            matcher.detect_shortcut(text)
+    compiled = (time.perf_counter() - start) / (iterations * len(inputs))
+
+    start = time.perf_counter()
+    for _ in range(iterations // 10 or 1):
+        for text in inputs:
+            _linear_detect(text, phrases)
+    linear = (time.perf_counter() - start) / ((iterations // 10 or 1) * len(inputs))
+
+    print(f"⚡ Shortcut matcher benchmark ({matcher.phrase_count} phrases, "
+          f"{matcher._automaton.state_count} automaton states)")
+    print(f"  build time:        {build_time * 1000:8.2f} ms")
+    print(f"  compiled match:    {compiled * 1e6:8.2f} µs/input")
+    print(f"  linear scan:       {linear * 1e6:8.2f} µs/input")
+    print(f"  speedup:           {linear / compiled:8.1f}x")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shortcut matcher utilities")
+    parser.add_argument("--bench", type=int, metavar="PHRASES", help="Run the micro-benchmark")
+    parser.add_argument("text", nargs="*", help="Input to match")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark(args.bench)
+    elif args.text:
+        text = " ".join(args.text)
+        print(f"shortcut: {INTENT_MATCHER.detect_shortcut(text)}")
+        print(f"command:  {INTENT_MATCHER.match_command(text)}")
@@ -0,0 +1,244 @@
+"""
+F.R.A.N.K.I.E. request tracing
+
+A small span tracer in the spirit of OpenTelemetry. The current span lives in
+a contextvar; Strands copies context into its worker threads and runs each
+tool call in its own task, so spans opened inside sub-agents nest under the
+orchestrator tool call that triggered them.
+
+Spans come from three places:
+    • `TRACER.span(...)` blocks (requests, sub-agent dispatch, macros, sleeps)
+    • model and tool call events on the event bus (`attach_tracer()`)
+    • any span opened with no parent starts a new trace
+
+When a trace's root span ends, the trace is appended to
+FRANKIE_HOME/traces.jsonl as Chrome trace events. `export_chrome_trace()`
+writes a single trace as a file that chrome://tracing or Perfetto can open.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .event_bus import Event, EventBus, ModelCallEnded, ModelCallStarted, ToolEnded, ToolStarted
+from .frankie_home import frankie_path
+
+TRACING_ENABLED = os.getenv("FRANKIE_TRACING", "1") != "0"
+TRACE_FILE = os.getenv("FRANKIE_TRACE_FILE", frankie_path("traces.jsonl"))
+RECENT_TRACES = 20
+
+
+@dataclass
+class Span:
+    """One timed operation inside a trace"""
+    name: str
+    category: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float
+    end: Optional[float] = None
+    thread_id: int = field(default_factory=threading.get_ident)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.time()) - self.start
+
+    def to_chrome_event(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": int(self.start * 1_000_000),
+            "dur": int(self.duration * 1_000_000),
+            "pid": os.getpid(),
+            "tid": self.thread_id,
+            "args": {"span_id": self.span_id, "parent_id": self.parent_id, **self.attributes},
+        }
+
+
+@dataclass
+class Trace:
+    """All spans recorded for one request"""
+    trace_id: str
+    root: Span
+    spans: List[Span] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.root.duration
+
+    def children(self, span: Span) -> List[Span]:
+        return sorted((s for s in self.spans if s.parent_id == span.span_id), key=lambda s: s.start)
+
+    def self_time(self, span: Span) -> float:
+        """Time spent in the span itself, excluding children (clamped for concurrent children)"""
+        return max(0.0, span.duration - sum(child.duration for child in self.children(span)))
+
+    def breakdown(self) -> Dict[str, float]:
+        """Exclusive time per span category, e.g. how much went to model calls vs sleeps"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.category] = totals.get(span.category, 0.0) + self.self_time(span)
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "start": self.root.start,
+            "duration_s": round(self.duration, 4),
+            "traceEvents": [span.to_chrome_event() for span in self.spans],
+        }
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("frankie_span", default=None)
+
+
+class Tracer:
+    """Collects spans into traces and exports finished traces"""
+
+    def __init__(self, trace_file: Optional[str] = TRACE_FILE, enabled: bool = TRACING_ENABLED):
+        self.trace_file = trace_file
+        self.enabled = enabled
+        self.recent: "deque[Trace]" = deque(maxlen=RECENT_TRACES)
+        self._active: Dict[str, Trace] = {}
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, category: str, make_current: bool = True, **attributes) -> Optional[Span]:
+        """Open a span under the current one and make it current; pair with end_span()"""
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            category=category,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex[:16],
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+        with self._lock:
+            trace = self._active.get(span.trace_id)
+            if trace is None:
+                trace = self._active[span.trace_id] = Trace(span.trace_id, span)
+            trace.spans.append(span)
+        if make_current:
+            _current_span.set(span)
+        return span
+
+    def end_span(self, span: Optional[Span], restore_parent: bool = True, **attributes) -> None:
+        """Close a span and restore its parent as the current span"""
+        if span is None:
+            return
+        span.end = time.time()
+        span.attributes.update(attributes)
+        with self._lock:
+            trace = self._active.get(span.trace_id)
+            parent = next((s for s in trace.spans if s.span_id == span.parent_id), None) if trace else None
+            finished = trace if trace is not None and trace.root is span else None
+            if finished:
+                del self._active[span.trace_id]
+                self.recent.append(finished)
+        if restore_parent:
+            _current_span.set(parent)
+        if finished:
+            self._export(finished)
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes):
+        """Time a block of code as a span"""
+        span = self.start_span(name, category, make_current=False, **attributes)
+        token = _current_span.set(span) if span is not None else None
+        try:
+            yield span
+        except BaseException as e:
+            if span is not None:
+                span.attributes["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.end_span(span, restore_parent=False)
+            if token is not None:
+                _current_span.reset(token)
+
+    def last_trace(self) -> Optional[Trace]:
+        return self.recent[-1] if self.recent else None
+
+    def _export(self, trace: Trace) -> None:
+        if not self.trace_file:
+            return
+        try:
+            with open(self.trace_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trace.to_record(), ensure_ascii=False, default=str) + "\n")
+        except OSError:
+            pass
+
+
+TRACER = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def export_chrome_trace(trace: Trace, path: Optional[str] = None) -> str:
+    """Write one trace in Chrome trace format (chrome://tracing, ui.perfetto.dev)"""
+    path = path or frankie_path("traces", f"trace-{trace.trace_id}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace.to_record()["traceEvents"], "displayTimeUnit": "ms"}, f, default=str)
+    return path
+
+
+class BusTracer:
+    """Turns model-call and tool-call events from the event bus into spans
+
+    Listeners run on the publishing thread, inside the hook's context, so these
+    spans nest under whatever span is current there, as if opened inline.
+    """
+
+    def __init__(self, tracer: Tracer = TRACER):
+        self.tracer = tracer
+        self._model_spans: Dict[int, Span] = {}
+        self._tool_spans: Dict[str, Span] = {}
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, ModelCallStarted):
+            span = self.tracer.start_span(f"model {event.agent}", "model", agent=event.agent)
+            if span is not None:
+                self._model_spans[event.agent_id] = span
+        elif isinstance(event, ModelCallEnded):
+            attributes = {}
+            if event.stop_reason is not None:
+                attributes["stop_reason"] = event.stop_reason
+            if event.error is not None:
+                attributes["error"] = event.error
+            self.tracer.end_span(self._model_spans.pop(event.agent_id, None), **attributes)
+        elif isinstance(event, ToolStarted):
+            span = self.tracer.start_span(f"tool {event.tool}", "tool", agent=event.agent, tool=event.tool)
+            if span is not None:
+                self._tool_spans[event.tool_use_id] = span
+        elif isinstance(event, ToolEnded):
+            attributes = {"status": event.status}
+            if event.error is not None:
+                attributes["error"] = event.error
+            self.tracer.end_span(self._tool_spans.pop(event.tool_use_id, None), **attributes)
+
+
+_attached = False
+
+
+def attach_tracer(bus: EventBus, tracer: Tracer = TRACER) -> None:
+    """Trace every agent's model and tool calls published on `bus` (once per process)"""
+    global _attached
+    if not _attached:
+        _attached = True
+        bus.add_listener(BusTracer(tracer), ModelCallStarted, ModelCallEnded, ToolStarted, ToolEnded)
@@ -0,0 +1,203 @@
+"""
+Token usage helpers for F.R.A.N.K.I.E. agents
+
+Extracts per-invocation token usage from Strands agent results, so callers
+can report what a single request cost even when the agent is long-lived.
+
+Every agent invocation (latency, input/output tokens, estimated thinking
+tokens, cache reads/writes and estimated cost) published on the event bus is
+recorded in a local SQLite store, `UsageStore`, which aggregates per agent,
+per session and per day for the CLI `stats` command.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+from .event_bus import EventBus, TurnEnded
+from .frankie_home import frankie_path
+from .session_context import current_session_id
+
+USAGE_FIELDS = {
+    "inputTokens": "input_tokens",
+    "outputTokens": "output_tokens",
+    "totalTokens": "total_tokens",
+    "cacheReadInputTokens": "cache_read_tokens",
+    "cacheWriteInputTokens": "cache_write_tokens",
+}
+
+USAGE_DB = os.getenv("FRANKIE_USAGE_DB", frankie_path("usage.sqlite3"))
+
+# USD per million tokens: (input, output, cache read, cache write); thinking is billed as output
+MODEL_PRICING = {
+    "claude-sonnet-4": (3.00, 15.00, 0.30, 3.75),
+    "claude-3-7-sonnet": (3.00, 15.00, 0.30, 3.75),
+    "claude-3-5-haiku": (0.80, 4.00, 0.08, 1.00),
+    "claude-haiku-4-5": (1.00, 5.00, 0.10, 1.25),
+    "claude-opus-4": (15.00, 75.00, 1.50, 18.75),
+}
+
+
+def usage_from_result(result) -> Dict[str, int]:
+    """Return the token usage of the invocation that produced an AgentResult (or a SubAgentResult)"""
+    usage = getattr(result, "usage", None)
+    if isinstance(usage, dict):
+        return dict(usage)
+
+    metrics = getattr(result, "metrics", None)
+    if metrics is None:
+        return {}
+
+    invocation = getattr(metrics, "latest_agent_invocation", None)
+    usage = invocation.usage if invocation is not None else getattr(metrics, "accumulated_usage", {})
+    return {name: int(usage.get(key, 0)) for key, name in USAGE_FIELDS.items()}
+
+
+def estimate_cost(model_id: str, usage: Dict[str, int]) -> float:
+    """Estimated USD cost of one invocation; 0 for models without a known price"""
+    prices = next((price for name, price in MODEL_PRICING.items() if name in (model_id or "")), None)
+    if prices is None:
+        return 0.0
+    input_price, output_price, cache_read_price, cache_write_price = prices
+    return (
+        usage.get("input_tokens", 0) * input_price
+        + usage.get("output_tokens", 0) * output_price
+        + usage.get("cache_read_tokens", 0) * cache_read_price
+        + usage.get("cache_write_tokens", 0) * cache_write_price
+    ) / 1_000_000
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class UsageStore:
+    """SQLite store of agent invocations, safe to share between threads and processes"""
+
+    GROUPINGS = {"agent": "agent", "session": "session_id", "day": "day", "model": "model_id"}
+
+    def __init__(self, path: str = USAGE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS invocations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                day TEXT NOT NULL,
+                session_id TEXT,
+                agent TEXT NOT NULL,
+                model_id TEXT,
+                status TEXT,
+                latency_s REAL,
+                input_tokens INTEGER DEFAULT 0,
+                output_tokens INTEGER DEFAULT 0,
+                thinking_tokens INTEGER DEFAULT 0,
+                cache_read_tokens INTEGER DEFAULT 0,
+                cache_write_tokens INTEGER DEFAULT 0,
+                cost_usd REAL DEFAULT 0
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS invocations_day ON invocations (day, agent)")
+        self._conn.commit()
+
+    def record(self, agent: str, latency_s: float, usage: Dict[str, int], model_id: str = "",
+               thinking_tokens: int = 0, status: str = "success", session_id: Optional[str] = None) -> None:
+        now = time.time()
+        row = (
+            now, date.fromtimestamp(now).isoformat(), session_id or current_session_id(), agent, model_id, status,
+            latency_s, usage.get("input_tokens", 0), usage.get("output_tokens", 0), thinking_tokens,
+            usage.get("cache_read_tokens", 0), usage.get("cache_write_tokens", 0), estimate_cost(model_id, usage),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO invocations (ts, day, session_id, agent, model_id, status, latency_s, input_tokens, "
+                "output_tokens, thinking_tokens, cache_read_tokens, cache_write_tokens, cost_usd) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._conn.commit()
+
+    def summary(self, by: str = "agent", since_days: Optional[int] = None) -> List[Dict]:
+        """Per-group call counts, p50/p95 latency, token totals and cost"""
+        column = self.GROUPINGS[by]
+        query = (f"SELECT {column}, latency_s, input_tokens, output_tokens, thinking_tokens, cache_read_tokens, "
+                 f"cache_write_tokens, cost_usd FROM invocations")
+        params = ()
+        if since_days is not None:
+            query += " WHERE ts >= ?"
+            params = (time.time() - since_days * 86400,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        groups: Dict[str, List[tuple]] = {}
+        for row in rows:
+            groups.setdefault(row[0] or "-", []).append(row[1:])
+
+        summary = []
+        for key, group in groups.items():
+            latencies = [row[0] or 0.0 for row in group]
+            prompt_tokens = sum(row[1] + row[4] + row[5] for row in group)
+            summary.append({
+                by: key,
+                "calls": len(group),
+                "p50_latency_s": percentile(latencies, 50),
+                "p95_latency_s": percentile(latencies, 95),
+                "input_tokens": sum(row[1] for row in group),
+                "output_tokens": sum(row[2] for row in group),
+                "thinking_tokens": sum(row[3] for row in group),
+                "cache_read_tokens": sum(row[4] for row in group),
+                "cache_write_tokens": sum(row[5] for row in group),
+                "cache_hit_rate": sum(row[4] for row in group) / prompt_tokens if prompt_tokens else 0.0,
+                "cost_usd": sum(row[6] for row in group),
+            })
+        return sorted(summary, key=lambda item: item["cost_usd"], reverse=True)
+
+
+_usage_store: Optional[UsageStore] = None
+_usage_store_lock = threading.Lock()
+
+
+def get_usage_store() -> UsageStore:
+    """Process-wide usage store, opened on first use"""
+    global _usage_store
+    with _usage_store_lock:
+        if _usage_store is None:
+            _usage_store = UsageStore()
+        return _usage_store
+
+
+def reasoning_chars(message) -> int:
+    chars = 0
+    for block in message.get("content", []):
+        reasoning = block.get("reasoningContent", {})
+        chars += len(reasoning.get("reasoningText", {}).get("text", ""))
+    return chars
+
+
+def record_turn(event: TurnEnded, store: Optional[UsageStore] = None) -> None:
+    """Event bus listener: store one finished agent invocation"""
+    try:
+        (store or get_usage_store()).record(
+            event.agent, event.duration_s, event.usage, event.model_id,
+            event.thinking_tokens, status="success" if event.ok else "error",
+        )
+    except sqlite3.Error:
+        pass
+
+
+_attached = False
+
+
+def attach_usage_recorder(bus: EventBus) -> None:
+    """Record every agent turn published on `bus` in the usage store (once per process)"""
+    global _attached
+    if not _attached:
+        _attached = True
+        bus.add_listener(record_turn, TurnEnded)
@@ -2,10 +2,17 @@
 import os
 import logging
 from strands import tool
-from botocore.config import Config
 from strands import Agent
-from strands.models import BedrockModel
 from strands_tools import use_computer
+from .shortcut_matcher import INTENT_MATCHER
+from .agent_result import SubAgentResult
+from .output_store import fetch_tool_output
+from .tracing import TRACER
+from .agent_hooks import agent_hooks
+from .budget_policy import BUDGET_POLICY
+from .model_factory import build_model
+from .model_tiers import tiered_model
+from .event_bus import macro_scope, report_status
 import os, time
 # from strands_agents_builder.utils.kb_utils import load_system_prompt, store_conversation_in_kb
 
@@ -15,21 +22,8 @@ logging.basicConfig(
     format='\033[90m%(asctime)s - %(name)s - %(levelname)s - %(message)s\033[0m',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
-model = BedrockModel(
-    model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", max_tokens=65536, # max 65536 ---> suggested
-    boto_client_config=Config(
-        read_timeout=900,
-        connect_timeout=900,
-        retries=dict(max_attempts=3, mode="adaptive"),
-    ),
-    additional_request_fields={
-        "anthropic_beta": ["interleaved-thinking-2025-05-14", "computer-use-2025-01-24"],  # Enable computer use beta
-        "thinking": {
-            "type": os.getenv("STRANDS_THINKING_TYPE", "enabled"),
-            "budget_tokens": int(os.getenv("STRANDS_BUDGET_TOKENS", "2048")),
-        },
-    },
-)
+# Default model for interactive use; tool calls size the thinking budget per request
+model = build_model("computer")
 knowledge_base_id = os.getenv("STRANDS_KNOWLEDGE_BASE_ID")
 
 system_prompt = """
@@ -70,7 +64,7 @@ Remember: Your primary task is to use the OCR-detected text and coordinates. Any
 """
 
 @tool
-def use_computer_agent(query: str) -> str:
+def use_computer_agent(query: str) -> SubAgentResult:
     """
     Process and execute computer automation tasks using screen analysis and interaction.
     
@@ -85,51 +79,27 @@ def use_computer_agent(query: str) -> str:
             - Screenshot interpretation
             
     Returns:
-        A detailed response describing the executed actions, results, and any relevant
-        extracted information. In case of errors, returns explanatory error messages
-        with suggested alternatives.
+        A summary of the executed actions, results, and any relevant extracted
+        information, with a reference to the full output. In case of errors,
+        returns explanatory error messages with suggested alternatives.
     """
+    started = time.perf_counter()
     # Format the query for the computer use agent with clear instructions
     os.environ["BYPASS_TOOL_CONSENT"] = "true" 
+    decision = BUDGET_POLICY.decide("computer", query)
     computer_agent = Agent(
             system_prompt=system_prompt,
-            model=model,
-            tools=[use_computer],
+            model=tiered_model("computer", build_model("computer", decision), decision=decision),
+            tools=[use_computer, fetch_tool_output],
+            hooks=agent_hooks("computer", decision),
         )
-    if "start my day" in query.lower():
-        setup(computer_agent)
-        # After setup completes, continue with iTerm automation
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n\n✅ Your daily setup is complete! We have opened the strands-agents-interest channel on Slack, opened your daily to-dos, opened VS Code, and started your security login. You just need to press your yubikey now! \n\n Would you like your work music? (type play my music)\n"        # Don't return here - let the query continue to be processed by the agent below
-    if "start demo record" in query.lower():
-        print("entered dem record if statement")
-        setup_recording(computer_agent)
-        # Return immediately after setting up recording - no need to continue processing
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Screen recording has been started successfully! Recording is now active.\n\n🎬 Screen Studio is now recording your screen.\n📹 Recording setup completed - you can proceed with your demo.\n\n⚠️  Note: The screen is recording and no further computer assistance is needed right now.\n{'='*50}"
-    if "start focus mode" in query.lower():
-        focus_mode(computer_agent)
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Focus mode has been entered successfully! Note: Focus is entered, no further computer assistance is needed right now.\n{'='*50}"
-    if "stop demo record" in query.lower():
-        print("entered demo stop is statement")
-        stop_recording(computer_agent)
-        # Return immediately after stopping recording - no need to continue processing
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Screen recording has been stopped successfully! Recording is now inactive.\n\n🎬 Screen Studio recording has been stopped.\n📹 Recording stop completed.\n\n⚠️  Note: Recording has ended and no further computer assistance is needed right now.\n{'='*50}"
-    if "play my music" in query.lower():
-        print("entered play my music if statement")
-        open_music(computer_agent)
-        # Return immediately after opening music - no need to continue processing
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Music app has been opened successfully! 🎵\n\n🎶 Music app is now open and playing your Terminal Tunes Playlist!\n🎧 Music setup completed.\n\n⚠️  Note: Music is ready and no further computer assistance is needed right now.\n{'='*50}"
-    if "research mode" in query.lower():
-        print("entered research mode if statement")
-        set_research_mode(computer_agent)
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Research mode has been activated successfully! 🔬\n\n🖥️ iTerm terminal is now ready for command-line research.\n🌐 Chromium browser is prepared for web research.\n📊 Research environment setup completed!\n\n⚠️  Note: Research mode is active. You can now begin your research topic.\n{'='*50}"
-    if "start presentation" in query.lower():
-        print("entered start presentation if statement")
-        start_presentation(computer_agent)
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Presentation has been started successfully! 📽️\n\n🎯 PowerPoint is now open and running in presentation mode.\n📊 Presentation setup completed - you're ready to present!\n\n⚠️  Note: Presentation is running and no further computer assistance is needed right now.\n{'='*50}"
-    if "setup_quip_for_research" in query.lower():
-        print("entered setup quip for research if statement")
-        setup_quip_for_research(computer_agent)
-        return "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Quip document setup completed successfully! 📝\n\n📄 New Quip document has been created and is ready for research input.\n🖋️ Document is open and cursor is positioned for typing.\n📋 Research documentation environment is ready!\n\n⚠️  Note: Quip is set up and ready for research content input.\n{'='*50}"
+    # Pre-recorded macros run directly, without a model turn
+    command = INTENT_MATCHER.match_command(query)
+    if command:
+        macro, macro_response = MACRO_COMMANDS[command]
+        with TRACER.span(f"macro {command}", "macro"), macro_scope(command):
+            macro(computer_agent)
+        return SubAgentResult.from_response("computer", macro_response, started)
 
     formatted_query = f"""
     Please help me with the following computer automation task. Remember to:
@@ -142,47 +112,48 @@ def use_computer_agent(query: str) -> str:
     """
     
     try:
-        print("Executing Computer Automation Task")
+        report_status("💻 Computer Agent: executing computer automation task")
         # Create the computer use agent with use_computer capability
         
         agent_response = computer_agent(formatted_query)
-        text_response = str(agent_response)
         #if start_my_day==True:
         
-
-        if len(text_response) > 0:
-            return f"\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n{text_response}\n{'='*50}"
-
-        return "\033[1;31m❌ Error: No response received from the computer automation task\033[0m"
+        return SubAgentResult.from_response("computer", agent_response, started)
     except Exception as e:
         # Return specific error message for computer automation processing
-        return f"Computer Automation Error: {str(e)}\nPlease check your request and try again."
+        return SubAgentResult.error("computer", f"Computer Automation Error: {str(e)}\nPlease check your request and try again.", started)
 
     
+def _sleep(seconds):
+    """Pause between macro steps; recorded as a span so waits show up in request traces"""
+    with TRACER.span("sleep", "sleep", seconds=seconds):
+        time.sleep(seconds)
+
+
 def focus_mode(agent):
     agent.tool.use_computer(action="move_mouse", x=1344, y=17) #contol center
-    time.sleep(.3)
+    _sleep(.3)
     # agent.tool.use_computer(action="click", x=1360, y=18) 
     agent.tool.use_computer(action="click", x=1344, y=17)
-    time.sleep(.5)
+    _sleep(.5)
     agent.tool.use_computer(action="move_mouse",x=1386, y=123) #do not disturb
     agent.tool.use_computer(action="click",x=1386, y=123) #do not disturb
-    time.sleep(.3)
+    _sleep(.3)
     agent.tool.use_computer(action="open_app", app_name="clock") 
-    time.sleep(1) 
+    _sleep(1) 
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+right")
-    time.sleep(.3)
+    _sleep(.3)
     agent.tool.use_computer(action="click",x=1270, y=62) #timer
-    time.sleep(.3)    
+    _sleep(.3)    
     # agent.tool.use_computer(action="click",x=1485, y=64) #add timer
     agent.tool.use_computer(action="move_mouse",x=1129, y=344) #number
-    time.sleep(.3)   
+    _sleep(.3)   
     agent.tool.use_computer(action="click",x=1129, y=344) #number
-    time.sleep(1)   
+    _sleep(1)   
     agent.tool.use_computer(action="click",x=1129, y=344) #number 
-    time.sleep(1)   
+    _sleep(1)   
     agent.tool.use_computer(action="type", text="25")
-    time.sleep(.3)    
+    _sleep(.3)    
     agent.tool.use_computer(action="click",x=1218, y=633) #start
 
 # def fill_excel_sheet
@@ -192,17 +163,17 @@ def open_music(agent):
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt", app_name="Music")
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+right", app_name="Music")    
 
-    time.sleep(2)
+    _sleep(2)
 
     agent.tool.use_computer(action="scroll", x=600, y=156, app_name="Music", scroll_amount="100", scroll_direction="down")
 
 
     agent.tool.use_computer(action="move_mouse", x=604, y=633, app_name="Music")
-    time.sleep(2)
+    _sleep(2)
     agent.tool.use_computer(action="click", x=604, y=633, app_name="Music") 
 
     agent.tool.use_computer(action="move_mouse", x=1126, y=381, app_name="Music")
-    time.sleep(2)
+    _sleep(2)
     agent.tool.use_computer(action="click", x=1126, y=381, app_name="Music") 
 
 
@@ -211,11 +182,11 @@ def start_presentation(agent):
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt", app_name="PowerPoint")
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+up", app_name="PowerPoint")  
 
-    time.sleep(1)
+    _sleep(1)
 
     agent.tool.use_computer(action="click", click_type="double", x=247, y=375, app_name="PowerPoint")
 
-    time.sleep(2)
+    _sleep(2)
 
     agent.tool.use_computer(action="hotkey", hotkey_str="command+shift+enter", app_name="PowerPoint")  
  
@@ -243,42 +214,42 @@ def setup(agent):
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+right")
 
     agent.tool.use_computer(action="move_mouse", x=860, y=136)
-    time.sleep(2)
+    _sleep(2)
     agent.tool.use_computer(action="click", x=860, y=136)
 
-    time.sleep(5)
+    _sleep(5)
     agent.tool.use_computer(action="open_app", app_name="Slack")
-    time.sleep(1)
+    _sleep(1)
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+left")
 
     agent.tool.use_computer(action="hotkey", hotkey_str="command+g") 
-    time.sleep(1)
+    _sleep(1)
     agent.tool.use_computer(action="type", text="stran")
     agent.tool.use_computer(action="click", x=225, y=120)
 
-    time.sleep(1)
+    _sleep(1)
 
     
 # VS Code Setup
 
     agent.tool.use_computer(action="open_app", app_name="Visual Studio Code")
-    time.sleep(1)
+    _sleep(1)
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+command+f")
 
-    time.sleep(1)
+    _sleep(1)
  
 # mwinit setup
 
     agent.tool.use_computer(action="open_app", app_name="iTerm")
 
-    time.sleep(2)
+    _sleep(2)
 
     agent.tool.use_computer(action="click", x=135, y=18, app_name="iTerm")
     agent.tool.use_computer(action="click", x=154, y=54, app_name="iTerm")
-    time.sleep(3)
+    _sleep(3)
 
     agent.tool.use_computer(action="open_app", app_name="iTerm")
-    time.sleep(1)
+    _sleep(1)
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt")
     agent.tool.use_computer(action="hotkey", hotkey_str="ctrl+alt+left")
     # agent.tool.use_computer(action="key_press", key="m", app_name="iTerm")
@@ -287,18 +258,18 @@ def setup(agent):
 
 
     agent.tool.use_computer(action="hotkey", hotkey_str="alt+ctrl", app_name="iTerm")
-    time.sleep(1)
+    _sleep(1)
 
 
     agent.tool.use_computer(action="type", text="mwinit", app_name="iTerm")
-    time.sleep(3)
+    _sleep(3)
 
 
     agent.tool.use_computer(action="key_press", key="enter", app_name="iTerm")
-    time.sleep(5)
+    _sleep(5)
 
     agent.tool.use_computer(action="type", text="04132004", app_name="iTerm")
-    time.sleep(2)
+    _sleep(2)
 
     agent.tool.use_computer(action="key_press", key="enter", app_name="iTerm")
  
@@ -309,7 +280,7 @@ def setup_recording(agent):
     agent.tool.use_computer(action="hotkey", app_name="Screen Studio", hotkey_str="option+command")
     agent.tool.use_computer(action="hotkey", app_name="Screen Studio", hotkey_str="option+command+3")
     # interactive_agent.tool.use_computer(action="hotkey", app_name="Screen Studio", hotkey_str="ctrl+command+shift+s")
-    time.sleep(1)
+    _sleep(1)
     agent.tool.use_computer(action="click", x=747, y=547) 
     
     # interactive_agent.tool.use_computer(action="click", app_name="clock", x=1028, y=914)
@@ -325,6 +296,43 @@ def set_research_mode(agent):
     agent.tool.use_computer(action="hotkey", app_name="Chromium", hotkey_str="alt+ctrl")
     agent.tool.use_computer(action="hotkey", app_name="Chromium", hotkey_str="alt+ctrl+left")
 
+
+# Macro keyword -> (macro, canned response); keywords are matched by the shared intent matcher
+MACRO_COMMANDS = {
+    "start my day": (
+        setup,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n\n✅ Your daily setup is complete! We have opened the strands-agents-interest channel on Slack, opened your daily to-dos, opened VS Code, and started your security login. You just need to press your yubikey now! \n\n Would you like your work music? (type play my music)\n",
+    ),
+    "start demo record": (
+        setup_recording,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Screen recording has been started successfully! Recording is now active.\n\n🎬 Screen Studio is now recording your screen.\n📹 Recording setup completed - you can proceed with your demo.\n\n⚠️  Note: The screen is recording and no further computer assistance is needed right now.\n{'='*50}",
+    ),
+    "start focus mode": (
+        focus_mode,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Focus mode has been entered successfully! Note: Focus is entered, no further computer assistance is needed right now.\n{'='*50}",
+    ),
+    "stop demo record": (
+        stop_recording,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Screen recording has been stopped successfully! Recording is now inactive.\n\n🎬 Screen Studio recording has been stopped.\n📹 Recording stop completed.\n\n⚠️  Note: Recording has ended and no further computer assistance is needed right now.\n{'='*50}",
+    ),
+    "play my music": (
+        open_music,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Music app has been opened successfully! 🎵\n\n🎶 Music app is now open and playing your Terminal Tunes Playlist!\n🎧 Music setup completed.\n\n⚠️  Note: Music is ready and no further computer assistance is needed right now.\n{'='*50}",
+    ),
+    "research mode": (
+        set_research_mode,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Research mode has been activated successfully! 🔬\n\n🖥️ iTerm terminal is now ready for command-line research.\n🌐 Chromium browser is prepared for web research.\n📊 Research environment setup completed!\n\n⚠️  Note: Research mode is active. You can now begin your research topic.\n{'='*50}",
+    ),
+    "start presentation": (
+        start_presentation,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Presentation has been started successfully! 📽️\n\n🎯 PowerPoint is now open and running in presentation mode.\n📊 Presentation setup completed - you're ready to present!\n\n⚠️  Note: Presentation is running and no further computer assistance is needed right now.\n{'='*50}",
+    ),
+    "setup_quip_for_research": (
+        setup_quip_for_research,
+        "\n💻 COMPUTER AGENT RESPONSE 💻\n{'='*50}\n✅ Quip document setup completed successfully! 📝\n\n📄 New Quip document has been created and is ready for research input.\n🖋️ Document is open and cursor is positioned for typing.\n📋 Research documentation environment is ready!\n\n⚠️  Note: Quip is set up and ready for research content input.\n{'='*50}",
+    ),
+}
+
 if __name__ == "__main__":
     print(f"\n\033[1;36m🌟 Computer Automation Agent 🌟\033\n")
     print("Available commands:")